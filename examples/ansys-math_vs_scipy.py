@@ -117,23 +117,10 @@ print("\nElapsed time to solve this problem : ", pymath_elapsed_time)
 #
 # Accuracy : :math:`\frac{||(K-\lambda.M).\phi||_2}{||K.\phi||_2}`
 #
-pymath_acc = np.empty(nev)
+freqs = ev.asarray()
+pymath_acc = mm.eig_residuals(k, M, freqs, A)  # computed within MAPDL
 
-for i in range(nev):
-    f = ev[i]  # Eigenfrequency (Hz)
-    omega = 2 * np.pi * f  # omega = 2.pi.Frequency
-    lam = omega**2  # lambda = omega^2
-
-    phi = A[i]  # i-th eigenshape
-    kphi = k.dot(phi)  # K.Phi
-    mphi = M.dot(phi)  # M.Phi
-
-    kphi_nrm = kphi.norm()  # Normalization scalar value
-
-    mphi *= lam  # (K-\lambda.M).Phi
-    kphi -= mphi
-
-    pymath_acc[i] = kphi.norm() / kphi_nrm  # compute the residual
+for i, f in enumerate(freqs):
     print(f"[{i}] : Freq = {f:8.2f} Hz\t Residual = {pymath_acc[i]:.5}")
 
 
@@ -0,0 +1,105 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+.. _ref_pymath_distributed_matrix:
+
+Distribute a dense matrix over several MAPDL instances
+------------------------------------------------------
+This example distributes the column blocks of a dense snapshot matrix over
+a pool of local MAPDL instances, and measures how the Gram product and the
+orthonormalization of the snapshots scale with the number of instances.
+
+"""
+
+###############################################################################
+# Perform required imports and start the MAPDL instances
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Perform required imports.
+
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from ansys.math.core import distributed
+from ansys.math.core.pool import AnsMathPool
+
+# Start four local MAPDL instances.
+pool = AnsMathPool(4)
+
+###############################################################################
+# Time the distributed operations
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Create a random snapshot matrix over the first instances of the pool, and
+# time its Gram product and its orthonormalization.
+
+nrow, ncol = 20000, 400
+counts = [1, 2, 4]
+timings = {"Gram product": [], "Orthonormalization": []}
+
+for count in counts:
+    snapshots = distributed.rand(nrow, ncol, pool[:count])
+
+    t1 = time.time()
+    gram = snapshots.gram()
+    t2 = time.time()
+    snapshots.orthonormalize()
+    t3 = time.time()
+
+    timings["Gram product"].append(t2 - t1)
+    timings["Orthonormalization"].append(t3 - t2)
+    print(f"{snapshots}: Gram {t2 - t1:.2f} s, orthonormalization {t3 - t2:.2f} s")
+    snapshots.free()
+
+###############################################################################
+# Check the orthonormalization
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The Gram matrix of the orthonormalized snapshots is the identity.
+
+snapshots = distributed.rand(nrow, ncol, pool)
+snapshots.orthonormalize()
+print(np.abs(snapshots.gram() - np.eye(ncol)).max())
+snapshots.free()
+
+###############################################################################
+# Plot elapsed times
+# ~~~~~~~~~~~~~~~~~~
+# Plot the elapsed times against the number of instances.
+
+fig = plt.figure(figsize=(12, 10))
+ax = plt.axes()
+for label, values in timings.items():
+    ax.plot(counts, values, "o-", label=label)
+plt.title("Elapsed time of the distributed operations")
+plt.xlabel("Number of MAPDL instances")
+plt.ylabel("Elapsed time (s)")
+plt.xticks(counts)
+plt.legend()
+plt.show()
+
+###############################################################################
+# Stop the MAPDL instances
+# ~~~~~~~~~~~~~~~~~~~~~~~~
+# Stop the MAPDL instances of the pool.
+
+pool.close()
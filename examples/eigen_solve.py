@@ -155,45 +155,17 @@ print(res)
 
 ###############################################################################
 # Compute this residual for all eigenmodes
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Compute the residuals of all the eigenmodes at once. The products of the
+# matrices with all the eigenshapes and the norms are computed within MAPDL
+# in a single block of commands, and the residuals are returned as a NumPy
+# array.
 
-
-def get_res(i):
-    """Compute the residual for a given eigenmode."""
-    # Eigenfrequency (Hz)
-    f = ev[i]
-
-    # omega = 2.pi.Frequency
-    omega = 2 * np.pi * f
-
-    # lambda = omega^2
-    lam = omega * omega
-
-    # i-th eigenshape
-    phi = a[i]
-
-    # K.Phi
-    kphi = k.dot(phi)
-
-    # M.Phi
-    mphi = m.dot(phi)
-
-    # Normalize scalar value
-    kphinrm = kphi.norm()
-
-    # (K-\lambda.M).Phi
-    mphi *= lam
-    kphi -= mphi
-
-    # Return the residual
-    return kphi.norm() / kphinrm
-
-
-pymath_acc = np.zeros(nev)
+freqs = ev.asarray()
+pymath_acc = mm.eig_residuals(k, m, freqs, a)
 
 for i in range(nev):
-    f = ev[i]
-    pymath_acc[i] = get_res(i)
-    print(f"[{i}] : Freq = {f}\t - Residual = {pymath_acc[i]}")
+    print(f"[{i}] : Freq = {freqs[i]}\t - Residual = {pymath_acc[i]}")
 
 ###############################################################################
 # Plot accuracy of eigenresults
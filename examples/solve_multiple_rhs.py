@@ -0,0 +1,111 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+.. _ref_pymath_multiple_rhs:
+
+Use PyAnsys Math to solve several right-hand sides at once
+----------------------------------------------------------
+This example shows how to solve a linear system for many right-hand sides
+with a single back-substitution call, and compares it with a loop solving
+one right-hand side at a time.
+
+"""
+
+###############################################################################
+# Perform required imports and start PyAnsys
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Perform required imports.
+
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ansys.math.core.math as pymath
+
+# Start PyAnsys Math as a server.
+mm = pymath.AnsMath()
+
+###############################################################################
+# Factorize a dense matrix
+# ~~~~~~~~~~~~~~~~~~~~~~~~
+# Allocate a dense matrix in the MAPDL workspace and factorize it.
+
+mm._mapdl.clear()
+dim = 1000
+nrhs = 200
+a = mm.rand(dim, dim)
+solver = mm.factorize(a)
+
+###############################################################################
+# Generate the right-hand sides
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Generate the right-hand sides as the columns of a NumPy array.
+
+rhs = np.random.random((dim, nrhs))
+
+###############################################################################
+# Solve one right-hand side at a time
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Upload each right-hand side as a vector and solve it. Each solve creates
+# a vector to hold the solution.
+
+t1 = time.time()
+for i in range(nrhs):
+    b = mm.set_vec(rhs[:, i])
+    x = solver.solve(b)
+loop_time = time.time() - t1
+print(f"Elapsed time to solve {nrhs} right-hand sides one at a time: {loop_time} seconds")
+
+###############################################################################
+# Solve all right-hand sides at once
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Upload all right-hand sides as a dense matrix and solve them with a
+# single back-substitution call.
+
+t1 = time.time()
+x_all = solver.solve(rhs)
+block_time = time.time() - t1
+print(f"Elapsed time to solve {nrhs} right-hand sides at once: {block_time} seconds")
+print(x_all)
+
+###############################################################################
+# Plot elapsed times
+# ~~~~~~~~~~~~~~~~~~
+# Plot the elapsed times of both approaches.
+
+fig = plt.figure(figsize=(12, 10))
+ax = plt.axes()
+x = ["One at a time", "All at once"]
+y = [loop_time, block_time]
+plt.title(f"Elapsed time to solve {nrhs} right-hand sides")
+plt.ylabel("Elapsed time (s)")
+ax.bar(x, y, color="orange")
+plt.show()
+
+###############################################################################
+# Stop PyAnsys Math
+# ~~~~~~~~~~~~~~~~~
+# Stop PyAnsys Math.
+
+mm._mapdl.exit()
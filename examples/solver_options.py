@@ -0,0 +1,136 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+.. _ref_pymath_solver_options:
+
+Compare the factorization options of the sparse solvers
+-------------------------------------------------------
+This example benchmarks the factorization time and memory of the sparse
+solvers for each memory mode and reordering scheme on the stiffness matrices
+of models from the official verification manual.
+
+"""
+
+###############################################################################
+# Perform required imports and start PyAnsys
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Perform required imports.
+
+import time
+
+from ansys.mapdl.core.examples import vmfiles
+import matplotlib.pyplot as plt
+import numpy as np
+
+import ansys.math.core.math as pymath
+
+# Start PyAnsys Math as a server.
+mm = pymath.AnsMath()
+
+###############################################################################
+# Define the factorization options
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Define the solver options to compare. The ``DSP`` solver accepts both a
+# memory mode and a reordering scheme, while the ``DSS`` solver only accepts
+# a memory mode.
+
+options = {
+    "DSP": {"algo": "DSP"},
+    "DSP in-core": {"algo": "DSP", "memory": "INCORE"},
+    "DSP out-of-core": {"algo": "DSP", "memory": "OUTOFCORE"},
+    "DSP SEQORDER": {"algo": "DSP", "reorder": "SEQORDER"},
+    "DSP PARORDER": {"algo": "DSP", "reorder": "PARORDER"},
+    "DSS in-core": {"algo": "DSS", "memory": "INCORE"},
+    "DSS out-of-core": {"algo": "DSS", "memory": "OUTOFCORE"},
+}
+
+
+def solver_memory(solver):
+    """Return the memory in MB of a solver from the status of AnsMath objects."""
+    for line in mm._status.splitlines():
+        items = line.split()
+        if items and items[0] == solver.id:
+            return float(items[2])
+    return np.nan
+
+
+###############################################################################
+# Factorize the stiffness matrices
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Run each model to create its FULL file, extract the stiffness matrix, and
+# factorize it with each option. The symmetry of the matrix is only queried
+# once, when it is first factorized.
+
+models = ["vm152", "vm153", "vm154"]
+times = {name: [] for name in options}
+memory = {name: [] for name in options}
+
+for model in models:
+    mm._mapdl.clear()
+    mm._mapdl.input(vmfiles[model])
+    k = mm.stiff(fname=mm._mapdl.jobname + ".full")
+    print(f"{model}: {k.nrow} equations, symmetric: {k.sym()}")
+
+    for name, kwargs in options.items():
+        t1 = time.time()
+        solver = mm.factorize(k, inplace=False, cache=False, **kwargs)
+        times[name].append(time.time() - t1)
+        memory[name].append(solver_memory(solver))
+        solver._free()
+
+    mm.free()
+
+###############################################################################
+# Print the results
+# ~~~~~~~~~~~~~~~~~
+# Print the factorization time and memory of each option.
+
+for name in options:
+    print(f"{name:<16}", end="")
+    for model, t, mem in zip(models, times[name], memory[name]):
+        print(f"  {model}: {t:.3f} s, {mem:.3f} MB", end="")
+    print()
+
+###############################################################################
+# Plot the factorization times
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Plot the factorization time of each option for each model.
+
+fig = plt.figure(figsize=(12, 10))
+ax = plt.axes()
+width = 0.8 / len(options)
+for i, name in enumerate(options):
+    ax.bar(np.arange(len(models)) + i * width, times[name], width, label=name)
+ax.set_xticks(np.arange(len(models)) + 0.4 - width / 2)
+ax.set_xticklabels(models)
+plt.title("Elapsed time to factorize the stiffness matrix")
+plt.ylabel("Elapsed time (s)")
+plt.legend()
+plt.show()
+
+###############################################################################
+# Stop PyAnsys Math
+# ~~~~~~~~~~~~~~~~~
+# Stop PyAnsys Math.
+
+mm._mapdl.exit()
@@ -0,0 +1,381 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the distributed dense matrices of PyAnsys Math.
+
+The column blocks of a distributed matrix live on different MAPDL
+instances, so that a matrix too large for one instance can be stored and
+processed by a pool of instances.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from ansys.math.core.math import AnsMath, _column_norms, _run_batch, id_generator
+from ansys.math.core.pool import transfer
+
+
+class AnsDistributedMat:
+    """Provides a dense matrix whose column blocks live on several instances.
+
+    Each block is an :class:`AnsDenseMat <ansys.math.core.math.AnsDenseMat>`
+    of a different MAPDL instance. The operations run concurrently on all
+    the instances, and only the small results, such as the partial products
+    or the Gram blocks, are transferred to Python.
+
+    Parameters
+    ----------
+    blocks : sequence of AnsDenseMat
+        Column blocks of the matrix, in order. The blocks must have the same
+        number of rows and belong to different MAPDL instances.
+
+    Examples
+    --------
+    >>> from ansys.math.core import distributed
+    >>> from ansys.math.core.pool import AnsMathPool
+    >>> pool = AnsMathPool(4)
+    >>> snapshots = distributed.rand(100000, 20000, pool)
+    >>> snapshots
+    AnsMath distributed matrix (100000 x 20000) over 4 instances
+    >>> norms = snapshots.norms()
+
+    """
+
+    def __init__(self, blocks):
+        """Initiate a distributed dense matrix."""
+        self.blocks = list(blocks)
+        if not self.blocks:
+            raise ValueError("A distributed matrix must contain at least one block.")
+        if len({id(block._mapdl) for block in self.blocks}) != len(self.blocks):
+            raise ValueError("The blocks must belong to different MAPDL instances.")
+
+        shapes = [block.shape for block in self.blocks]
+        if len({nrow for nrow, _ in shapes}) != 1:
+            raise ValueError("The blocks must have the same number of rows.")
+        self._nrow = shapes[0][0]
+        self._offsets = np.cumsum([0] + [ncol for _, ncol in shapes])
+
+    def __repr__(self):
+        nrow, ncol = self.shape
+        return f"AnsMath distributed matrix ({nrow} x {ncol}) over {len(self.blocks)} instances"
+
+    @property
+    def nrow(self) -> int:
+        """Number of rows in the matrix."""
+        return self._nrow
+
+    @property
+    def ncol(self) -> int:
+        """Number of columns in the matrix."""
+        return int(self._offsets[-1])
+
+    @property
+    def shape(self) -> tuple:
+        """NumPy-like shape.
+
+        Tuple of (rows and columns).
+        """
+        return (self.nrow, self.ncol)
+
+    def asarray(self) -> np.ndarray:
+        """Return the matrix as a NumPy array.
+
+        Returns
+        -------
+        numpy.ndarray
+            NumPy array of the whole matrix.
+
+        """
+        return np.hstack(self._map(lambda block: block.asarray()))
+
+    def free(self):
+        """Delete the blocks within their MAPDL instances."""
+        for block in self.blocks:
+            block._mapdl.run(f"*FREE,{block.id}", mute=True)
+        self.blocks = []
+
+    def dot(self, vec) -> np.ndarray:
+        """Multiply the matrix by a vector.
+
+        Each instance multiplies its block by the matching segment of the
+        vector, and the partial products are summed in Python.
+
+        Parameters
+        ----------
+        vec : numpy.ndarray
+            Vector with one value per column of the matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product with one value per row of the matrix.
+
+        """
+        vec = np.asarray(vec, dtype=np.double)
+        if vec.shape != (self.ncol,):
+            raise ValueError(f"The vector must have {self.ncol} values.")
+
+        def partial(index):
+            block = self.blocks[index]
+            segment = vec[self._offsets[index] : self._offsets[index + 1]]
+            return _product(block, segment, trans=False)
+
+        return np.sum(self._map(partial, indices=True), axis=0)
+
+    def tdot(self, vec) -> np.ndarray:
+        """Multiply the transpose of the matrix by a vector.
+
+        Parameters
+        ----------
+        vec : numpy.ndarray
+            Vector with one value per row of the matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            Product with one value per column of the matrix.
+
+        """
+        vec = np.asarray(vec, dtype=np.double)
+        if vec.shape != (self.nrow,):
+            raise ValueError(f"The vector must have {self.nrow} values.")
+        return np.concatenate(self._map(lambda block: _product(block, vec, trans=True)))
+
+    def norms(self) -> np.ndarray:
+        """Return the 2-norm of each column.
+
+        Returns
+        -------
+        numpy.ndarray
+            Norm of each column of the matrix.
+
+        """
+        return np.concatenate(
+            self._map(lambda block: _column_norms(block._mapdl, [block.id], block.ncol)[0])
+        )
+
+    def gram(self) -> np.ndarray:
+        """Return the Gram matrix :math:`A^T A`.
+
+        The blocks circulate between the instances: at each step, each
+        instance receives the block of another instance and multiplies it by
+        its own block, so that every pair of blocks is multiplied once.
+
+        Returns
+        -------
+        numpy.ndarray
+            Symmetric Gram matrix of size ``ncol``.
+
+        """
+        nblock = len(self.blocks)
+        gram = np.empty((self.ncol, self.ncol))
+        for index, product in enumerate(self._map(lambda block: _tmult(block, block))):
+            rows = slice(self._offsets[index], self._offsets[index + 1])
+            gram[rows, rows] = product
+
+        for shift in range(1, nblock // 2 + 1):
+            pairs = [
+                (index, (index + shift) % nblock)
+                for index in range(nblock)
+                if 2 * shift < nblock or index < shift
+            ]
+            # the blocks are streamed before the products to keep each
+            # instance busy with one request at a time
+            copies = [transfer(self.blocks[other], self._mm(index)) for index, other in pairs]
+
+            def multiply(item):
+                (index, _), copy = item
+                product = _tmult(self.blocks[index], copy)
+                copy._mapdl.run(f"*FREE,{copy.id}", mute=True)
+                return product
+
+            with ThreadPoolExecutor(max_workers=len(pairs)) as executor:
+                products = list(executor.map(multiply, zip(pairs, copies)))
+            for (index, other), product in zip(pairs, products):
+                rows = slice(self._offsets[index], self._offsets[index + 1])
+                cols = slice(self._offsets[other], self._offsets[other + 1])
+                gram[rows, cols] = product
+                gram[cols, rows] = product.T
+        return gram
+
+    def orthonormalize(self):
+        """Orthonormalize the columns in place with the block Gram-Schmidt process.
+
+        The blocks are processed in order. Each block is orthonormalized
+        within its instance with two passes of Cholesky QR, and then removed
+        from the following blocks with two passes of block modified
+        Gram-Schmidt. The orthonormalized block is streamed once to each
+        instance of the following blocks.
+
+        The columns must be linearly independent.
+
+        Examples
+        --------
+        >>> snapshots.orthonormalize()
+        >>> np.allclose(snapshots.gram(), np.eye(snapshots.ncol))
+        True
+
+        """
+        nblock = len(self.blocks)
+        for index in range(nblock):
+            block = self.blocks[index]
+            for _ in range(2):
+                _cholesky_qr(block)
+
+            later = range(index + 1, nblock)
+            copies = [transfer(block, self._mm(other)) for other in later]
+
+            def project(item):
+                other, copy = item
+                target = self.blocks[other]
+                coef, tmp = id_generator(), id_generator()
+                commands = []
+                for _ in range(2):
+                    commands.extend(
+                        [
+                            f"*MULT,{copy.id},TRANS,{target.id},,{coef}",
+                            f"*MULT,{copy.id},,{coef},,{tmp}",
+                            f"*AXPY,-1,0,{tmp},1,0,{target.id}",
+                        ]
+                    )
+                commands.extend([f"*FREE,{coef}", f"*FREE,{tmp}", f"*FREE,{copy.id}"])
+                _run_batch(target._mapdl, commands)
+                target._modified()
+
+            with ThreadPoolExecutor(max_workers=max(len(copies), 1)) as executor:
+                list(executor.map(project, zip(later, copies)))
+
+    def _mm(self, index):
+        """Return an AnsMath instance connected to the instance of a block."""
+        return AnsMath(self.blocks[index]._mapdl)
+
+    def _map(self, func, indices=False):
+        """Run a function concurrently on each block, or on each block index."""
+        args = range(len(self.blocks)) if indices else self.blocks
+        with ThreadPoolExecutor(max_workers=len(self.blocks)) as executor:
+            return list(executor.map(func, args))
+
+
+def distribute(array, pool):
+    """Distribute the column blocks of a NumPy array over several instances.
+
+    Parameters
+    ----------
+    array : numpy.ndarray
+        Two-dimensional array.
+    pool : sequence of AnsMath or AnsMathPool
+        AnsMath instances receiving the blocks, one block per instance.
+
+    Returns
+    -------
+    AnsDistributedMat
+        Distributed matrix.
+
+    Examples
+    --------
+    >>> from ansys.math.core.distributed import distribute
+    >>> mat = distribute(np.random.random((1000, 60)), [mm1, mm2, mm3])
+
+    """
+    array = np.asarray(array, dtype=np.double)
+    pool = list(pool)
+    blocks = np.array_split(np.arange(array.shape[1]), len(pool))
+    jobs = [(mm, cols) for mm, cols in zip(pool, blocks) if cols.size]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        mats = executor.map(lambda job: job[0].matrix(array[:, job[1]]), jobs)
+        return AnsDistributedMat(list(mats))
+
+
+def rand(nrow, ncol, pool):
+    """Create a distributed matrix of random values.
+
+    The blocks are initialized within their instances, without any transfer.
+
+    Parameters
+    ----------
+    nrow : int
+        Number of rows.
+    ncol : int
+        Number of columns.
+    pool : sequence of AnsMath or AnsMathPool
+        AnsMath instances holding the blocks, one block per instance.
+
+    Returns
+    -------
+    AnsDistributedMat
+        Distributed matrix.
+
+    """
+    pool = list(pool)
+    sizes = [cols.size for cols in np.array_split(np.arange(ncol), len(pool))]
+    jobs = [(mm, size) for mm, size in zip(pool, sizes) if size]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        mats = executor.map(lambda job: job[0].rand(nrow, job[1]), jobs)
+        return AnsDistributedMat(list(mats))
+
+
+def _product(block, vec, trans):
+    """Multiply a block or its transpose by a NumPy vector."""
+    mapdl = block._mapdl
+    mm = AnsMath(mapdl)
+    segment = mm.set_vec(vec)
+    result = id_generator()
+    trans = "TRANS" if trans else ""
+    mapdl.run(f"*MULT,{block.id},{trans},{segment.id},,{result}", mute=True)
+    product = mapdl._vec_data(result)
+    _run_batch(mapdl, [f"*FREE,{result}", f"*FREE,{segment.id}"])
+    return product
+
+
+def _tmult(left, right):
+    """Return the product of the transpose of a block by another block."""
+    mapdl = left._mapdl
+    result = id_generator()
+    mapdl.run(f"*MULT,{left.id},TRANS,{right.id},,{result}", mute=True)
+    product = mapdl._mat_data(result)
+    mapdl.run(f"*FREE,{result}", mute=True)
+    return product
+
+
+def _cholesky_qr(block):
+    """Orthonormalize the columns of a block in place with Cholesky QR."""
+    from scipy import linalg
+
+    mapdl = block._mapdl
+    gram = _tmult(block, block)
+    factor = linalg.cholesky(gram)
+    inverse = linalg.solve_triangular(factor, np.eye(gram.shape[0]))
+
+    mm = AnsMath(mapdl)
+    rinv = mm.matrix(inverse)
+    tmp = id_generator()
+    _run_batch(
+        mapdl,
+        [
+            f"*MULT,{block.id},,{rinv.id},,{tmp}",
+            f"*AXPY,1,0,{tmp},0,0,{block.id}",
+            f"*FREE,{tmp}",
+            f"*FREE,{rinv.id}",
+        ],
+    )
+    block._modified()
@@ -0,0 +1,323 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains a reader of the FULL files written by MAPDL.
+
+The :class:`FullFile` class reads the stiffness, mass and damping matrices,
+the load vector, and the degrees of freedom of a FULL file directly in
+Python, so that they can be loaded as SciPy and NumPy arrays without
+uploading the file to MAPDL. The file is memory-mapped, and the matrix
+records are decoded with vectorized NumPy operations.
+
+Only the symmetric matrices written by the sparse assembly, without
+compression, are supported. The other files raise ``NotImplementedError``.
+"""
+
+from collections import namedtuple
+import mmap
+
+import numpy as np
+
+# position of the header items (fdfull.inc)
+HEADER_ITEMS = {
+    "neqn": 1,
+    "nmrow": 2,
+    "numdof": 7,
+    "ntermKl": 8,
+    "ntermKh": 9,
+    "lumpm": 10,
+    "keyuns": 13,
+    "ptrSTFl": 18,
+    "ptrSTFh": 19,
+    "ntermMh": 21,
+    "ptrMASl": 26,
+    "ptrMASh": 27,
+    "ptrDMPl": 28,
+    "ptrDMPh": 29,
+    "nNodes": 32,
+    "ntermMl": 33,
+    "ntermDl": 34,
+    "ptrDOFl": 35,
+    "ptrDOFh": 36,
+    "ptrRHSl": 37,
+    "ptrRHSh": 38,
+    "ntermDh": 39,
+}
+
+# record flags
+INTEGER_RECORD = 0x80
+DOUBLE_RECORD = 0x00
+
+# items imported with the ``*SMAT`` and ``*VEC`` commands
+MATRIX_ITEMS = ("STIFF", "MASS", "DAMP", "GMAT", "K_RE", "K_IM")
+VECTOR_ITEMS = ("RHS", "GVEC", "BACK", "FORWARD")
+
+FullData = namedtuple(
+    "FullData",
+    [item.lower() for item in MATRIX_ITEMS + VECTOR_ITEMS],
+    defaults=(None,) * (len(MATRIX_ITEMS) + len(VECTOR_ITEMS)),
+)
+FullData.__doc__ = """Matrices and vectors loaded from a FULL file.
+
+The items that were not loaded are ``None``.
+"""
+
+
+class FullFile:
+    """Provides the matrices and vectors of a FULL file.
+
+    The matrices and vectors are in the internal order of the equations,
+    without the constrained degrees of freedom, as when importing them with
+    the ``*SMAT`` and ``*VEC`` commands. The symmetric matrices are returned
+    as their upper triangle.
+
+    Parameters
+    ----------
+    fname : str or pathlib.Path
+        Path of the FULL file.
+
+    Examples
+    --------
+    >>> from ansys.math.core.full import FullFile
+    >>> with FullFile("file.full") as full:
+    ...     k = full.stiff()
+    ...     m = full.mass()
+    >>> k
+    <900x900 sparse matrix of type '<class 'numpy.float64'>'
+        with 38960 stored elements in Compressed Sparse Row format>
+
+    """
+
+    def __init__(self, fname):
+        """Open and memory-map a FULL file."""
+        self.filename = str(fname)
+        with open(self.filename, "rb") as fid:
+            self._mmap = mmap.mmap(fid.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # the first record has 100 words, which gives the byte order
+        if int.from_bytes(self._mmap[:4], "little") == 100:
+            self._order = "<"
+        elif int.from_bytes(self._mmap[:4], "big") == 100:
+            self._order = ">"
+        else:
+            self._mmap.close()
+            raise ValueError(f"{self.filename} is not a MAPDL binary file.")
+        self._words = np.frombuffer(self._mmap, dtype=f"{self._order}i4")
+        self._read_header()
+
+    def _read_header(self):
+        """Read the header and the degrees of freedom."""
+        header, _ = self._record(103, INTEGER_RECORD)
+        self._header = {key: int(header[index]) for key, index in HEADER_ITEMS.items()}
+        if self._header["keyuns"]:
+            raise NotImplementedError("Reading unsymmetric matrices is not supported.")
+
+        # nodes in the order of the equations, and label of each equation,
+        # which is negative when the degree of freedom is constrained
+        _, ptr = self._record(206, INTEGER_RECORD)
+        nodes, _ = self._record(ptr, INTEGER_RECORD)
+        ndof, ptr = self._record(self._long("ptrDOF"), INTEGER_RECORD)
+        labels, _ = self._record(ptr, INTEGER_RECORD)
+        self._nodes = np.repeat(nodes, ndof).astype(np.int32)
+        self._labels = labels.astype(np.int32)
+        self._free = self._labels > 0
+
+    def __repr__(self):
+        return f"FULL file {self.filename}: {self.neqn} equations, {self.nrow} unconstrained"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the file."""
+        self._words = None
+        self._mmap.close()
+
+    @property
+    def neqn(self):
+        """Number of equations, including the constrained degrees of freedom."""
+        return self._header["neqn"]
+
+    @property
+    def nrow(self):
+        """Number of rows of the matrices."""
+        return int(np.count_nonzero(self._free))
+
+    @property
+    def dof_ref(self):
+        """Node number and degree of freedom label of each row of the matrices.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(nrow, 2)`` array, where the labels are the MAPDL degree of
+            freedom numbers, such as ``1`` for ``UX``.
+
+        """
+        return np.column_stack((self._nodes[self._free], self._labels[self._free]))
+
+    @property
+    def constrained(self):
+        """Node number and degree of freedom label of the constrained degrees of freedom.
+
+        Returns
+        -------
+        numpy.ndarray
+            ``(nconst, 2)`` array.
+
+        """
+        const = ~self._free
+        return np.column_stack((self._nodes[const], -self._labels[const]))
+
+    def stiff(self):
+        """Return the stiffness matrix.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Upper triangle of the stiffness matrix.
+
+        """
+        return self._matrix("ptrSTF", "ntermK", "stiffness")
+
+    def mass(self):
+        """Return the mass matrix.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Upper triangle of the mass matrix.
+
+        """
+        if self._header["lumpm"]:
+            raise NotImplementedError("Reading lumped mass matrices is not supported.")
+        return self._matrix("ptrMAS", "ntermM", "mass")
+
+    def damp(self):
+        """Return the damping matrix.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Upper triangle of the damping matrix.
+
+        """
+        return self._matrix("ptrDMP", "ntermD", "damping")
+
+    def rhs(self):
+        """Return the load vector.
+
+        Returns
+        -------
+        numpy.ndarray
+            Load vector.
+
+        """
+        values, _ = self._record(self._long("ptrRHS"), DOUBLE_RECORD)
+        return values[self._free]
+
+    def matrix(self, mat_id):
+        """Return a matrix from its identifier.
+
+        Parameters
+        ----------
+        mat_id : str
+            ``"STIFF"``, ``"MASS"``, or ``"DAMP"``.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix
+            Upper triangle of the matrix.
+
+        """
+        readers = {"STIFF": self.stiff, "MASS": self.mass, "DAMP": self.damp}
+        if mat_id.upper() not in readers:
+            raise NotImplementedError(f"Reading the {mat_id} matrix is not supported.")
+        return readers[mat_id.upper()]()
+
+    def _long(self, name):
+        """Return a 64-bit integer of the header, stored as two items."""
+        return (self._header[name + "h"] << 32) + (self._header[name + "l"] & 0xFFFFFFFF)
+
+    def _record(self, ptr, kind):
+        """Return the data of the record at a pointer, and the pointer to the next record."""
+        words = self._words
+        size = int(words[ptr])
+        flags = (int(words[ptr + 1]) >> 24) & 0xFF
+        if flags != kind:
+            raise NotImplementedError(
+                f"Unsupported record at word {ptr} of {self.filename}. "
+                "Compressed FULL files are not supported."
+            )
+        data = words[ptr + 2 : ptr + 2 + size]
+        if kind == DOUBLE_RECORD:
+            data = data.copy().view(f"{self._order}f8").astype(np.float64)
+        return data, ptr + size + 3
+
+    def _matrix(self, pointer, nterm, label):
+        """Decode the rows of a symmetric matrix."""
+        from scipy import sparse
+
+        ptr = self._long(pointer)
+        nterm = self._long(nterm)
+        if not ptr or not nterm:
+            raise ValueError(f"{self.filename} has no {label} matrix.")
+        _, values_ptr = self._record(ptr, INTEGER_RECORD)
+        self._record(values_ptr, DOUBLE_RECORD)
+
+        # each row is a record of column indices followed by a record of
+        # values, so only the sizes of the rows are read one by one
+        words = self._words
+        neqn = self.neqn
+        counts = np.empty(neqn, dtype=np.int64)
+        starts = np.empty(neqn, dtype=np.int64)
+        for i in range(neqn):
+            count = int(words[ptr])
+            counts[i] = count
+            starts[i] = ptr + 2
+            ptr += 6 + 3 * count
+
+        if counts.sum() != nterm:
+            raise NotImplementedError(f"Unsupported matrix layout in {self.filename}.")
+
+        indptr = np.zeros(neqn + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = words[_ranges(starts, counts, indptr)].astype(np.int32) - 1
+        values_ptr = np.zeros(neqn + 1, dtype=np.int64)
+        np.cumsum(2 * counts, out=values_ptr[1:])
+        values = words[_ranges(starts + counts + 3, 2 * counts, values_ptr)]
+        values = values.view(f"{self._order}f8").astype(np.float64, copy=False)
+
+        mat = sparse.csr_matrix((values, indices, indptr), shape=(neqn, neqn))
+        mat.sort_indices()
+        if not self._free.all():
+            mat = mat[self._free][:, self._free]
+        return mat
+
+
+def _ranges(starts, counts, offsets):
+    """Return the concatenation of the ranges ``start:start + count``."""
+    shift = np.repeat(starts - offsets[:-1], counts)
+    return shift + np.arange(offsets[-1], dtype=np.int64)
@@ -0,0 +1,786 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the instrumentation of the calls made by AnsMath.
+
+The :class:`Stats` class counts the calls that AnsMath makes to MAPDL, such
+as the commands, the parameter reads and the data transfers, with their
+latency and the number of bytes transferred. It is created by
+:meth:`AnsMath.track() <ansys.math.core.math.AnsMath.track>`, and the
+statistics can be exported with :class:`LogExporter`, :class:`JsonExporter`,
+or any callable taking a :class:`Stats` object.
+
+The :class:`Profile` class, created by :meth:`AnsMath.profile()
+<ansys.math.core.math.AnsMath.profile>`, records each call with the line
+of code and the AnsMath method causing it.
+
+The calls are only intercepted while a ``track`` or ``profile`` context is open, so the
+instrumentation costs nothing otherwise.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import logging
+import math
+import os
+import sys
+import threading
+import time
+import weakref
+
+import numpy as np
+
+# MAPDL methods called by AnsMath
+METHODS = (
+    "run",
+    "input_strings",
+    "scalar_param",
+    "_data_info",
+    "_vec_data",
+    "_mat_data",
+    "upload",
+    "download",
+    "list_files",
+)
+
+# file transfers, counted with the size of the files
+FILES = ("upload", "download")
+
+# streaming services, with the direction of their transfers
+UPLOADS = ("SetVecData", "SetMatData")
+DOWNLOADS = ("GetVecData", "GetMatData")
+
+# calls transferring data, ``_vec_data`` and ``_mat_data`` being counted
+# when they do not use the streaming services
+TRANSFERS = UPLOADS + DOWNLOADS + FILES + ("_vec_data", "_mat_data")
+
+# upper bounds of the latency histogram buckets, from 1 microsecond to 64 s
+BUCKETS = tuple(1e-6 * 2**i for i in range(27))
+
+_MISSING = object()
+
+
+class CallStats:
+    """Provides the statistics of one type of call.
+
+    Attributes
+    ----------
+    count : int
+        Number of calls.
+    time : float
+        Total duration of the calls, in seconds.
+    bytes_up : int
+        Number of bytes sent to MAPDL.
+    bytes_down : int
+        Number of bytes received from MAPDL.
+    histogram : list[int]
+        Number of calls whose duration is below each bound of
+        :attr:`BUCKETS`, and above the previous bound. The last item counts
+        the calls longer than the last bound.
+
+    """
+
+    def __init__(self):
+        """Initiate empty statistics."""
+        self.count = 0
+        self.time = 0.0
+        self.bytes_up = 0
+        self.bytes_down = 0
+        self.histogram = [0] * (len(BUCKETS) + 1)
+
+    def __repr__(self):
+        return (
+            f"{self.count} calls, {self.time:.3e} s, "
+            f"{self.bytes_up} bytes up, {self.bytes_down} bytes down"
+        )
+
+    @property
+    def mean(self):
+        """Mean duration of the calls, in seconds."""
+        return self.time / self.count if self.count else 0.0
+
+    def percentile(self, q):
+        """Return an upper bound of a percentile of the call durations.
+
+        Parameters
+        ----------
+        q : float
+            Percentile, between ``0`` and ``100``.
+
+        Returns
+        -------
+        float
+            Upper bound of the histogram bucket containing the percentile,
+            in seconds. ``math.inf`` if the percentile is above the last
+            bucket.
+
+        """
+        rank = q / 100 * self.count
+        total = 0
+        for bound, count in zip(BUCKETS + (math.inf,), self.histogram):
+            total += count
+            if count and total >= rank:
+                return bound
+        return 0.0
+
+    def _record(self, elapsed, up, down):
+        self.count += 1
+        self.time += elapsed
+        self.bytes_up += up
+        self.bytes_down += down
+        index = 0
+        while index < len(BUCKETS) and elapsed > BUCKETS[index]:
+            index += 1
+        self.histogram[index] += 1
+
+    def as_dict(self):
+        """Return the statistics as a dictionary."""
+        return {
+            "count": self.count,
+            "time": self.time,
+            "bytes_up": self.bytes_up,
+            "bytes_down": self.bytes_down,
+            "histogram": list(self.histogram),
+        }
+
+
+class Stats:
+    """Provides the statistics of the calls made to a MAPDL instance.
+
+    The calls made within other calls, such as the ``_data_info`` call of
+    ``_vec_data``, are counted in both types, but only the innermost calls
+    count as round trips.
+
+    Attributes
+    ----------
+    calls : dict[str, CallStats]
+        Statistics of each type of call, such as ``"run"``,
+        ``"scalar_param"`` or ``"SetVecData"``.
+    round_trips : int
+        Number of calls to MAPDL.
+    transfers : int
+        Number of the calls to MAPDL transferring a vector or a matrix.
+    elapsed : float
+        Duration of the tracking, in seconds.
+
+    Examples
+    --------
+    >>> with mm.track() as stats:
+    ...     mm.ones(10).dot(mm.ones(10))
+    >>> stats.round_trips
+    8
+    >>> print(stats.summary())
+
+    """
+
+    def __init__(self):
+        """Initiate empty statistics."""
+        self.calls = {}
+        self.round_trips = 0
+        self.transfers = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"AnsMath call statistics: {self.round_trips} round trips, "
+            f"{self.bytes_up} bytes up, {self.bytes_down} bytes down"
+        )
+
+    @property
+    def bytes_up(self):
+        """Number of bytes sent to MAPDL."""
+        return sum(each.bytes_up for each in self.calls.values())
+
+    @property
+    def bytes_down(self):
+        """Number of bytes received from MAPDL."""
+        return sum(each.bytes_down for each in self.calls.values())
+
+    def _record(
+        self, name, elapsed, up=0, down=0, leaf=True, command=None, tstart=None, origin=None
+    ):
+        with self._lock:
+            if name not in self.calls:
+                self.calls[name] = CallStats()
+            self.calls[name]._record(elapsed, up, down)
+            self.round_trips += leaf
+            self.transfers += leaf and name in TRANSFERS
+
+    def summary(self):
+        """Return a table of the calls, sorted by decreasing total duration.
+
+        Returns
+        -------
+        str
+            Table of the number of calls, duration and bytes transferred of
+            each type of call.
+
+        """
+        lines = [
+            f"{'Call':<16}{'Count':>8}{'Time (s)':>12}{'Mean (s)':>12}"
+            f"{'P95 (s)':>12}{'Bytes up':>14}{'Bytes down':>14}"
+        ]
+        for name, each in sorted(self.calls.items(), key=lambda item: -item[1].time):
+            lines.append(
+                f"{name:<16}{each.count:>8}{each.time:>12.3e}{each.mean:>12.3e}"
+                f"{each.percentile(95):>12.1e}{each.bytes_up:>14}{each.bytes_down:>14}"
+            )
+        lines.append(
+            f"{self.round_trips} round trips, {self.bytes_up} bytes up, "
+            f"{self.bytes_down} bytes down in {self.elapsed:.3e} s"
+        )
+        return "\n".join(lines)
+
+    def as_dict(self):
+        """Return the statistics as a dictionary."""
+        return {
+            "elapsed": self.elapsed,
+            "round_trips": self.round_trips,
+            "transfers": self.transfers,
+            "bytes_up": self.bytes_up,
+            "bytes_down": self.bytes_down,
+            "calls": {name: each.as_dict() for name, each in self.calls.items()},
+        }
+
+
+class RoundTripError(AssertionError):
+    """Raised when a block of code exceeds its round trip budget."""
+
+
+class LogExporter:
+    """Log the summary of the statistics.
+
+    Parameters
+    ----------
+    logger : logging.Logger, optional
+        Logger. The default is the logger of this module.
+    level : int, optional
+        Logging level. The default is ``logging.INFO``.
+
+    """
+
+    def __init__(self, logger=None, level=logging.INFO):
+        """Initiate a log exporter."""
+        self.logger = logging.getLogger(__name__) if logger is None else logger
+        self.level = level
+
+    def __call__(self, stats):
+        self.logger.log(self.level, "AnsMath call statistics:\n%s", stats.summary())
+
+
+class JsonExporter:
+    """Append the statistics to a file of JSON lines.
+
+    Parameters
+    ----------
+    path : str or pathlib.Path
+        Path of the file.
+    **fields : dict, optional
+        Fields added to each line, such as a job name.
+
+    """
+
+    def __init__(self, path, **fields):
+        """Initiate a JSON exporter."""
+        self.path = path
+        self.fields = fields
+
+    def __call__(self, stats):
+        record = dict(self.fields, time=time.time(), **stats.as_dict())
+        with open(self.path, "a") as fid:
+            fid.write(json.dumps(record) + "\n")
+
+
+Event = namedtuple("Event", ["site", "method", "command", "thread", "start", "duration", "nbytes"])
+Event.__doc__ = """Call to MAPDL recorded by a :class:`Profile`."""
+
+# modules whose frames are not call sites
+_INTERNAL_MODULES = ("ansys.math.core", "ansys.mapdl", "grpc", "contextlib", "threading")
+
+
+class Profile:
+    """Provides the calls made to a MAPDL instance, with their call site.
+
+    Each round trip to MAPDL is recorded as an :class:`Event`, with the line
+    of the code calling AnsMath (the call site), the public AnsMath method
+    that was called, the APDL command or the service that was called, the
+    thread, the start time, the duration and the number of bytes
+    transferred.
+
+    The events are stored in a ring buffer of fixed size, in which the
+    strings are stored once, so that long sessions can be profiled. When the
+    buffer is full, the oldest events are dropped.
+
+    Parameters
+    ----------
+    size : int, optional
+        Maximum number of events kept. The default is ``65536``.
+
+    Attributes
+    ----------
+    count : int
+        Number of events recorded, including the dropped ones.
+    elapsed : float
+        Duration of the profiling, in seconds.
+
+    Examples
+    --------
+    >>> with mm.profile() as profile:
+    ...     vec = mm.ones(10)
+    ...     values = [vec[i] for i in range(10)]
+    >>> print(profile.report())
+    >>> profile.to_chrome_trace("trace.json")
+
+    """
+
+    def __init__(self, size=65536):
+        """Initiate an empty profile."""
+        self.size = size
+        self.count = 0
+        self.elapsed = 0.0
+        self._strings = []
+        self._ids = {}
+        # site, method, command and thread, as indices of ``_strings``
+        self._keys = np.zeros((size, 4), dtype=np.int32)
+        self._times = np.zeros((size, 2))
+        self._nbytes = np.zeros(size, dtype=np.int64)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"AnsMath profile: {len(self)} events ({self.dropped} dropped)"
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    @property
+    def dropped(self):
+        """Number of events dropped from the ring buffer."""
+        return self.count - len(self)
+
+    def _intern(self, string):
+        index = self._ids.get(string)
+        if index is None:
+            index = self._ids[string] = len(self._strings)
+            self._strings.append(string)
+        return index
+
+    def _record(
+        self, name, elapsed, up=0, down=0, leaf=True, command=None, tstart=None, origin=None
+    ):
+        if not leaf:
+            return
+        site, method, thread = origin or _origin()
+        command = _command_name(name, command)
+        with self._lock:
+            index = self.count % self.size
+            self._keys[index] = [self._intern(each) for each in (site, method, command, thread)]
+            self._times[index] = (tstart - self._origin, elapsed)
+            self._nbytes[index] = up + down
+            self.count += 1
+
+    def events(self):
+        """Return the events kept, from the oldest to the latest.
+
+        Returns
+        -------
+        list[Event]
+            Events kept in the ring buffer.
+
+        """
+        with self._lock:
+            order = np.arange(self.count - len(self), self.count) % self.size
+            keys = self._keys[order].tolist()
+            times = self._times[order].tolist()
+            nbytes = self._nbytes[order].tolist()
+        strings = self._strings
+        return [
+            Event(*(strings[each] for each in key), start, duration, size)
+            for key, (start, duration), size in zip(keys, times, nbytes)
+        ]
+
+    def report(self, by=("site", "method", "command"), limit=20):
+        """Return a table of the events grouped by some of their fields.
+
+        The groups are sorted by decreasing total duration.
+
+        Parameters
+        ----------
+        by : sequence[str], optional
+            Fields of :class:`Event` used to group the events. The default is
+            ``("site", "method", "command")``.
+        limit : int, optional
+            Maximum number of groups reported. The default is ``20``.
+
+        Returns
+        -------
+        str
+            Table of the number of events, total duration and bytes
+            transferred of each group.
+
+        """
+        groups = {}
+        for event in self.events():
+            key = tuple(getattr(event, field) for field in by)
+            count, duration, nbytes = groups.get(key, (0, 0.0, 0))
+            groups[key] = (count + 1, duration + event.duration, nbytes + event.nbytes)
+
+        lines = [f"{'Count':>8}{'Time (s)':>12}{'Bytes':>14}  " + " | ".join(by)]
+        ranked = sorted(groups.items(), key=lambda item: -item[1][1])
+        for key, (count, duration, nbytes) in ranked[:limit]:
+            lines.append(f"{count:>8}{duration:>12.3e}{nbytes:>14}  " + " | ".join(key))
+        lines.append(f"{len(self)} events ({self.dropped} dropped) in {self.elapsed:.3e} s")
+        return "\n".join(lines)
+
+    def to_chrome_trace(self, path):
+        """Write the events in the Chrome trace event format.
+
+        The file can be opened with ``chrome://tracing`` or with Perfetto.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path of the JSON file.
+
+        """
+        threads = {}
+        trace = []
+        for event in self.events():
+            trace.append(
+                {
+                    "name": event.command,
+                    "cat": event.method,
+                    "ph": "X",
+                    "ts": event.start * 1e6,
+                    "dur": event.duration * 1e6,
+                    "pid": 0,
+                    "tid": threads.setdefault(event.thread, len(threads)),
+                    "args": {"site": event.site, "bytes": event.nbytes},
+                }
+            )
+        for name, tid in threads.items():
+            trace.append(
+                {"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": name}}
+            )
+        with open(path, "w") as fid:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, fid)
+
+    def to_speedscope(self, path):
+        """Write the events in the speedscope format.
+
+        Each thread is a profile, in which each event is a stack made of its
+        call site, its AnsMath method and its command.
+
+        Parameters
+        ----------
+        path : str or pathlib.Path
+            Path of the JSON file.
+
+        """
+        frames = {}
+        profiles = {}
+        for event in self.events():
+            stack = [frames.setdefault(name, len(frames)) for name in event[:3]]
+            events = profiles.setdefault(event.thread, [])
+            end = event.start + event.duration
+            events.extend({"type": "O", "frame": frame, "at": event.start} for frame in stack)
+            events.extend({"type": "C", "frame": frame, "at": end} for frame in stack[::-1])
+
+        data = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": [{"name": name} for name in frames]},
+            "profiles": [
+                {
+                    "type": "evented",
+                    "name": thread,
+                    "unit": "seconds",
+                    "startValue": events[0]["at"],
+                    "endValue": events[-1]["at"],
+                    "events": events,
+                }
+                for thread, events in profiles.items()
+            ],
+            "name": "AnsMath profile",
+            "exporter": "ansys-math",
+        }
+        with open(path, "w") as fid:
+            json.dump(data, fid)
+
+
+def _origin():
+    """Return the call site, AnsMath method and thread of the current call."""
+    return (*_call_site(), threading.current_thread().name)
+
+
+def _call_site():
+    """Return the call site and the AnsMath method of the current call."""
+    frame = sys._getframe(2)
+    method = None
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if not module.startswith(_INTERNAL_MODULES):
+            break
+        if module.startswith("ansys.math.core"):
+            method = frame
+        frame = frame.f_back
+
+    site = "<unknown>"
+    if frame is not None:
+        site = f"{frame.f_code.co_filename}:{frame.f_lineno} ({frame.f_code.co_name})"
+    return site, "<unknown>" if method is None else _qualname(method)
+
+
+def _qualname(frame):
+    """Return the qualified name of the function of a frame."""
+    code = frame.f_code
+    qualname = getattr(code, "co_qualname", None)
+    if qualname is None:
+        owner = frame.f_locals.get("self")
+        qualname = code.co_name if owner is None else f"{type(owner).__name__}.{code.co_name}"
+    return qualname
+
+
+def _command_name(name, command):
+    """Return the APDL command of a call, or the name of the call."""
+    if name == "run" and isinstance(command, str):
+        command = command.split(",", 1)[0].strip().upper()
+        if "=" in command and not command.startswith("*"):
+            # parameter assignments are equivalent to *SET
+            return "*SET"
+        return command or name
+    if name == "input_strings" and command is not None:
+        commands = command.splitlines() if isinstance(command, str) else list(command)
+        return f"input_strings ({len(commands)} commands)"
+    return name
+
+
+class _StubProxy:
+    """Count the streaming calls of a gRPC stub."""
+
+    def __init__(self, stub, instrumentation):
+        self._stub = stub
+        self._instrumentation = instrumentation
+
+    def __getattr__(self, name):
+        attr = getattr(self._stub, name)
+        if name in UPLOADS:
+            return self._instrumentation._wrap_upload(name, attr)
+        if name in DOWNLOADS:
+            return self._instrumentation._wrap_download(name, attr)
+        return attr
+
+
+class _Instrumentation:
+    """Intercept the calls made to a MAPDL instance while tracking them."""
+
+    def __init__(self, mapdl):
+        self._mapdl = weakref.ref(mapdl)
+        self._active = []
+        self._saved = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def track(self, recorder):
+        """Send the calls to a recorder, such as a ``Stats`` or ``Profile`` object."""
+        with self._lock:
+            if not self._active:
+                self._install()
+            self._active.append(recorder)
+        tstart = time.perf_counter()
+        try:
+            yield recorder
+        finally:
+            recorder.elapsed = time.perf_counter() - tstart
+            with self._lock:
+                self._active.remove(recorder)
+                if not self._active:
+                    self._uninstall()
+
+    def _install(self):
+        mapdl = self._mapdl()
+        names = [name for name in METHODS if hasattr(mapdl, name)]
+        if hasattr(mapdl, "_stub"):
+            names.append("_stub")
+        for name in names:
+            self._saved[name] = vars(mapdl).get(name, _MISSING)
+            if name == "_stub":
+                mapdl._stub = _StubProxy(mapdl._stub, self)
+            else:
+                setattr(mapdl, name, self._wrap(name, getattr(mapdl, name)))
+
+    def _uninstall(self):
+        mapdl = self._mapdl()
+        for name, value in self._saved.items():
+            if value is _MISSING:
+                delattr(mapdl, name)
+            else:
+                setattr(mapdl, name, value)
+        self._saved.clear()
+
+    def _enter(self):
+        """Enter a call and return the time it starts."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        if stack:
+            stack[-1][0] = True
+        stack.append([False])
+        return time.perf_counter()
+
+    def _pop(self):
+        """Leave a call and return whether other calls were made within it."""
+        return self._local.stack.pop()[0]
+
+    def _exit(self, name, tstart, up=0, down=0, result=None, command=None):
+        """Exit a call and record it."""
+        self._record(name, tstart, self._pop(), up, down, result, command)
+
+    def _record(self, name, tstart, nested, up=0, down=0, result=None, command=None, origin=None):
+        """Record a call that has been left, from any thread."""
+        elapsed = time.perf_counter() - tstart
+        if result is not None and not nested:
+            # data received without a streaming call, as with the local backend
+            down += sum(getattr(each, "nbytes", 0) for each in _arrays(result))
+        for recorder in list(self._active):
+            recorder._record(name, elapsed, up, down, not nested, command, tstart, origin)
+
+    def _wrap(self, name, func):
+        def wrapper(*args, **kwargs):
+            tstart = self._enter()
+            result = None
+            up = down = 0
+            try:
+                if name == "upload":
+                    up = _file_bytes(args[0] if args else kwargs.get("file_name"))
+                result = func(*args, **kwargs)
+                if name == "download":
+                    down = _file_bytes(result)
+                return result
+            finally:
+                data = result if name in ("_vec_data", "_mat_data") else None
+                command = args[0] if args and name in ("run", "input_strings") else None
+                self._exit(name, tstart, up, down, result=data, command=command)
+
+        return wrapper
+
+    def _wrap_upload(self, name, func):
+        def wrapper(requests, *args, **kwargs):
+            nbytes = [0]
+
+            def counted():
+                for request in requests:
+                    nbytes[0] += len(request.chunk.payload)
+                    yield request
+
+            tstart = self._enter()
+            try:
+                return func(counted(), *args, **kwargs)
+            finally:
+                self._exit(name, tstart, up=nbytes[0])
+
+        return wrapper
+
+    def _wrap_download(self, name, func):
+        def wrapper(*args, **kwargs):
+            return _CountedStream(self, name, func(*args, **kwargs))
+
+        return wrapper
+
+
+class _CountedStream:
+    """Count the bytes of a stream of chunks, keeping the gRPC stream interface.
+
+    The stream can be consumed by another thread, for example when it is
+    relayed to another instance by gRPC, so the call leaves the stack of
+    the creating thread right away and is recorded when the stream ends.
+    """
+
+    def __init__(self, instrumentation, name, stream):
+        self._instrumentation = instrumentation
+        self._name = name
+        self._stream = stream
+        self._nbytes = 0
+        self._origin = _origin() if instrumentation._active else None
+        self._tstart = instrumentation._enter()
+        self._nested = instrumentation._pop()
+        self._done = False
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            chunk = next(self._stream)
+        except BaseException:
+            self._finish()
+            raise
+        self._nbytes += len(chunk.payload)
+        return chunk
+
+    next = __next__
+
+    def done(self):
+        done = self._stream.done()
+        if done:
+            self._finish()
+        return done
+
+    def _finish(self):
+        if not self._done:
+            self._done = True
+            self._instrumentation._record(
+                self._name, self._tstart, self._nested, down=self._nbytes, origin=self._origin
+            )
+
+
+def _file_bytes(paths):
+    """Return the total size of local files, ignoring the missing ones."""
+    if isinstance(paths, (str, os.PathLike)):
+        paths = [paths]
+    return sum(os.path.getsize(path) for path in paths or () if os.path.isfile(path))
+
+
+def _arrays(result):
+    """Return the arrays of a downloaded vector or matrix."""
+    if isinstance(result, tuple):
+        return result
+    if hasattr(result, "indptr"):
+        return (result.data, result.indices, result.indptr)
+    return (result,)
+
+
+_INSTRUMENTATIONS = weakref.WeakKeyDictionary()
+
+
+def _get_instrumentation(mapdl):
+    """Return the instrumentation of a MAPDL instance."""
+    try:
+        return _INSTRUMENTATIONS[mapdl]
+    except KeyError:
+        instrumentation = _INSTRUMENTATIONS[mapdl] = _Instrumentation(mapdl)
+        return instrumentation
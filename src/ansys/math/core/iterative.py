@@ -0,0 +1,449 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the matrix-free Krylov solvers of PyAnsys Math.
+
+The matrix-vector products, vector updates, and dot products are performed
+within MAPDL. Only scalars are transferred to Python. The commands of each
+iteration are sent to MAPDL as a single block.
+"""
+
+import numpy as np
+
+from ansys.math.core.math import (
+    MYCTYPE,
+    AnsMath,
+    AnsVec,
+    ObjType,
+    _run_batch,
+    id_generator,
+)
+
+METHODS = ("CG", "MINRES", "GMRES")
+
+
+class AnsIterativeSolver:
+    """Provides the AnsMath preconditioned Krylov solvers.
+
+    Available methods are:
+
+    * ``"CG"``: Conjugate gradient, for symmetric positive-definite matrices.
+    * ``"MINRES"``: Minimum residual, for symmetric indefinite matrices.
+    * ``"GMRES"``: Restarted generalized minimum residual, for unsymmetric
+      matrices.
+
+    Parameters
+    ----------
+    mat : AnsMat
+        AnsMath matrix of the linear system. The matrix is not modified.
+    method : str, optional
+        Krylov method. The default is ``"CG"``.
+    precond : str or AnsVec, optional
+        Preconditioner. Options are ``"jacobi"``, which uses the inverse of
+        the diagonal of the matrix, ``None``, or an AnsMath vector containing
+        the inverse of a diagonal preconditioner. The default is ``"jacobi"``.
+    tol : float, optional
+        Relative tolerance on the residual norm. The default is ``1E-8``.
+    maxiter : int, optional
+        Maximum number of iterations. The default is the size of the matrix.
+    restart : int, optional
+        Number of iterations between restarts of the GMRES method. The
+        default is ``30``.
+
+    Attributes
+    ----------
+    history : list of float
+        Relative residual norms at each iteration of the last solve. For the
+        MINRES method, the residual is measured in the norm induced by the
+        preconditioner, relative to the initial residual.
+    converged : bool
+        Whether the last solve converged.
+
+    Examples
+    --------
+    >>> k = mm.stiff()
+    >>> solver = mm.iterative_solver(k, method="cg", tol=1e-10)
+    >>> x = solver.solve(mm.ones(k.nrow))
+    >>> solver.iterations, solver.history[-1]
+    (123, 8.9e-11)
+    >>> solver.free()
+
+    """
+
+    def __init__(self, mat, method="CG", precond="jacobi", tol=1e-8, maxiter=None, restart=30):
+        """Initiate an iterative solver."""
+        if mat.type not in (ObjType.DMAT, ObjType.SMAT):
+            raise TypeError("The matrix of the linear system must be an AnsMath matrix.")
+        if method.upper() not in METHODS:
+            raise ValueError(f"Invalid method '{method}'. Options are: {', '.join(METHODS)}.")
+        if restart < 1:
+            raise ValueError("The ``restart`` parameter must be positive.")
+
+        self.id = id_generator()
+        self._mapdl = mat._mapdl
+        self.mat = mat
+        self.method = method.upper()
+        self.tol = tol
+        self.maxiter = maxiter
+        self.restart = restart
+        self.history = []
+        self.converged = False
+
+        self._owned = False
+        if isinstance(precond, AnsVec):
+            self._dinv = precond
+        elif precond is None:
+            self._dinv = None
+        elif isinstance(precond, str) and precond.lower() == "jacobi":
+            self._dinv = self._jacobi()
+            self._owned = True
+        else:
+            raise ValueError(f"Invalid preconditioner '{precond}'.")
+
+    def __repr__(self):
+        return f"AnsMath {self.method} Iterative Solver."
+
+    @property
+    def iterations(self):
+        """Number of iterations of the last solve."""
+        return len(self.history)
+
+    def free(self):
+        """Delete the Jacobi preconditioner of this solver within MAPDL.
+
+        A preconditioner supplied as an AnsMath vector is not deleted.
+        """
+        if self._owned:
+            self._mapdl.run(f"*FREE,{self._dinv.id}", mute=True)
+            self._dinv = None
+            self._owned = False
+
+    def _jacobi(self):
+        """Upload the inverse of the diagonal of the matrix.
+
+        The diagonal of a dense matrix is gathered within MAPDL, one linked
+        column at a time, in a single block of commands.
+        """
+        if self.mat.type == ObjType.SMAT:
+            indptr = self._mapdl._vec_data(f"{self.mat.id}::ROWS")
+            indices = self._mapdl._vec_data(f"{self.mat.id}::COLS")
+            values = self._mapdl._vec_data(f"{self.mat.id}::VALS")
+            rows = np.repeat(np.arange(indptr.size - 1), np.diff(indptr))
+            mask = rows == indices
+            diag = np.zeros(indptr.size - 1, dtype=values.dtype)
+            np.add.at(diag, rows[mask], values[mask])
+        else:
+            diag = self._dense_diagonal()
+
+        if self.method == "MINRES":
+            # MINRES requires a positive-definite preconditioner
+            diag = np.abs(diag)
+        diag[diag == 0] = 1
+        return AnsMath(self._mapdl).set_vec(1 / diag)
+
+    def _dense_diagonal(self):
+        """Return the diagonal of the dense matrix of the linear system."""
+        col, vec, par = (id_generator() for _ in range(3))
+        size = self.mat.nrow
+        commands = [f"*DIM,{par},ARRAY,{size}"]
+        for j in range(1, size + 1):
+            commands.extend([f"*VEC,{col},D,LINK,{self.mat.id},{j}", f"{par}({j})={col}({j})"])
+        commands.extend([f"*VEC,{vec},D,IMPORT,APDL,{par}", f"*FREE,{col}", f"{par}="])
+        _run_batch(self._mapdl, commands)
+        diag = self._mapdl._vec_data(vec)
+        self._mapdl.run(f"*FREE,{vec}", mute=True)
+        return diag
+
+    def _precond(self, src, dst):
+        """Return the command applying the preconditioner to ``src`` into ``dst``."""
+        if self._dinv is None:
+            return f"*AXPY,1,0,{src},0,0,{dst}"
+        return f"*HPROD,{self._dinv.id},{src},{dst}"
+
+    def _param(self, suffix):
+        return f"{self.id}_{suffix}"
+
+    def _scalar(self, suffix):
+        return self._mapdl.scalar_param(self._param(suffix))
+
+    def _alloc(self, names, size, ctype):
+        return [f"*VEC,{name},{ctype},ALLOC,{size}" for name in names]
+
+    def solve(self, b, x=None):
+        """Solve the linear system.
+
+        Parameters
+        ----------
+        b : AnsVec
+            AnsMath vector of the right-hand side.
+        x : AnsVec, optional
+            AnsMath vector containing the initial guess, which is overwritten
+            by the solution. The default initial guess is zero.
+
+        Returns
+        -------
+        AnsVec
+            Solution vector, which is identical to the ``x`` parameter if supplied.
+
+        """
+        if not isinstance(b, AnsVec):
+            raise TypeError("The right-hand side must be an AnsMath vector.")
+
+        size = self.mat.nrow
+        ctype = MYCTYPE[np.double]
+        guess = x is not None
+        if not guess:
+            x = AnsMath(self._mapdl).zeros(size)
+
+        self.history = []
+        self.converged = False
+        maxiter = self.maxiter or size
+        if self.method == "CG":
+            temps = self._cg(b, x, guess, size, ctype, maxiter)
+        elif self.method == "MINRES":
+            temps = self._minres(b, x, guess, size, ctype, maxiter)
+        else:
+            temps = self._gmres(b, x, guess, size, ctype, maxiter)
+
+        _run_batch(self._mapdl, [f"*FREE,{name}" for name in temps])
+        self._mapdl._log.info(
+            "%s solve %s after %d iterations.",
+            self.method,
+            "converged" if self.converged else "did not converge",
+            self.iterations,
+        )
+        x._modified()
+        return x
+
+    def _residual(self, b, x, guess, r, q):
+        """Return the commands computing ``r = b - A*x``."""
+        cmds = [f"*AXPY,1,0,{b.id},0,0,{r}"]
+        if guess:
+            cmds += [f"*MULT,{self.mat.id},,{x.id},,{q}", f"*AXPY,-1,0,{q},1,0,{r}"]
+        return cmds
+
+    def _converged(self, rnorm, bnorm):
+        rel = rnorm / bnorm if bnorm else 0.0
+        self.history.append(rel)
+        self.converged = rel <= self.tol
+        return self.converged
+
+    def _cg(self, b, x, guess, size, ctype, maxiter):
+        """Preconditioned conjugate gradient, with scalars kept within MAPDL."""
+        r, z, p, q = (id_generator() for _ in range(4))
+        rz, pq, alpha, nalpha, rzn, beta = (
+            self._param(each) for each in ("RZ", "PQ", "AL", "NA", "RZN", "BE")
+        )
+        setup = self._alloc((r, z, p, q), size, ctype)
+        setup += self._residual(b, x, guess, r, q)
+        setup += [
+            self._precond(r, z),
+            f"*AXPY,1,0,{z},0,0,{p}",
+            f"*DOT,{r},{z},{rz}",
+            f"*NRM,{b.id},NRM2,{self._param('BN')}",
+            f"*NRM,{r},NRM2,{self._param('RN')}",
+        ]
+        _run_batch(self._mapdl, setup)
+        bnorm = self._scalar("BN")
+        if self._scalar("RN") == 0:
+            return (r, z, p, q)
+
+        iteration = [
+            f"*MULT,{self.mat.id},,{p},,{q}",
+            f"*DOT,{p},{q},{pq}",
+            f"{alpha}={rz}/{pq}",
+            f"{nalpha}=-{alpha}",
+            f"*AXPY,{alpha},0,{p},1,0,{x.id}",
+            f"*AXPY,{nalpha},0,{q},1,0,{r}",
+            self._precond(r, z),
+            f"*DOT,{r},{z},{rzn}",
+            f"{beta}={rzn}/{rz}",
+            f"{rz}={rzn}",
+            f"*AXPY,1,0,{z},{beta},0,{p}",
+            f"*NRM,{r},NRM2,{self._param('RN')}",
+        ]
+        for _ in range(maxiter):
+            _run_batch(self._mapdl, iteration)
+            if self._converged(self._scalar("RN"), bnorm):
+                break
+        return (r, z, p, q)
+
+    def _minres(self, b, x, guess, size, ctype, maxiter):
+        """Preconditioned minimum residual method (Paige and Saunders)."""
+        r1, r2, y, v, w, w1, w2, q = (id_generator() for _ in range(8))
+        temps = (r1, r2, y, v, w, w1, w2, q)
+        setup = self._alloc(temps, size, ctype)
+        setup += self._residual(b, x, guess, r1, q)
+        setup += [
+            self._precond(r1, y),
+            f"*AXPY,1,0,{r1},0,0,{r2}",
+            f"*DOT,{r1},{y},{self._param('RY')}",
+        ]
+        _run_batch(self._mapdl, setup)
+        beta1 = self._scalar("RY")
+        if beta1 < 0:
+            raise ValueError("The preconditioner must be positive definite.")
+        beta1 = np.sqrt(beta1)
+        if beta1 == 0:
+            return temps
+
+        oldb, beta, dbar, epsln, phibar = 0.0, beta1, 0.0, 0.0, beta1
+        cs, sn = -1.0, 0.0
+        pending = []
+        for itn in range(maxiter):
+            cmds = pending + [
+                f"*AXPY,{1 / beta},0,{y},0,0,{v}",
+                f"*MULT,{self.mat.id},,{v},,{y}",
+            ]
+            if itn:
+                cmds.append(f"*AXPY,{-beta / oldb},0,{r1},1,0,{y}")
+            cmds.append(f"*DOT,{v},{y},{self._param('AL')}")
+            _run_batch(self._mapdl, cmds)
+            alfa = self._scalar("AL")
+
+            # r1 <- r2, r2 <- y, y <- M^-1 r2
+            r1, r2, y = r2, y, r1
+            _run_batch(
+                self._mapdl,
+                [
+                    f"*AXPY,{-alfa / beta},0,{r1},1,0,{r2}",
+                    self._precond(r2, y),
+                    f"*DOT,{r2},{y},{self._param('RY')}",
+                ],
+            )
+            oldb = beta
+            beta = np.sqrt(max(self._scalar("RY"), 0.0))
+
+            oldeps = epsln
+            delta = cs * dbar + sn * alfa
+            gbar = sn * dbar - cs * alfa
+            epsln = sn * beta
+            dbar = -cs * beta
+            gamma = max(np.hypot(gbar, beta), np.finfo(float).eps)
+            cs, sn = gbar / gamma, beta / gamma
+            phi = cs * phibar
+            phibar = sn * phibar
+
+            # w1 <- w2, w2 <- w, w <- (v - oldeps*w1 - delta*w2) / gamma
+            w1, w2, w = w2, w, w1
+            pending = [
+                f"*AXPY,{1 / gamma},0,{v},0,0,{w}",
+                f"*AXPY,{-oldeps / gamma},0,{w1},1,0,{w}",
+                f"*AXPY,{-delta / gamma},0,{w2},1,0,{w}",
+                f"*AXPY,{phi},0,{w},1,0,{x.id}",
+            ]
+            # residual norm estimate, in the norm induced by the preconditioner
+            if self._converged(phibar, beta1) or beta == 0:
+                break
+
+        _run_batch(self._mapdl, pending)
+        return temps
+
+    def _gmres(self, b, x, guess, size, ctype, maxiter):
+        """Restarted GMRES with right preconditioning and iterated Gram-Schmidt."""
+        m = self.restart
+        r, z, w, q, h, h2, vh, col, y = (id_generator() for _ in range(9))
+        basis = id_generator()
+        temps = (r, z, w, q, h, h2, vh, col, y, basis)
+
+        setup = self._alloc((r, z, w, q), size, ctype)
+        setup += [f"*DMAT,{basis},{ctype},ALLOC,{size},{m + 1}"]
+        setup += self._residual(b, x, guess, r, q)
+        setup += [
+            f"*NRM,{b.id},NRM2,{self._param('BN')}",
+            f"*NRM,{r},NRM2,{self._param('RN')}",
+        ]
+        _run_batch(self._mapdl, setup)
+        bnorm = self._scalar("BN")
+        beta = self._scalar("RN")
+
+        mm = AnsMath(self._mapdl)
+        while beta and len(self.history) < maxiter:
+            hess = np.zeros((m + 1, m))
+            givens = np.zeros((m, 2))
+            g = np.zeros(m + 1)
+            g[0] = beta
+            cmds = [
+                f"*INIT,{basis},ZERO",
+                f"*VEC,{col},{ctype},LINK,{basis},1",
+                f"*AXPY,{1 / beta},0,{r},0,0,{col}",
+            ]
+            k = 0
+            for j in range(m):
+                cmds += [
+                    f"*VEC,{col},{ctype},LINK,{basis},{j + 1}",
+                    self._precond(col, z),
+                    f"*MULT,{self.mat.id},,{z},,{w}",
+                ]
+                # classical Gram-Schmidt, applied twice for stability
+                for coef in (h, h2):
+                    cmds += [
+                        f"*MULT,{basis},TRANS,{w},,{coef}",
+                        f"*MULT,{basis},,{coef},,{vh}",
+                        f"*AXPY,-1,0,{vh},1,0,{w}",
+                    ]
+                cmds += [f"*AXPY,1,0,{h2},1,0,{h}", f"*NRM,{w},NRM2,{self._param('WN')}"]
+                _run_batch(self._mapdl, cmds)
+                hcol = self._mapdl._vec_data(h)[: j + 1]
+                wnorm = self._scalar("WN")
+                hess[: j + 1, j] = hcol
+                hess[j + 1, j] = wnorm
+
+                # apply the previous rotations and compute the new one
+                for i in range(j):
+                    c, s = givens[i]
+                    hess[i, j], hess[i + 1, j] = (
+                        c * hess[i, j] + s * hess[i + 1, j],
+                        -s * hess[i, j] + c * hess[i + 1, j],
+                    )
+                denom = np.hypot(hess[j, j], hess[j + 1, j])
+                c, s = (1.0, 0.0) if denom == 0 else (hess[j, j] / denom, hess[j + 1, j] / denom)
+                givens[j] = c, s
+                hess[j, j] = denom
+                hess[j + 1, j] = 0.0
+                g[j], g[j + 1] = c * g[j], -s * g[j]
+                k = j + 1
+
+                done = self._converged(abs(g[j + 1]), bnorm)
+                if done or wnorm == 0 or len(self.history) >= maxiter:
+                    break
+                cmds = [
+                    f"*VEC,{col},{ctype},LINK,{basis},{j + 2}",
+                    f"*AXPY,{1 / wnorm},0,{w},0,0,{col}",
+                ]
+
+            # update the solution: x = x + M^-1 * V * y
+            coefs = np.zeros(m + 1)
+            coefs[:k] = np.linalg.solve(np.triu(hess[:k, :k]), g[:k])
+            mm._set_vec(y, coefs)
+            cmds = [
+                f"*MULT,{basis},,{y},,{vh}",
+                self._precond(vh, z),
+                f"*AXPY,1,0,{z},1,0,{x.id}",
+            ]
+            cmds += self._residual(b, x, True, r, q)
+            cmds.append(f"*NRM,{r},NRM2,{self._param('RN')}")
+            _run_batch(self._mapdl, cmds)
+            beta = self._scalar("RN")
+            if self.converged:
+                break
+        return temps
@@ -0,0 +1,796 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the local backend of PyAnsys Math.
+
+The :class:`LocalMapdl` class provides the subset of the PyMAPDL ``Mapdl``
+interface used by AnsMath. The AnsMath objects are stored in memory as NumPy
+arrays and SciPy sparse matrices, and the APDL Math commands are interpreted
+in the Python process, so that small problems run without a MAPDL server.
+
+Use it with ``AnsMath(backend="local")``.
+"""
+
+import logging
+import os
+import re
+import shutil
+import tempfile
+
+from ansys.api.mapdl.v0 import ansys_kernel_pb2 as anskernel
+from ansys.api.mapdl.v0 import mapdl_pb2 as pb_types
+from ansys.mapdl.core.common_grpc import ANSYS_VALUE_TYPE, DEFAULT_CHUNKSIZE
+from ansys.mapdl.core.errors import MapdlRuntimeError
+import numpy as np
+
+from ansys.math.core.math import MYCTYPE
+
+LOCAL_TYPES = {value: key for key, value in MYCTYPE.items()}
+
+VALUE_TYPE = {value: key for key, value in ANSYS_VALUE_TYPE.items() if value is not None}
+
+_TOKEN = re.compile(
+    r"\s*(?:(\d+\.?\d*(?:[eEdD][+-]?\d+)?|\.\d+(?:[eEdD][+-]?\d+)?)|([A-Za-z_][\w]*)|(\*\*|.))"
+)
+_FUNCS = {
+    "SQRT": np.sqrt,
+    "ABS": np.abs,
+    "EXP": np.exp,
+    "LOG": np.log,
+    "SIN": np.sin,
+    "COS": np.cos,
+    "TAN": np.tan,
+    "ATAN": np.arctan,
+}
+
+
+class _LocalObj:
+    """Store one APDL Math object (vector, matrix, or solver)."""
+
+    def __init__(self, kind, data=None, sym=False):
+        self.kind = kind
+        self.data = data
+        self.sym = sym
+
+
+class _LocalStub:
+    """Provide the streaming gRPC methods used by AnsMath."""
+
+    def __init__(self, mapdl):
+        self._mapdl = mapdl
+
+    def SetVecData(self, requests):
+        name, stype, size, payload = None, None, 0, []
+        for request in requests:
+            name, stype, size = request.vname, request.stype, request.size
+            payload.append(request.chunk.payload)
+        dtype = ANSYS_VALUE_TYPE[stype]
+        data = np.frombuffer(b"".join(payload), dtype=dtype)[:size].copy()
+        self._mapdl._store(name, _LocalObj("VEC", data))
+
+    def SetMatData(self, requests):
+        name, stype, shape, payload = None, None, (0, 0), []
+        for request in requests:
+            name, stype = request.mname, request.stype
+            shape = (request.nrow, request.ncol)
+            payload.append(request.chunk.payload)
+        dtype = ANSYS_VALUE_TYPE[stype]
+        data = np.frombuffer(b"".join(payload), dtype=dtype).reshape(shape, order="F")
+        self._mapdl._store(name, _LocalObj("DMAT", np.asfortranarray(data.copy())))
+
+    def _chunks(self, array, chunk_size=DEFAULT_CHUNKSIZE):
+        raw = array.tobytes(order="F")
+        value_type = VALUE_TYPE[array.dtype.type]
+        for i in range(0, max(len(raw), 1), chunk_size):
+            piece = raw[i : i + chunk_size]
+            yield anskernel.Chunk(payload=piece, size=len(piece), value_type=value_type)
+
+    def GetVecData(self, request):
+        return self._chunks(self._mapdl._vec_data(request.name))
+
+    def GetMatData(self, request):
+        obj = self._mapdl._get(request.name)
+        if obj.kind != "DMAT":
+            raise MapdlRuntimeError(f"{request.name} is not a dense matrix.")
+        return self._chunks(obj.data)
+
+    def GetDataInfo(self, request):
+        return self._mapdl._data_info(request.name)
+
+
+class LocalMapdl:
+    """Interpret APDL Math commands with NumPy and SciPy.
+
+    The commands that are not related to APDL Math raise a
+    ``MapdlRuntimeError``, except the commands that have no effect on the
+    AnsMath objects, such as the ``/`` commands.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed of the random generator used by ``*INIT,,RAND``.
+    directory : str, optional
+        Working directory. The default is a new temporary directory, which
+        is deleted on exit.
+
+    Examples
+    --------
+    >>> import ansys.math.core.math as pymath
+    >>> mm = pymath.AnsMath(backend="local")
+    >>> mm.ones(10).dot(mm.ones(10))
+    10.0
+
+    """
+
+    version = 25.2
+    _server_version = (0, 5, 1)
+    _local = True
+    _distributed = False
+
+    def __init__(self, seed=None, directory=None):
+        """Initiate a local APDL Math interpreter."""
+        self._objects = {}
+        self._params = {}
+        self._modopt = ("LANB", 0, "", "", "")
+        self._rng = np.random.default_rng(seed)
+        self._log = logging.getLogger(__name__)
+        self._stub = _LocalStub(self)
+        self._tmpdir = None
+        if directory is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="ansys_math_")
+            directory = self._tmpdir
+        self.directory = directory
+
+    def __repr__(self):
+        return "Local APDL Math interpreter"
+
+    def clear(self):
+        """Delete all the objects and parameters."""
+        self._objects.clear()
+        self._params.clear()
+
+    def exit(self):
+        """Delete all the objects and the temporary working directory."""
+        self.clear()
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def list_files(self):
+        """Return the names of the files of the working directory."""
+        return sorted(os.listdir(self.directory))
+
+    def upload(self, file_name, progress_bar=False):
+        """Copy a file to the working directory."""
+        shutil.copy(file_name, self.directory)
+        return os.path.basename(file_name)
+
+    # ------------------------------------------------------------------
+    # Store helpers
+    # ------------------------------------------------------------------
+
+    def _store(self, name, obj):
+        self._objects[name.upper()] = obj
+
+    def _get(self, name):
+        try:
+            return self._objects[name.strip().upper()]
+        except KeyError:
+            raise MapdlRuntimeError(f"APDL Math object {name} does not exist.") from None
+
+    def _array(self, name):
+        """Return the data of a vector or matrix, densifying symmetric storage."""
+        return self._get(name).data
+
+    # ------------------------------------------------------------------
+    # Mapdl interface
+    # ------------------------------------------------------------------
+
+    def run(self, command, mute=None, **kwargs):
+        """Run one command and return its output."""
+        command = command.strip()
+        if not command or command.startswith("!"):
+            return ""
+        match = re.match(r"^([A-Za-z_]\w*(?:\([^)]*\))?)\s*=(.*)$", command)
+        if match and not command.startswith("*"):
+            return self._assign(match.group(1), match.group(2))
+
+        fields = [each.strip() for each in command.split(",")]
+        cmd = fields[0].upper()
+        args = fields[1:]
+        handler = getattr(self, "_cmd_" + cmd.lstrip("*/").lower(), None)
+        if handler is None:
+            if cmd.startswith("/") or cmd[:4] in ("FINI", "ANTY", "DSPO"):
+                return ""
+            raise MapdlRuntimeError(f"Command {cmd} is not supported by the local backend.")
+        out = handler(*args)
+        return "" if mute else (out or "")
+
+    def input_strings(self, commands):
+        """Run several commands as a single block."""
+        if isinstance(commands, str):
+            commands = commands.splitlines()
+        return "\n".join(self.run(each, mute=True) for each in commands)
+
+    def scalar_param(self, pname):
+        """Return a scalar parameter as a float, or ``None`` if undefined."""
+        name = pname.upper()
+        if name in self._params:
+            value = self._params[name]
+            return None if isinstance(value, np.ndarray) else float(np.real(value))
+
+        for suffix in ("_DIM", "_ROWDIM", "_COLDIM"):
+            if name.endswith(suffix) and name[: -len(suffix)] in self._objects:
+                data = self._objects[name[: -len(suffix)]].data
+                if suffix == "_DIM":
+                    return float(data.shape[0])
+                if suffix == "_ROWDIM":
+                    return float(data.shape[0])
+                return float(data.shape[1])
+        return None
+
+    def _data_info(self, pname):
+        name = pname.split("::")[0]
+        obj = self._get(name)
+        if "::" in pname:
+            data = self._vec_data(pname)
+            return pb_types.DataResponse(
+                stype=VALUE_TYPE[data.dtype.type],
+                objtype=pb_types.DataType.VEC,
+                size1=data.size,
+                size2=1,
+            )
+
+        objtype = getattr(pb_types.DataType, obj.kind if obj.kind != "SOLVER" else "GEN")
+        data = obj.data
+        if obj.kind == "SOLVER":
+            return pb_types.DataResponse(objtype=objtype)
+        size1 = data.shape[0]
+        size2 = data.shape[1] if data.ndim > 1 else 1
+        mattype = 0 if obj.sym else 3
+        return pb_types.DataResponse(
+            stype=VALUE_TYPE[data.dtype.type],
+            objtype=objtype,
+            size1=size1,
+            size2=size2,
+            mattype=mattype,
+        )
+
+    def _vec_data(self, pname):
+        name, _, part = pname.partition("::")
+        obj = self._get(name)
+        if part:
+            mat = self._stored_sparse(obj)
+            if part.upper() == "ROWS":
+                return mat.indptr.astype(np.int64)
+            elif part.upper() == "COLS":
+                return mat.indices.astype(np.int32)
+            return mat.data.copy()
+        return np.array(obj.data).ravel(order="F")
+
+    def _mat_data(self, pname, raw=False):
+        from scipy import sparse
+
+        obj = self._get(pname)
+        if obj.kind == "DMAT":
+            return np.array(obj.data)
+        elif obj.kind == "SMAT":
+            mat = self._stored_sparse(obj)
+            if raw:
+                return mat.data, mat.indices, mat.indptr, mat.shape
+            return sparse.csr_matrix(mat)
+        raise ValueError(f'Invalid matrix type "{obj.kind}"')
+
+    def _stored_sparse(self, obj):
+        """Return a sparse matrix as stored: upper triangle when symmetric."""
+        from scipy import sparse
+
+        if obj.sym:
+            return sparse.triu(obj.data, format="csr")
+        return obj.data.tocsr()
+
+    # ------------------------------------------------------------------
+    # Expressions
+    # ------------------------------------------------------------------
+
+    def _value(self, name, *index):
+        name = name.upper()
+        if name in _FUNCS:
+            return _FUNCS[name](*index)
+        if index:
+            if name in self._objects:
+                data = self._objects[name].data
+                value = data[int(index[0]) - 1]
+                if len(index) > 1 and int(index[1]) == 2:
+                    return float(np.imag(value))
+                return float(np.real(value))
+            return float(self._params[name][int(index[0]) - 1])
+        if name not in self._params:
+            raise MapdlRuntimeError(f"Parameter {name} is not defined.")
+        return self._params[name]
+
+    def _eval(self, expr):
+        expr = expr.strip()
+        if not expr:
+            return 0.0
+        try:
+            return float(expr.replace("D", "E").replace("d", "e"))
+        except ValueError:
+            pass
+
+        pieces = []
+        tokens = _TOKEN.findall(expr)
+        skip = False
+        for i, (number, ident, oper) in enumerate(tokens):
+            if skip:
+                skip = False
+            elif number:
+                pieces.append(number.replace("D", "E").replace("d", "e"))
+            elif ident:
+                # an identifier followed by parentheses is an indexed lookup
+                skip = i + 1 < len(tokens) and tokens[i + 1][2] == "("
+                pieces.append(f'_v("{ident}"' + ("," if skip else ")"))
+            else:
+                pieces.append(oper)
+        return eval("".join(pieces), {"__builtins__": {}}, {"_v": self._value})
+
+    def _num(self, field, default=0.0):
+        if field is None or not str(field).strip():
+            return default
+        return self._eval(str(field))
+
+    def _assign(self, target, expr):
+        match = re.match(r"^(\w+)\((\d+)\)$", target.strip())
+        if not expr.strip():
+            self._params.pop(target.strip().upper(), None)
+            return ""
+        value = self._eval(expr)
+        if match:
+            self._params[match.group(1).upper()][int(match.group(2)) - 1] = value
+        else:
+            self._params[target.strip().upper()] = value
+        return ""
+
+    # ------------------------------------------------------------------
+    # Commands
+    # ------------------------------------------------------------------
+
+    def _cmd_dim(self, name, type_="ARRAY", imax="1", *args):
+        self._params[name.upper()] = np.zeros(int(self._num(imax)))
+
+    def _cmd_clear(self, *args):
+        self.clear()
+
+    def _cmd_status(self, *args):
+        lines = [
+            f"APDLMATH PARAMETER STATUS-  ({len(self._objects):7d} PARAMETERS DEFINED)",
+            "",
+            f"{'  Name                   Type            Mem. (MB)       Dims':<70}Workspace".ljust(
+                83
+            ),
+        ]
+        for name, obj in self._objects.items():
+            if obj.kind == "SOLVER":
+                lines.append(f"{name:<22} LSENGINE  0.000   [0:0]   1")
+                continue
+            data = obj.data
+            mem = (data.data.nbytes if obj.kind == "SMAT" else data.nbytes) / 1024**2
+            dims = f"{data.shape[0]}" if obj.kind == "VEC" else f"[{data.shape[0]}:{data.shape[1]}]"
+            lines.append(f"{name:<22} {obj.kind:<6} {mem:.3f}   {dims}   1")
+        return "\n".join(lines)
+
+    def _new_data(self, type_, shape):
+        dtype = LOCAL_TYPES[type_.strip("'").upper()]
+        return np.zeros(shape, dtype=dtype, order="F")
+
+    def _cmd_vec(self, name, type_="D", method="ALLOC", val1="", val2="", val3="", *args):
+        method = method.upper()
+        dtype = LOCAL_TYPES[type_.strip("'").upper() or "D"]
+        if method == "ALLOC":
+            data = self._new_data(type_ or "D", int(self._num(val1)))
+        elif method == "COPY":
+            data = np.array(self._array(val1), dtype=dtype).ravel(order="F")
+        elif method == "LINK":
+            parent = self._get(val1)
+            data = parent.data[:, int(self._num(val2)) - 1]
+        elif method == "IMPORT":
+            if val1.upper() == "APDL":
+                data = np.array(self._params[val2.upper()], dtype=dtype)
+            elif val1.upper() == "FULL":
+                data = self._import_full(val2, val3, vector=True).astype(dtype)
+            else:
+                raise MapdlRuntimeError(f"Unsupported import format {val1}.")
+        else:
+            raise MapdlRuntimeError(f"Unsupported *VEC method {method}.")
+        self._store(name, _LocalObj("VEC", data))
+
+    def _cmd_dmat(self, name, type_="D", method="ALLOC", val1="", val2="", val3="", *args):
+        method = method.upper()
+        dtype = LOCAL_TYPES[type_.strip("'").upper() or "D"]
+        if method == "ALLOC":
+            data = self._new_data(type_ or "D", (int(self._num(val1)), int(self._num(val2))))
+        elif method == "COPY":
+            source = self._get(val1)
+            data = source.data.toarray() if source.kind == "SMAT" else source.data
+            if val2.upper().startswith("TRANS"):
+                data = data.T
+            data = np.array(data, dtype=dtype, order="F")
+        else:
+            raise MapdlRuntimeError(f"Unsupported *DMAT method {method}.")
+        self._store(name, _LocalObj("DMAT", data))
+
+    def _cmd_smat(self, name, type_="D", method="ALLOC", val1="", val2="", val3="", val4="", *a):
+        from scipy import sparse
+
+        method = method.upper()
+        dtype = LOCAL_TYPES[type_.strip("'").upper() or "D"]
+        sym = False
+        if method == "ALLOC" and val1.upper() == "CSR":
+            indptr = self._array(val2).astype(np.int64) - 1
+            indices = self._array(val3).astype(np.int64) - 1
+            values = self._array(val4).astype(dtype)
+            sym = bool(a) and a[0].upper() == "TRUE"
+            n = indptr.size - 1
+            data = sparse.csr_matrix((values, indices, indptr), shape=(n, n))
+            if sym:
+                data = data + sparse.triu(data, k=1).T
+        elif method == "COPY":
+            source = self._get(val1)
+            sym = source.sym
+            data = sparse.csr_matrix(source.data, dtype=dtype)
+            if val2.upper().startswith("TRANS"):
+                data = data.T.tocsr()
+        elif method == "IMPORT" and val1.upper() == "FULL":
+            data, sym = self._import_full(val2, val3)
+            data = data.astype(dtype)
+        else:
+            raise MapdlRuntimeError(f"Unsupported *SMAT method {method}.")
+        self._store(name, _LocalObj("SMAT", data.tocsr(), sym))
+
+    def _import_full(self, fname, item, vector=False):
+        from scipy import sparse
+
+        from ansys.math.core.full import FullFile
+
+        path = os.path.join(self.directory, fname.strip("'"))
+        if not os.path.isfile(path):
+            raise MapdlRuntimeError(f"File {fname} not found in {self.directory}.")
+        try:
+            with FullFile(path) as full:
+                if not vector:
+                    mat = full.matrix(item)
+                    return mat + sparse.triu(mat, k=1).T, True
+                if item.upper() != "RHS":
+                    raise NotImplementedError(f"Reading the {item} vector is not supported.")
+                return full.rhs()
+        except (NotImplementedError, ValueError) as err:
+            raise MapdlRuntimeError(str(err)) from None
+
+    def _cmd_free(self, name="ALL", *args):
+        if name.upper() == "ALL":
+            self._objects.clear()
+        else:
+            self._objects.pop(name.upper(), None)
+
+    def _cmd_init(self, name, method="ZERO", val1="", val2="", *args):
+        obj = self._get(name)
+        method = method.upper()
+        if obj.kind == "SMAT":
+            raise MapdlRuntimeError("*INIT is not supported for sparse matrices.")
+        data = obj.data
+        if method == "ZERO":
+            data[...] = 0
+        elif method == "CONST":
+            value = self._num(val1)
+            if np.iscomplexobj(data):
+                value = value + 1j * self._num(val2)
+            data[...] = value
+        elif method == "RAND":
+            if np.iscomplexobj(data):
+                data[...] = self._rng.random(data.shape) + 1j * self._rng.random(data.shape)
+            else:
+                data[...] = self._rng.random(data.shape)
+        elif method == "DIAG":
+            np.fill_diagonal(data, self._num(val1))
+        else:
+            raise MapdlRuntimeError(f"Unsupported *INIT method {method}.")
+
+    def _operand(self, name):
+        return self._get(name).data
+
+    def _cmd_axpy(self, vr, vi, m1, wr, wi, m2, *args):
+        target = self._get(m2)
+        value = self._num(vr) + 1j * self._num(vi) if self._num(vi) else self._num(vr)
+        weight = self._num(wr) + 1j * self._num(wi) if self._num(wi) else self._num(wr)
+        source = self._operand(m1)
+        if target.kind == "SMAT":
+            target.data = (weight * target.data + value * source).tocsr()
+            target.sym = target.sym and self._get(m1).sym
+        else:
+            result = weight * target.data + value * source
+            target.data[...] = result
+
+    def _cmd_scal(self, name, val1, val2="", *args):
+        obj = self._get(name)
+        if val1.upper() in self._objects:
+            scale = self._operand(val1)
+            if obj.kind == "SMAT":
+                from scipy import sparse
+
+                obj.data = (obj.data @ sparse.diags(scale)).tocsr()
+                obj.sym = False
+            elif obj.data.ndim == 2:
+                obj.data[...] = obj.data * scale[np.newaxis, :]
+            else:
+                obj.data[...] = obj.data * scale
+            return
+        value = self._num(val1) + 1j * self._num(val2) if self._num(val2) else self._num(val1)
+        if obj.kind == "SMAT":
+            obj.data = (obj.data * value).tocsr()
+        else:
+            obj.data[...] = obj.data * value
+
+    def _cmd_mult(self, m1, t1, m2, t2, m3, *args):
+        from scipy import sparse
+
+        left = self._operand(m1)
+        right = self._operand(m2)
+        if t1.upper().startswith("TRANS"):
+            left = left.T
+        if t2.upper().startswith("TRANS"):
+            right = right.T
+        if right.ndim == 1 and left.ndim == 1:
+            result = np.outer(left, right)
+        else:
+            if left.ndim == 1:
+                left = left[np.newaxis, :]
+            result = left @ right
+        if sparse.issparse(result):
+            result = result.toarray()
+        result = np.asarray(result)
+
+        existing = self._objects.get(m3.upper())
+        if existing is not None and existing.kind != "SMAT" and existing.data.shape == result.shape:
+            existing.data[...] = result
+        elif result.ndim == 1:
+            self._store(m3, _LocalObj("VEC", np.array(result)))
+        else:
+            self._store(m3, _LocalObj("DMAT", np.asfortranarray(result)))
+
+    def _cmd_dot(self, v1, v2, par, par2="", conj="", *args):
+        a = self._operand(v1)
+        b = self._operand(v2)
+        if conj.upper() in ("TRUE", "YES", "1"):
+            a = np.conj(a)
+        value = np.dot(a, b)
+        self._params[par.upper()] = float(np.real(value))
+        if par2:
+            self._params[par2.upper()] = float(np.imag(value))
+
+    def _cmd_nrm(self, name, nrmtype="NRM2", par="", normalize="", *args):
+        obj = self._get(name)
+        data = obj.data
+        nrmtype = nrmtype.upper() or "NRM2"
+        if obj.kind == "SMAT":
+            data = data.toarray()
+        if nrmtype == "NRM1":
+            value = np.abs(data).sum()
+        elif nrmtype == "NRMINF":
+            value = np.abs(data).max()
+        else:
+            value = np.sqrt((np.abs(data) ** 2).sum())
+        self._params[par.upper()] = float(value)
+        if normalize.upper() in ("YES", "TRUE", "1") and value:
+            obj.data[...] = obj.data / value
+
+    def _cmd_remove(self, name, val1, val2="", val3="COL", *args):
+        obj = self._get(name)
+        first = int(self._num(val1)) - 1
+        last = int(self._num(val2 or val1))
+        if obj.data.ndim == 1:
+            obj.data = np.delete(obj.data, np.s_[first:last])
+        else:
+            axis = 0 if val3.upper() == "ROW" else 1
+            obj.data = np.asfortranarray(np.delete(obj.data, np.s_[first:last], axis=axis))
+
+    def _cmd_hprod(self, a, b, c, *args):
+        self._store(c, _LocalObj("VEC", self._operand(a) * self._operand(b)))
+
+    def _cmd_kron(self, a, b, c, *args):
+        left = self._operand(a)
+        right = self._operand(b)
+        kind = "VEC" if left.ndim == right.ndim == 1 else "DMAT"
+        if kind == "DMAT":
+            left = left.reshape(left.shape[0], -1)
+            right = right.reshape(right.shape[0], -1)
+        result = np.kron(left, right)
+        self._store(c, _LocalObj(kind, np.asfortranarray(result)))
+
+    def _cmd_comp(self, name, algo="SVD", thresh="", sig="", v="", *args):
+        from scipy import linalg, sparse
+
+        obj = self._get(name)
+        algo = algo.upper()
+        data = obj.data
+        if algo == "SPARSE":
+            threshold = self._num(thresh, 1e-16)
+            dense = np.array(data)
+            dense[np.abs(dense) <= threshold * np.abs(dense).max()] = 0
+            self._store(name, _LocalObj("SMAT", sparse.csr_matrix(dense)))
+        elif algo == "MGS":
+            threshold = self._num(thresh, 1e-14)
+            columns = []
+            for j in range(data.shape[1]):
+                col = np.array(data[:, j])
+                ref = np.linalg.norm(col)
+                for q in columns:
+                    col -= np.vdot(q, col) * q
+                nrm = np.linalg.norm(col)
+                if ref and nrm > threshold * ref:
+                    columns.append(col / nrm)
+            result = np.column_stack(columns) if columns else data[:, :0]
+            self._store(name, _LocalObj("DMAT", np.asfortranarray(result)))
+        elif algo == "SVD":
+            threshold = self._num(thresh, 1e-7)
+            u, s, vh = linalg.svd(data, full_matrices=False)
+            keep = s > threshold * s[0] if s.size else s > 0
+            self._store(name, _LocalObj("DMAT", np.asfortranarray(u[:, keep])))
+            if sig:
+                self._store(sig, _LocalObj("VEC", s[keep]))
+            if v:
+                self._store(v, _LocalObj("DMAT", np.asfortranarray(vh[keep].T)))
+        else:
+            raise MapdlRuntimeError(f"Unsupported *COMP algorithm {algo}.")
+
+    def _cmd_print(self, name, *args):
+        return f"{name}:\n{self._operand(name)}"
+
+    def _cmd_lsengine(self, algo, name, mat, option="", *args):
+        self._store(name, _LocalObj("SOLVER", {"algo": algo.upper(), "mat": mat.upper()}))
+
+    def _cmd_lsfactor(self, name, *args):
+        from scipy import linalg, sparse
+        from scipy.sparse import linalg as splinalg
+
+        engine = self._get(name).data
+        obj = self._get(engine["mat"])
+        if obj.kind == "SMAT":
+            engine["lu"] = splinalg.splu(sparse.csc_matrix(obj.data))
+            engine["sparse"] = True
+        else:
+            lu, piv = linalg.lu_factor(obj.data)
+            # LAPACK factorizes the matrix in place
+            obj.data[...] = lu
+            engine["lu"] = (obj.data, piv)
+            engine["sparse"] = False
+
+    def _cmd_lsbac(self, name, rhs, sol, *args):
+        from scipy import linalg
+
+        engine = self._get(name).data
+        b = self._operand(rhs)
+        if engine["sparse"]:
+            x = engine["lu"].solve(np.asarray(b))
+        else:
+            x = linalg.lu_solve(engine["lu"], b)
+        kind = "VEC" if b.ndim == 1 else "DMAT"
+        existing = self._objects.get(sol.upper())
+        if existing is not None and existing.data.shape == x.shape and existing.data is not b:
+            existing.data[...] = x
+        else:
+            self._store(sol, _LocalObj(kind, np.asfortranarray(x)))
+
+    def _cmd_modopt(self, method="LANB", nmode="", freqb="", freqe="", cpxmod="", *args):
+        self._modopt = (method.upper(), int(self._num(nmode)), freqb, freqe, cpxmod)
+
+    def _cmd_eig(self, kname, mname, cname, evname, phiname="", *args):
+        from scipy import sparse
+
+        method, nmode, freqb, freqe, _ = self._modopt
+        k = self._get(kname)
+        m = self._get(mname)
+        c = self._get(cname) if cname else None
+        # sparse operands are solved with shift-invert iterations, dense ones with LAPACK
+        dense = any(obj.kind != "SMAT" for obj in (k, m, c) if obj is not None)
+        kd, md = (np.array(obj.data) if dense else obj.data for obj in (k, m))
+        fmin = self._num(freqb)
+        fmax = self._num(freqe, np.inf) or np.inf
+        # shift at the lower bound of the window, or below the lowest eigenvalue
+        sigma = (2 * np.pi * fmin) ** 2 if fmin > 0 else -1.0
+        lam_max = (2 * np.pi * fmax) ** 2
+
+        def covered(lam):
+            # all the eigenvalues of the window are found, or enough of them
+            freq = np.sqrt(np.abs(lam)) / (2 * np.pi)
+            inside = np.count_nonzero((np.real(freq) >= fmin) & (np.real(freq) <= fmax))
+            return inside >= nmode or sigma + np.abs(lam - sigma).max() >= lam_max
+
+        if c is not None:
+            cd = np.array(c.data) if dense else c.data
+            n = kd.shape[0]
+            if dense:
+                a = np.block([[np.zeros((n, n)), np.eye(n)], [-kd, -cd]])
+                b = np.block([[np.eye(n), np.zeros((n, n))], [np.zeros((n, n)), md]])
+            else:
+                eye = sparse.identity(n, format="csr")
+                a = sparse.bmat([[None, eye], [-kd, -cd]], format="csc")
+                b = sparse.bmat([[eye, None], [None, md]], format="csc")
+            lam, vec = _eig_pairs(
+                a, b, False, 2 * nmode, 0.0, lambda lam: np.count_nonzero(lam.imag >= 0) >= nmode
+            )
+            order = np.argsort(np.abs(lam))
+            lam, vec = lam[order], vec[:n, order]
+            keep = np.imag(lam) >= 0
+            ev = (lam[keep] / (2 * np.pi))[:nmode]
+            phi = vec[:, keep][:, :nmode]
+        elif method == "UNSYM":
+            lam, vec = _eig_pairs(kd, md, False, nmode, sigma, covered)
+            order = np.argsort(np.abs(lam))
+            lam, vec = lam[order], vec[:, order]
+            ev = np.sqrt(lam.astype(complex)) / (2 * np.pi)
+            keep = (np.real(ev) >= fmin) & (np.real(ev) <= fmax)
+            ev, phi = ev[keep][:nmode], vec[:, keep][:, :nmode]
+        else:
+            lam, vec = _eig_pairs(kd, md, True, nmode, sigma, covered)
+            order = np.argsort(lam)
+            lam, vec = lam[order], vec[:, order]
+            freq = np.sqrt(np.abs(lam)) / (2 * np.pi)
+            keep = (freq >= fmin) & (freq <= fmax)
+            ev, phi = freq[keep][:nmode], vec[:, keep][:, :nmode]
+
+        self._store(evname, _LocalObj("VEC", np.array(ev)))
+        if phiname:
+            # as MAPDL, fill an allocated matrix without resizing it
+            target = self._objects.get(phiname.strip().upper())
+            if (
+                target is not None
+                and target.data.ndim == 2
+                and target.data.shape[0] == phi.shape[0]
+                and target.data.shape[1] >= phi.shape[1]
+            ):
+                data = np.zeros(target.data.shape, dtype=np.result_type(target.data, phi))
+                data[:, : phi.shape[1]] = phi
+                target.data = np.asfortranarray(data)
+            else:
+                self._store(phiname, _LocalObj("DMAT", np.asfortranarray(phi)))
+
+
+def _eig_pairs(a, b, hermitian, nev, sigma, done):
+    """Return eigenpairs of the pencil ``(a, b)``.
+
+    For sparse matrices, the ``nev`` eigenpairs closest to ``sigma`` are
+    computed with shift-invert ARPACK iterations, and ``nev`` is doubled
+    until ``done`` accepts the eigenvalues found. Dense matrices, and sparse
+    ones whose eigenpairs are almost all needed, are solved with LAPACK.
+    """
+    from scipy import linalg, sparse
+    from scipy.sparse import linalg as splinalg
+
+    if sparse.issparse(a):
+        solve = splinalg.eigsh if hermitian else splinalg.eigs
+        while 0 < nev < a.shape[0] - 1:
+            lam, vec = solve(a.tocsc(), k=nev, M=b.tocsc(), sigma=sigma)
+            if done(lam):
+                return lam, vec
+            nev *= 2
+        a, b = a.toarray(), b.toarray()
+    return linalg.eigh(a, b) if hermitian else linalg.eig(a, b)
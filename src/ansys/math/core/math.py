@@ -23,10 +23,14 @@
 """Contains the Math classes, allowing for math operations within
 PyAnsys Math from Python."""
 
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
+import hashlib
 import os
 import string
 from warnings import warn
+import weakref
 
 from ansys.api.mapdl.v0 import ansys_kernel_pb2 as anskernel
 from ansys.api.mapdl.v0 import mapdl_pb2 as pb_types
@@ -47,6 +51,9 @@ from ansys.mapdl.core.parameters import interp_star_status
 from ansys.tools.common.versioning import requires_version, server_meets_version
 import numpy as np
 
+from ansys.math.core.full import MATRIX_ITEMS, VECTOR_ITEMS, FullData, FullFile
+from ansys.math.core.instrument import Profile, RoundTripError, Stats, _get_instrumentation
+
 MYCTYPE = {
     np.int32: "I",
     np.int64: "L",
@@ -59,6 +66,12 @@ MYCTYPE = {
 
 NP_VALUE_TYPE = {value: key for key, value in ANSYS_VALUE_TYPE.items()}
 
+# single precision counterpart of the double precision types
+SINGLE_PRECISION = {
+    np.double: np.single,
+    np.complex128: np.complex64,
+}
+
 # for windows LONG vs INT32
 if os.name == "nt":
     NP_VALUE_TYPE[np.intc] = 1
@@ -123,6 +136,21 @@ def list_allowed_dtypes():
 class AnsMath:
     """Provides the common class for abstract math objects.
 
+    Parameters
+    ----------
+    mapdl : ansys.mapdl.core.Mapdl, optional
+        MAPDL instance. The default is ``None``, in which case a MAPDL
+        instance is launched, or a local backend is created.
+    backend : str, optional
+        Backend used when no MAPDL instance is given. The options are
+        ``"mapdl"``, which launches a MAPDL instance, and ``"local"``, which
+        runs the AnsMath operations in the Python process with NumPy and
+        SciPy, see :class:`ansys.math.core.local.LocalMapdl`. The default is
+        ``"mapdl"``.
+    **kwargs : dict, optional
+        Keyword arguments given to ``ansys.mapdl.core.launch_mapdl``, or to
+        the local backend.
+
     Examples
     --------
     Create an instance.
@@ -130,6 +158,10 @@ class AnsMath:
     >>> import ansys.math.core.math as pymath
     >>> mm = pymath.AnsMath()
 
+    Create an instance running in the Python process.
+
+    >>> mm = pymath.AnsMath(backend="local")
+
     Add vectors.
 
     >>> v1 = mm.ones(10)
@@ -144,13 +176,181 @@ class AnsMath:
 
     """
 
-    def __init__(self, mapdl=None, **kwargs):
+    def __init__(self, mapdl=None, backend="mapdl", **kwargs):
         """Initiate a common class for abstract math object."""
         if mapdl is None:
-            mapdl = launch_mapdl(**kwargs)
+            if backend == "local":
+                from ansys.math.core.local import LocalMapdl
+
+                mapdl = LocalMapdl(**kwargs)
+            elif backend == "mapdl":
+                mapdl = launch_mapdl(**kwargs)
+            else:
+                raise ValueError(
+                    f"Invalid backend '{backend}'. The options are 'mapdl' and 'local'."
+                )
 
         self._mapdl = mapdl
 
+    @property
+    def solver_cache(self):
+        """Cache of the factorized solvers of this MAPDL instance.
+
+        The cache is shared by all the AnsMath instances connected to the same
+        MAPDL instance. Use its ``maxsize`` attribute to set the maximum number
+        of factorizations kept in the MAPDL memory.
+
+        Examples
+        --------
+        >>> mm.solver_cache.maxsize = 4
+        >>> solver = mm.factorize(k)
+        >>> solver is mm.factorize(k)
+        True
+
+        """
+        return _get_solver_cache(self._mapdl)
+
+    @property
+    def upload_cache(self):
+        """Cache of the files uploaded to this MAPDL instance.
+
+        The cache is shared by all the AnsMath instances connected to the same
+        MAPDL instance. A local file is uploaded again only when its content
+        changes.
+
+        Examples
+        --------
+        >>> k = mm.stiff(fname="PRSMEMB.full")
+        >>> m = mm.mass(fname="PRSMEMB.full")  # not uploaded again
+        >>> mm.upload_cache.uploads
+        1
+
+        The cache assumes that MAPDL does not rewrite the uploaded files,
+        which are then read in Python by the ``asarray`` loads. Invalidate a
+        file after a solve that rewrites it.
+
+        >>> mapdl.solve()
+        >>> mm.upload_cache.discard("file.full")
+
+        """
+        return _get_upload_cache(self._mapdl)
+
+    @contextmanager
+    def track(self, *exporters):
+        """Count the calls made to MAPDL.
+
+        The commands, parameter reads and data transfers made within the
+        context are counted, with their latency and the number of bytes
+        transferred. This includes the calls made by other AnsMath instances
+        connected to the same MAPDL instance.
+
+        Parameters
+        ----------
+        *exporters : callable, optional
+            Functions called with the statistics when the context exits,
+            including on errors, such as :class:`ansys.math.core.instrument.LogExporter` or
+            :class:`ansys.math.core.instrument.JsonExporter`.
+
+        Yields
+        ------
+        ansys.math.core.instrument.Stats
+            Statistics of the calls, updated until the context exits.
+
+        Examples
+        --------
+        >>> with mm.track() as stats:
+        ...     mm.ones(10).dot(mm.ones(10))
+        >>> stats.round_trips
+        8
+        >>> stats.calls["run"].count
+        7
+
+        """
+        try:
+            with _get_instrumentation(self._mapdl).track(Stats()) as stats:
+                yield stats
+        finally:
+            for exporter in exporters:
+                exporter(stats)
+
+    @contextmanager
+    def expect_round_trips(self, max=None, transfers=None):
+        """Check the number of calls made to MAPDL within a block of code.
+
+        This is intended for performance regression tests, to detect the
+        changes adding calls, such as one call per item of a vector.
+
+        Parameters
+        ----------
+        max : int, optional
+            Maximum number of calls to MAPDL. The default is ``None``, in
+            which case the number of calls is not checked.
+        transfers : int, optional
+            Maximum number of calls transferring a vector or a matrix. The
+            default is ``None``, in which case the number of transfers is
+            not checked.
+
+        Yields
+        ------
+        ansys.math.core.instrument.Stats
+            Statistics of the calls.
+
+        Raises
+        ------
+        ansys.math.core.instrument.RoundTripError
+            If the block makes more calls or transfers than expected.
+
+        Examples
+        --------
+        >>> k = mm.stiff()
+        >>> with mm.expect_round_trips(max=3):
+        ...     k.shape
+
+        """
+        with self.track() as stats:
+            yield stats
+
+        for value, limit, what in (
+            (stats.round_trips, max, "round trips"),
+            (stats.transfers, transfers, "transfers"),
+        ):
+            if limit is not None and value > limit:
+                raise RoundTripError(
+                    f"Expected at most {limit} {what} to MAPDL, got {value}.\n{stats.summary()}"
+                )
+
+    @contextmanager
+    def profile(self, size=65536):
+        """Record the calls made to MAPDL with the code causing them.
+
+        Each call made within the context is recorded with the line of code
+        calling AnsMath, the AnsMath method, and the APDL command, so that
+        the code making the most calls can be found.
+
+        Parameters
+        ----------
+        size : int, optional
+            Maximum number of calls kept. When more calls are made, the
+            oldest ones are dropped. The default is ``65536``.
+
+        Yields
+        ------
+        ansys.math.core.instrument.Profile
+            Calls recorded, which can be reported or exported to the Chrome
+            trace and speedscope formats.
+
+        Examples
+        --------
+        >>> with mm.profile() as profile:
+        ...     vec = mm.ones(10)
+        ...     values = [vec[i] for i in range(10)]
+        >>> print(profile.report(by=("site", "method")))
+        >>> profile.to_speedscope("ansmath.speedscope.json")
+
+        """
+        with _get_instrumentation(self._mapdl).track(Profile(size)) as profile:
+            yield profile
+
     @property
     def _server_version(self):
         """Version of MAPDL which is running in the background."""
@@ -181,10 +381,12 @@ class AnsMath:
         """
         if mat is not None:
             if isinstance(mat, AnsMathObj):
+                self.solver_cache.discard(mat)
                 self._mapdl.run(f"*FREE,{mat.id}", mute=True)
             else:
                 raise TypeError("The object to delete needs to be an AnsMath object.")
         else:
+            self.solver_cache.clear(free=False)
             self._mapdl.run("*FREE,ALL", mute=True)
 
     def __repr__(self):
@@ -521,7 +723,8 @@ class AnsMath:
             * ``"K_IM"``: Imaginary part of the stiffness matrix.
         asarray : bool, optional
             Whether to return a SciPy array rather than an AnsMath matrix.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the matrix is read without MAPDL.
 
         Returns
         -------
@@ -583,6 +786,12 @@ class AnsMath:
                 "array is not supported."
             )
 
+        if asarray and mat_id.upper() in ("STIFF", "MASS", "DAMP"):
+            array = self._read_full(fname, mat_id)
+            if array is not None:
+                return array.astype(dtype)
+            fname = self._load_file(fname)
+
         self._mapdl.run(f"*SMAT,{name},{dtype_},IMPORT,FULL,{fname},{mat_id}", mute=True)
         ans_sparse_mat = AnsSparseMat(name, self._mapdl)
         if asarray:
@@ -599,10 +808,49 @@ class AnsMath:
         If in not-local:
             Check if the file exists locally or in the working directory, if not,
             it will raise a FileNotFound exception.
-            If the file is local, it will be uploaded.
+            If the file is local, it will be uploaded, unless the same content
+            has already been uploaded. See :attr:`AnsMath.upload_cache`.
 
         """
-        return load_file(self._mapdl, fname)
+        if self._mapdl._local or not os.path.isfile(fname):
+            return load_file(self._mapdl, fname)
+        return self.upload_cache.load(fname)
+
+    def _read_full(self, fname, mat_id):
+        """Read a matrix or the load vector of a FULL file in Python.
+
+        The file is read without MAPDL when it is accessible from Python,
+        and it is not superseded by a different file of the MAPDL working
+        directory.
+
+        Returns
+        -------
+        scipy.sparse.csr_matrix or numpy.ndarray or None
+            Matrix or vector, or ``None`` if the file must be read by MAPDL.
+
+        """
+        return self._read_full_items(fname, [mat_id.upper()]).get(mat_id.upper())
+
+    def _full_path(self, fname):
+        """Return the path of a FULL file to read in Python, or ``None``.
+
+        The file must be accessible from Python, and it must not be
+        superseded by a different file of the MAPDL working directory. A
+        file whose content was uploaded through :attr:`AnsMath.upload_cache`
+        is the MAPDL copy until it is discarded from the cache.
+
+        """
+        base_fname = os.path.basename(fname)
+        directory = getattr(self._mapdl, "directory", None)
+        if self._mapdl._local and directory and os.path.isfile(os.path.join(directory, base_fname)):
+            return os.path.join(directory, base_fname)
+        elif not os.path.isfile(fname):
+            return None
+        elif self.upload_cache.holds(fname):
+            return fname
+        elif base_fname in self._mapdl.list_files():
+            return None
+        return fname
 
     def stiff(
         self, dtype=np.double, name=None, fname="file.full", asarray=False
@@ -622,7 +870,8 @@ class AnsMath:
             Name of the file to read the matrix from. The default is ``"file.full"``.
         asarray : bool, optional
             Whether to return a SciPy array rather than an AnsMath matrix.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the matrix is read without MAPDL.
 
         Returns
         -------
@@ -642,7 +891,8 @@ class AnsMath:
         <60x60 sparse matrix of type '<class 'numpy.float64'>'
             with 1734 stored elements in Compressed Sparse Row (CSR) format>
         """
-        fname = self._load_file(fname)
+        if not asarray:
+            fname = self._load_file(fname)
         return self.load_matrix_from_file(dtype, name, fname, "STIFF", asarray)
 
     def mass(
@@ -663,7 +913,8 @@ class AnsMath:
             Name of the file to read the matrix from. The default is ``"file.full"``.
         asarray : bool, optional
             Whether to return a SciPy array rather than an AnsMath matrix.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the matrix is read without MAPDL.
 
         Returns
         -------
@@ -686,7 +937,8 @@ class AnsMath:
         <60x60 sparse matrix of type '<class 'numpy.float64'>'
             with 1734 stored elements in Compressed Sparse Row (CSR) format>.
         """
-        fname = self._load_file(fname)
+        if not asarray:
+            fname = self._load_file(fname)
         return self.load_matrix_from_file(dtype, name, fname, "MASS", asarray)
 
     def damp(
@@ -707,7 +959,8 @@ class AnsMath:
             Name of the file to read the matrix from. The default is ``"file.full"``.
         asarray : bool, optional
             Whether to return a SciPy array rather than an AnsMath matrix.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the matrix is read without MAPDL.
 
         Returns
         -------
@@ -731,7 +984,8 @@ class AnsMath:
             with 1734 stored elements in Compressed Sparse Row (CSR) format>.
 
         """
-        fname = self._load_file(fname)
+        if not asarray:
+            fname = self._load_file(fname)
         return self.load_matrix_from_file(dtype, name, fname, "DAMP", asarray)
 
     def get_vec(
@@ -761,7 +1015,8 @@ class AnsMath:
               If this vector ID is used, the default ``dtype`` is ``np.int32``.
         asarray : bool, optional
             Whether to return a NumPy array rather than an AnsMath vector.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the load vector is read without MAPDL.
 
         Returns
         -------
@@ -796,6 +1051,11 @@ class AnsMath:
         else:
             dtype = np.double
 
+        if asarray and mat_id.upper() == "RHS":
+            array = self._read_full(fname, mat_id)
+            if array is not None:
+                return array.astype(dtype, copy=False)
+
         fname = self._load_file(fname)
         self._mapdl.run(f"*VEC,{name},{MYCTYPE[dtype]},IMPORT,FULL,{fname},{mat_id}", mute=True)
         ans_vec = AnsVec(name, self._mapdl)
@@ -851,7 +1111,8 @@ class AnsMath:
             Name of the file to read the vector from. The default is ``"file.full"``.
         asarray : bool, optional
             Whether to return a NumPy array rather than an AnsMath vector.
-            The default is ``False``.
+            The default is ``False``. When ``True`` and the file is
+            accessible from Python, the load vector is read without MAPDL.
 
         Returns
         -------
@@ -865,9 +1126,121 @@ class AnsMath:
         AnsMath vector size 126
 
         """
-        fname = self._load_file(fname)
         return self.get_vec(dtype, name, fname, "RHS", asarray)
 
+    def load_full(self, fname="file.full", items=("STIFF", "MASS", "RHS"), asarray=False):
+        """Load several matrices and vectors from a FULL file at once.
+
+        The file is checked and, for a remote MAPDL instance, uploaded only
+        once, and all the items are imported with a single call to MAPDL.
+
+        Parameters
+        ----------
+        fname : str, optional
+            Name of the file to read. The default is ``"file.full"``.
+        items : sequence of str, optional
+            Items to load. The default is ``("STIFF", "MASS", "RHS")``.
+            Options are the matrices ``"STIFF"``, ``"MASS"``, ``"DAMP"``,
+            ``"GMAT"``, ``"K_RE"``, and ``"K_IM"``, and the vectors
+            ``"RHS"``, ``"GVEC"``, ``"BACK"``, and ``"FORWARD"``.
+        asarray : bool, optional
+            Whether to return SciPy and NumPy arrays rather than AnsMath
+            objects. The default is ``False``. When ``True``, the items
+            supported by :class:`ansys.math.core.full.FullFile` are read
+            without MAPDL if the file is accessible from Python, and the other
+            items are downloaded one after the other.
+
+        Returns
+        -------
+        ansys.math.core.full.FullData
+            Named tuple of the loaded items, with the lowercase item names
+            as fields. The items that are not loaded are ``None``.
+
+        Examples
+        --------
+        >>> full = mm.load_full("PRSMEMB.full", items=("STIFF", "MASS", "BACK"))
+        >>> full.stiff
+        AnsMath matrix 126 x 126
+        >>> full.back
+        AnsMath vector size 126
+
+        """
+        if isinstance(items, str):
+            items = (items,)
+        items = [item.upper() for item in items]
+        invalid = [item for item in items if item not in MATRIX_ITEMS + VECTOR_ITEMS]
+        if invalid:
+            raise ValueError(
+                f"Invalid FULL file items {invalid}. "
+                f"Only {', '.join(MATRIX_ITEMS + VECTOR_ITEMS)} are allowed."
+            )
+        if len(set(items)) != len(items):
+            raise ValueError("The FULL file items must be unique.")
+
+        loaded = {}
+        if asarray:
+            loaded.update(self._read_full_items(fname, items))
+
+        remaining = [item for item in items if item not in loaded]
+        if remaining:
+            self._mapdl._log.info(
+                "Call MAPDL to extract %s from the file %s.", ", ".join(remaining), fname
+            )
+            base_fname = self._load_file(fname)
+            handles = {}
+            commands = []
+            for item in remaining:
+                name = id_generator()
+                if item in MATRIX_ITEMS:
+                    commands.append(f"*SMAT,{name},D,IMPORT,FULL,{base_fname},{item}")
+                    handles[item] = AnsSparseMat(name, self._mapdl)
+                else:
+                    dtype = np.int32 if item in ("BACK", "FORWARD") else np.double
+                    commands.append(f"*VEC,{name},{MYCTYPE[dtype]},IMPORT,FULL,{base_fname},{item}")
+                    handles[item] = AnsVec(name, self._mapdl)
+
+            # the objects are deleted if the import or a download fails
+            temporaries = list(handles.values())
+            try:
+                _run_batch(self._mapdl, commands)
+                if asarray:
+                    # MAPDL serves the downloads of a session one at a time
+                    handles = {item: obj.asarray() for item, obj in handles.items()}
+                else:
+                    temporaries = []
+            finally:
+                if temporaries:
+                    _run_batch(self._mapdl, [f"*FREE,{obj.id}" for obj in temporaries])
+            loaded.update(handles)
+
+        return FullData(**{item.lower(): value for item, value in loaded.items()})
+
+    def _read_full_items(self, fname, items):
+        """Read the items of a FULL file that are supported in Python.
+
+        Returns
+        -------
+        dict
+            Arrays of the items read, by item name.
+
+        """
+        readable = [item for item in items if item in ("STIFF", "MASS", "DAMP", "RHS")]
+        fname = self._full_path(fname) if readable else None
+        if fname is None:
+            return {}
+
+        arrays = {}
+        try:
+            with FullFile(fname) as full:
+                for item in readable:
+                    try:
+                        arrays[item] = full.rhs() if item == "RHS" else full.matrix(item)
+                    except NotImplementedError as err:
+                        self._mapdl._log.debug("Reading %s with MAPDL: %s", item, err)
+        except NotImplementedError as err:
+            self._mapdl._log.debug("Reading %s with MAPDL: %s", fname, err)
+        return arrays
+
     def svd(self, mat, thresh="", sig="", v="", **kwargs):
         """Apply an SVD algorithm on a matrix.
 
@@ -905,6 +1278,7 @@ class AnsMath:
         >>> mm.svd(mat)
         """
         kwargs.setdefault("mute", True)
+        mat._modified()
         self._mapdl.run(f"*COMP,{mat.id},SVD,{thresh},{sig},{v}", **kwargs)
 
     def mgs(self, mat, thresh="", **kwargs):
@@ -931,6 +1305,7 @@ class AnsMath:
         >>> mm.mgs(mat)
         """
         kwargs.setdefault("mute", True)
+        mat._modified()
         self._mapdl.run(f"*COMP,{mat.id},MGS,{thresh}", **kwargs)
 
     def sparse(self, mat, thresh="", **kwargs):
@@ -945,6 +1320,7 @@ class AnsMath:
             value is ``1E-16``.
         """
         kwargs.setdefault("mute", True)
+        mat._modified()
         self._mapdl.run(f"*COMP,{mat.id},SPARSE,{thresh}", **kwargs)
 
     def eigs(
@@ -985,9 +1361,189 @@ class AnsMath:
         >>> a = mm.mat(k.nrow, nev)
         >>> ev = mm.eigs(nev, k, m, phi=a)
         """
-        if not fmin:
+        ev = self.vec()
+        self._eig(nev, k, m, c, ev, phi, algo, fmin, fmax, cpxmod)
+        return ev
+
+    def modal(
+        self,
+        k,
+        m,
+        nev=10,
+        fmin=None,
+        fmax=None,
+        c=None,
+        algo=None,
+        cpxmod=None,
+        phi=None,
+        guess=None,
+        tol=1e-6,
+    ):
+        """Solve an eigenproblem and return its frequencies and modes.
+
+        Unlike :func:`AnsMath.eigs`, the mode shapes matrix is allocated
+        automatically and the frequencies are retrieved as a NumPy array in
+        a single transfer.
+
+        The modes of a previous solve of a similar eigenproblem, for example
+        in a parametric sweep, can be given as a ``guess``. The eigenproblem
+        is then first projected on these modes (Rayleigh-Ritz method) and the
+        full solve is skipped when the residuals of all the projected
+        eigenpairs are below ``tol``.
+
+        Parameters
+        ----------
+        k : AnsMat
+            Stiffness matrix.
+        m : AnsMat
+            Mass matrix.
+        nev : int, optional
+            Number of modes to compute. When a frequency window is given,
+            this is the maximum number of modes to compute. The default
+            is ``10``.
+        fmin : float, optional
+            Lower end of the frequency window in Hz. It is also the shift
+            point of the first iteration of the ``"LANB"``, ``"SNODE"``, and
+            ``"SUBSP"`` eigensolvers, which target the modes closest above
+            it. The default is ``None``, in which case the lowest modes are
+            computed.
+        fmax : float, optional
+            Upper end of the frequency window in Hz. The default is ``None``,
+            in which case there is no upper bound.
+        c : AnsMat, optional
+            Damping matrix, which turns the eigenproblem into a damped
+            eigenproblem with complex frequencies and modes.
+        algo : str, optional
+            Eigensolver as a ``MODOPT`` method, such as ``"LANB"``,
+            ``"SNODE"``, or ``"SUBSP"``. The default is ``"LANB"`` for
+            symmetric matrices, ``"UNSYM"`` for unsymmetric matrices, and
+            ``"DAMP"`` when a damping matrix is given.
+        cpxmod : str, optional
+            Complex eigenmode key of ``MODOPT``.
+        phi : AnsDenseMat, optional
+            Dense matrix to place the modes into. The default is ``None``,
+            in which case a matrix of ``nev`` columns is allocated and
+            trimmed to the number of modes found. It is not used when the
+            full solve is skipped.
+        guess : AnsDenseMat, optional
+            Modes of a similar eigenproblem, with at least ``nev`` columns,
+            to start from. Only undamped symmetric eigenproblems can be
+            started from a guess. With a frequency window, the full solve
+            is skipped only when ``nev`` projected eigenpairs are found in
+            the window.
+        tol : float, optional
+            Relative residual norm :math:`\\|K \\phi - \\lambda M \\phi\\| /
+            \\|K \\phi\\|` below which the projected eigenpairs are accepted.
+            The default is ``1e-6``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Frequencies in Hz, which are complex for damped and unsymmetric
+            eigenproblems. There can be fewer than ``nev`` frequencies when
+            a frequency window is given.
+        AnsDenseMat
+            Modes stored as columns, with one column per frequency unless
+            ``phi`` is given.
+
+        Examples
+        --------
+        Compute the first ten modes of a model.
+
+        >>> k = mm.stiff(fname="PRSMEMB.full")
+        >>> m = mm.mass(fname="PRSMEMB.full")
+        >>> freqs, phi = mm.modal(k, m, nev=10)
+        >>> phi
+        AnsMath dense matrix (20000, 10)
+
+        Compute at most 20 modes between 100 Hz and 500 Hz.
+
+        >>> freqs, phi = mm.modal(k, m, nev=20, fmin=100, fmax=500)
+
+        Start from the modes of the previous stiffness matrix.
+
+        >>> k2 = mm.stiff(fname="PRSMEMB_2.full")
+        >>> freqs2, phi2 = mm.modal(k2, m, nev=10, guess=phi)
+
+        """
+        if guess is not None:
+            if c is not None:
+                raise ValueError("Damped eigenproblems cannot be started from a guess.")
+            result = self._warm_modal(k, m, guess, nev, fmin, fmax, tol)
+            if result is not None:
+                return result
+
+        allocate = phi is None
+        if allocate:
+            unsym = c is not None or not (k.sym() and m.sym())
+            name = id_generator()
+            self._mapdl.run(f"*DMAT,{name},{'Z' if unsym else 'D'},ALLOC,{k.nrow},{nev}", mute=True)
+            phi = AnsDenseMat(name, self._mapdl)
+
+        ev = self.vec()
+        self._eig(nev, k, m, c, ev, phi, algo, fmin, fmax, cpxmod)
+        freqs = ev.asarray()
+        commands = [f"*FREE,{ev.id}"]
+        if allocate and 0 < freqs.size < nev:
+            # trim the allocated matrix to the modes found in the window
+            commands.append(f"*REMOVE,{phi.id},{freqs.size + 1},{nev}")
+        _run_batch(self._mapdl, commands)
+        phi._modified()
+        return freqs, phi
+
+    def eig_residuals(self, k, m, freqs, phi):
+        """Compute the relative residual norms of eigenpairs.
+
+        The relative residual norm of the eigenpair :math:`(f_i, \\phi_i)` is
+        :math:`\\|K \\phi_i - \\lambda_i M \\phi_i\\| / \\|K \\phi_i\\|`, where
+        :math:`\\lambda_i = (2 \\pi f_i)^2`. The residuals of all the
+        eigenpairs are computed within MAPDL in a single block of commands.
+
+        Parameters
+        ----------
+        k : AnsMat
+            Stiffness matrix.
+        m : AnsMat
+            Mass matrix.
+        freqs : numpy.ndarray or AnsVec
+            Real frequencies in Hz.
+        phi : AnsDenseMat
+            Modes stored as columns. Only the first ``len(freqs)`` columns
+            are used.
+
+        Returns
+        -------
+        numpy.ndarray
+            Relative residual norm of each eigenpair.
+
+        Examples
+        --------
+        >>> freqs, phi = mm.modal(k, m, nev=1000)
+        >>> residuals = mm.eig_residuals(k, m, freqs, phi)
+        >>> residuals.max()
+        3.1e-12
+
+        """
+        if isinstance(freqs, AnsVec):
+            freqs = freqs.asarray()
+        lam = (2 * np.pi * np.asarray(freqs, dtype=np.double)) ** 2
+
+        kphi, mphi = id_generator(), id_generator()
+        residuals = self._eig_residuals(
+            kphi,
+            mphi,
+            lam,
+            [f"*MULT,{k.id},,{phi.id},,{kphi}", f"*MULT,{m.id},,{phi.id},,{mphi}"],
+        )
+        self._mapdl.run(f"*FREE,{kphi}", mute=True)
+        self._mapdl.run(f"*FREE,{mphi}", mute=True)
+        return residuals
+
+    def _eig(self, nev, k, m, c, ev, phi, algo, fmin, fmax, cpxmod):
+        """Set up the modal analysis options and solve the eigenproblem."""
+        if fmin is None:
             fmin = ""
-        if not fmax:
+        if fmax is None:
             fmax = ""
         if not cpxmod:
             cpxmod = ""
@@ -1003,14 +1559,113 @@ class AnsMath:
             cid = c.id
             algo = "DAMP"
 
-        self._mapdl.run("/SOLU", mute=True)
-        self._mapdl.run("antype,modal", mute=True)
-        self._mapdl.run(f"modopt,{algo},{nev},{fmin},{fmax},{cpxmod}", mute=True)
-        ev = self.vec()
-
         phistr = "" if not phi else phi.id
-        self._mapdl.run(f"*EIG,{k.id},{m.id},{cid},{ev.id},{phistr}", mute=True)
-        return ev
+        _run_batch(
+            self._mapdl,
+            [
+                "/SOLU",
+                "antype,modal",
+                f"modopt,{algo},{nev},{fmin},{fmax},{cpxmod}",
+                f"*EIG,{k.id},{m.id},{cid},{ev.id},{phistr}",
+            ],
+        )
+
+    def _warm_modal(self, k, m, guess, nev, fmin, fmax, tol, count=None):
+        """Return the projected eigenpairs if they have converged, else ``None``.
+
+        With an upper frequency bound, fewer than ``nev`` eigenpairs are
+        accepted only when they are as many as ``count``, the number of
+        modes found in the window by the last full solve.
+        """
+        freqs, modes, residuals = self._rayleigh_ritz(k, m, guess, nev, fmin, fmax)
+        complete = freqs.size == nev or (fmax is not None and freqs.size and freqs.size == count)
+        if complete and residuals.max() <= tol:
+            self._mapdl._log.info(
+                "Projected eigenpairs converged with a maximum residual of %g.",
+                residuals.max(),
+            )
+            return freqs, modes
+
+        self._mapdl._log.info("Projected eigenpairs did not converge.")
+        if modes is not None:
+            self.free(modes)
+        return None
+
+    def _rayleigh_ritz(self, k, m, basis, nev, fmin=None, fmax=None):
+        """Solve an eigenproblem projected on the columns of a dense matrix.
+
+        Returns the frequencies, the modes, and the relative residual norms
+        of the projected eigenpairs.
+        """
+        from scipy import linalg
+
+        kb, mb, kr, mr, kp, mp, modes = (id_generator() for _ in range(7))
+        _run_batch(
+            self._mapdl,
+            [
+                f"*MULT,{k.id},,{basis.id},,{kb}",
+                f"*MULT,{m.id},,{basis.id},,{mb}",
+                f"*MULT,{basis.id},TRANS,{kb},,{kr}",
+                f"*MULT,{basis.id},TRANS,{mb},,{mr}",
+            ],
+        )
+        kr_py = self._mapdl._mat_data(kr)
+        mr_py = self._mapdl._mat_data(mr)
+        lam, vec = linalg.eigh((kr_py + kr_py.T) / 2, (mr_py + mr_py.T) / 2)
+
+        freqs = np.sqrt(np.abs(lam)) / (2 * np.pi)
+        keep = np.ones(freqs.size, dtype=bool)
+        if fmin is not None:
+            keep &= freqs >= fmin
+        if fmax is not None:
+            keep &= freqs <= fmax
+        keep = np.flatnonzero(keep)[:nev]
+        if not keep.size:
+            for name in (kb, mb, kr, mr):
+                self._mapdl.run(f"*FREE,{name}", mute=True)
+            return freqs[keep], None, np.empty(0)
+
+        ritz = self.matrix(np.asfortranarray(vec[:, keep]))
+        residuals = self._eig_residuals(
+            kp,
+            mp,
+            lam[keep],
+            [
+                f"*MULT,{basis.id},,{ritz.id},,{modes}",
+                f"*MULT,{kb},,{ritz.id},,{kp}",
+                f"*MULT,{mb},,{ritz.id},,{mp}",
+            ],
+        )
+        for name in (kb, mb, kr, mr, kp, mp, ritz.id):
+            self._mapdl.run(f"*FREE,{name}", mute=True)
+        return freqs[keep], AnsDenseMat(modes, self._mapdl), residuals
+
+    def _eig_residuals(self, kphi, mphi, lam, commands=()):
+        """Return the relative residual norms of eigenpairs.
+
+        The residuals :math:`K \\phi - \\lambda M \\phi` of all the
+        eigenpairs are computed as a block, with the product of ``mphi`` by
+        the diagonal matrix of the eigenvalues. The ``commands`` that create
+        ``kphi`` and ``mphi`` are sent in the same block as the norms.
+        """
+        if not lam.size:
+            if commands:
+                _run_batch(self._mapdl, commands)
+            return np.empty(0)
+
+        diag = self.matrix(np.diag(lam))
+        res = id_generator()
+        commands = list(commands)
+        commands.extend(
+            [
+                f"*MULT,{mphi},,{diag.id},,{res}",
+                f"*AXPY,1,0,{kphi},-1,0,{res}",
+                f"*FREE,{diag.id}",
+            ]
+        )
+        knorm, rnorm = _column_norms(self._mapdl, [kphi, res], lam.size, commands)
+        self._mapdl.run(f"*FREE,{res}", mute=True)
+        return rnorm / np.where(knorm, knorm, 1.0)
 
     def dot(self, vec_a, vec_b):
         """Multiply two AnsMath vectors.
@@ -1088,7 +1743,16 @@ class AnsMath:
         """
         return obj1 - obj2
 
-    def factorize(self, mat, algo=None, inplace=True):
+    def factorize(
+        self,
+        mat,
+        algo=None,
+        inplace=True,
+        cache=True,
+        precision="double",
+        memory=None,
+        reorder=None,
+    ):
         """Factorize a matrix.
 
         Parameters
@@ -1096,14 +1760,27 @@ class AnsMath:
         mat : AnsMat
             AnsMath matrix.
         algo : str, optional
-            Factorization algorithm. Options are ``"LAPACK"`` and ``"DSP"``.
-            The default is ``"LAPACK"`` for dense matrices and ``"DSP"`` for
-            sparse matrices.
+            Factorization algorithm. Options are ``"LAPACK"``, ``"DSP"``,
+            and ``"DSS"``. The default is ``"LAPACK"`` for dense matrices and
+            ``"DSP"`` for sparse matrices.
         inplace : bool, optional
             Whether the factorization is performed on the input matrix
             rather than on a copy of this matrix. Performing factorization on
             a copy of this matrix would result in no changes to the input
             matrix. The default is ``True``.
+        cache : bool, optional
+            Whether to reuse the solver of a previous factorization of the
+            same matrix when the matrix has not been modified since. The
+            default is ``True``. See :attr:`AnsMath.solver_cache`.
+        precision : str, optional
+            Factorization precision. Options are ``"double"`` and ``"mixed"``.
+            The default is ``"double"``. See :func:`AnsSolver.factorize`.
+        memory : str, optional
+            Memory mode of the sparse solvers, ``"INCORE"`` or ``"OUTOFCORE"``.
+            The default lets the solver choose.
+        reorder : str, optional
+            Equation reordering scheme of the ``"DSP"`` solver, ``"SEQORDER"``
+            or ``"PARORDER"``. The default lets the solver choose.
 
         Returns
         -------
@@ -1120,11 +1797,113 @@ class AnsMath:
         >>> m3 = m2.copy()
         >>> mat = mm.factorize(m2)
 
+        Factorize in single precision and refine the solutions in double
+        precision.
+
+        >>> solver = mm.factorize(m3, precision="mixed")
+
         """
+        if cache:
+            return self.solver_cache.factorize(
+                mat,
+                algo=algo,
+                inplace=inplace,
+                precision=precision,
+                memory=memory,
+                reorder=reorder,
+            )
+
         solver = AnsSolver(id_generator(), self._mapdl)
-        solver.factorize(mat, algo=algo, inplace=inplace)
+        solver.factorize(
+            mat, algo=algo, inplace=inplace, precision=precision, memory=memory, reorder=reorder
+        )
         return solver
 
+    def solve(self, mat, b, x=None, algo=None, precision="double"):
+        """Solve a linear system, reusing a cached factorization of the matrix.
+
+        Parameters
+        ----------
+        mat : AnsMat
+            AnsMath matrix of the linear system.
+        b : AnsVec, AnsDenseMat, or numpy.ndarray
+            Right-hand side vector, or right-hand sides stored as columns.
+        x : AnsVec or AnsDenseMat, optional
+            AnsMath vector or dense matrix to place the solution into.
+        algo : str, optional
+            Factorization algorithm. Options are ``"LAPACK"`` and ``"DSP"``.
+            The default is ``"LAPACK"`` for dense matrices and ``"DSP"`` for
+            sparse matrices.
+        precision : str, optional
+            Factorization precision. Options are ``"double"`` and ``"mixed"``.
+            The default is ``"double"``.
+
+        Returns
+        -------
+        AnsVec or AnsDenseMat
+            Solution vector, which is identical to the ``x`` parameter if supplied.
+            See :func:`AnsSolver.solve` for solving several right-hand sides.
+
+        Examples
+        --------
+        Solve two load cases while factorizing the stiffness matrix once.
+
+        >>> k = mm.stiff()
+        >>> x1 = mm.solve(k, mm.ones(k.nrow))
+        >>> x2 = mm.solve(k, mm.rand(k.nrow))
+
+        """
+        return self.factorize(mat, algo=algo, precision=precision).solve(b, x)
+
+    def iterative_solver(
+        self, mat, method="CG", precond="jacobi", tol=1e-8, maxiter=None, restart=30
+    ):
+        """Create a matrix-free Krylov solver.
+
+        Iterative solvers do not factorize the matrix. They are an alternative
+        to :func:`AnsMath.factorize` when the factorization of a large sparse
+        matrix does not fit in memory.
+
+        Parameters
+        ----------
+        mat : AnsMat
+            AnsMath matrix of the linear system. The matrix is not modified.
+        method : str, optional
+            Krylov method. Options are ``"CG"`` for symmetric positive-definite
+            matrices, ``"MINRES"`` for symmetric indefinite matrices, and
+            ``"GMRES"`` for unsymmetric matrices. The default is ``"CG"``.
+        precond : str or AnsVec, optional
+            Preconditioner. Options are ``"jacobi"``, ``None``, or an AnsMath
+            vector containing the inverse of a diagonal preconditioner. The
+            default is ``"jacobi"``.
+        tol : float, optional
+            Relative tolerance on the residual norm. The default is ``1E-8``.
+        maxiter : int, optional
+            Maximum number of iterations. The default is the size of the matrix.
+        restart : int, optional
+            Number of iterations between restarts of the GMRES method. The
+            default is ``30``.
+
+        Returns
+        -------
+        AnsIterativeSolver
+            Iterative solver, exposing the convergence history of its last solve.
+
+        Examples
+        --------
+        >>> k = mm.stiff()
+        >>> solver = mm.iterative_solver(k, method="cg", tol=1e-10)
+        >>> x = solver.solve(mm.ones(k.nrow))
+        >>> solver.converged
+        True
+
+        """
+        from ansys.math.core.iterative import AnsIterativeSolver
+
+        return AnsIterativeSolver(
+            mat, method=method, precond=precond, tol=tol, maxiter=maxiter, restart=restart
+        )
+
     def norm(self, obj, order="nrm2"):
         """Return the norm of an AnsMath object.
 
@@ -1304,6 +2083,18 @@ class AnsMathObj:
         self.id = id_
         self._mapdl = mapdl
         self.type = dtype
+        self._revision = 0
+        self._parent = None
+
+    def _modified(self):
+        """Record that the content of this object has been modified.
+
+        This invalidates any cached factorization of this object, and of
+        the matrix it is a column of.
+        """
+        self._revision += 1
+        if self._parent is not None:
+            self._parent._modified()
 
     def __repr__(self):
         return f"AnsMath object {self.id}"
@@ -1331,6 +2122,7 @@ class AnsMathObj:
         return name
 
     def _init(self, method):
+        self._modified()
         self._mapdl.run(f"*INIT,{self.id},{method}", mute=True)
 
     def zeros(self):
@@ -1407,6 +2199,7 @@ class AnsMathObj:
         if not hasattr(obj, "id"):
             raise TypeError("The object to be added must be an AnsMath object.")
         self._mapdl._log.info("Call MAPDL to perform an AXPY operation.")
+        self._modified()
         self._mapdl.run(f"*AXPY,{val1},0,{obj.id},{val2},0,{self.id}", mute=True)
         return self
 
@@ -1487,6 +2280,7 @@ class AnsMathObj:
     def __imul__(self, val):
         mapdl_version = self._mapdl.version
         self._mapdl._log.info("Call MAPDL to scale the object")
+        self._modified()
 
         if isinstance(val, AnsVec):
             if mapdl_version < 23.2:  # pragma: no cover
@@ -1505,6 +2299,7 @@ class AnsMathObj:
         if val == 0:
             raise ZeroDivisionError("division by zero")
         self._mapdl._log.info("Call MAPDL to 1/scale the object.")
+        self._modified()
         self._mapdl.run(f"*SCAL,{self.id},{1/val}", mute=True)
         return self
 
@@ -1669,6 +2464,7 @@ class AnsMat(AnsMathObj):
     def __init__(self, id_, mapdl, type_=ObjType.DMAT):
         """Initiate an AnsMath matrix object."""
         AnsMathObj.__init__(self, id_, mapdl, type_)
+        self._sym = None
 
     @property
     def nrow(self) -> int:
@@ -1696,21 +2492,27 @@ class AnsMat(AnsMathObj):
     def sym(self) -> bool:
         """Return if the matrix is symmetric.
 
+        The result is cached until the matrix is modified through its handle.
+
         Returns
         -------
         bool
             ``True`` when this matrix is symmetric.
 
         """
+        if self._sym is not None and self._sym[0] == self._revision:
+            return self._sym[1]
 
         info = self._mapdl._data_info(self.id)
 
         if server_meets_version(self._mapdl._server_version, (0, 5, 0)):  # pragma: no cover
-            return info.mattype in [
+            sym = info.mattype in [
                 0,
                 1,
                 2,
             ]  # [UPPER, LOWER, DIAG] respectively
+            self._sym = (self._revision, sym)
+            return sym
 
         warn(
             "Call to ``sym`` method cannot evaluate if this matrix is symmetric "
@@ -1800,7 +2602,10 @@ class AnsMat(AnsMathObj):
         info = self._mapdl._data_info(self.id)
         dtype = ANSYS_VALUE_TYPE[info.stype]
         self._mapdl.run(f"*VEC,{name},{MYCTYPE[dtype]},LINK,{self.id},{num+1}", mute=True)
-        return AnsVec(name, self._mapdl)
+        vec = AnsVec(name, self._mapdl)
+        # the column shares the values of this matrix
+        vec._parent = self
+        return vec
 
     @property
     def T(self):
@@ -1911,12 +2716,65 @@ class AnsSparseMat(AnsMat):
 
 
 class AnsSolver(AnsMathObj):
-    """Provides the AnsMath solver class."""
+    """Provides the AnsMath solver class.
+
+    Attributes
+    ----------
+    precision : str
+        Factorization precision, either ``"double"`` or ``"mixed"``.
+    history : list of float
+        Relative residual norm after each step of the iterative refinement
+        of the last mixed precision solve.
+    converged : bool
+        Whether the iterative refinement of the last mixed precision solve
+        converged.
+    fallback : bool
+        Whether the solver has fallen back to a double precision
+        factorization because the iterative refinement stalled.
+    symmetric : bool
+        Whether the factorized matrix is symmetric, in which case the
+        sparse solvers factorize it as :math:`LDL^T` instead of :math:`LU`.
+
+    """
+
+    def __init__(self, id_, mapdl=None):
+        """Initiate an AnsMath solver object."""
+        AnsMathObj.__init__(self, id_, mapdl)
+        self._copy = None
+        self._matrix = None
+        self._fallback = None
+        self.precision = "double"
+        self.symmetric = False
+        self.history = []
+        self.converged = False
 
     def __repr__(self):
         return "AnsMath Linear Solver."
 
-    def factorize(self, mat, algo=None, inplace=True):
+    @property
+    def iterations(self):
+        """Number of refinement steps of the last mixed precision solve."""
+        return max(len(self.history) - 1, 0)
+
+    @property
+    def fallback(self):
+        """Whether the solver has fallen back to a double precision factorization."""
+        return self._fallback is not None
+
+    def _free(self):
+        """Delete the solver and its matrix copy, if any, within MAPDL."""
+        self._mapdl.run(f"*FREE,{self.id}", mute=True)
+        if self._copy is not None:
+            self._mapdl.run(f"*FREE,{self._copy.id}", mute=True)
+            self._copy = None
+        if self._fallback is not None:
+            self._fallback._free()
+            self._fallback = None
+        self._matrix = None
+
+    def factorize(
+        self, mat, algo=None, inplace=True, precision="double", memory=None, reorder=None
+    ):
         """Factorize a matrix.
 
         Perform the numerical factorization of a linear solver system: (:math:`A*x=b`).
@@ -1924,12 +2782,22 @@ class AnsSolver(AnsMathObj):
         .. warning:: By default, factorization modifies the input matrix ``mat``
            in place. This behavior can be changed using the ``inplace`` parameter.
 
+        With ``precision="mixed"``, a single precision copy of a double
+        precision dense matrix is factorized with LAPACK, which halves the
+        memory of the factors and speeds up the factorization. Each solve
+        then refines the single precision solution with double precision
+        residuals until it reaches double precision accuracy. If the
+        refinement stalls, for example because the matrix is too badly
+        conditioned, the solver falls back to a double precision
+        factorization. The input matrix is never modified in this mode.
+
         Parameters
         ----------
         mat : AnsMat
             AnsMath matrix.
         algo : str, optional
-            Factorization algorithm. Options are ``"LAPACK"`` and ``"DSP"``.
+            Factorization algorithm. Options are ``"LAPACK"``, ``"DSP"``
+            (distributed sparse solver), and ``"DSS"`` (MKL sparse solver).
             The default is ``"LAPACK"`` for dense matrices and ``"DSP"`` for
             sparse matrices.
         inplace : bool, optional
@@ -1937,6 +2805,19 @@ class AnsSolver(AnsMathObj):
             rather than on a copy of this matrix. Performing factorization on
             a copy of this matrix would result in no changes to the input
             matrix. The default is ``True``.
+        precision : str, optional
+            Factorization precision. Options are ``"double"`` and ``"mixed"``.
+            The default is ``"double"``. Matrices that are not double
+            precision dense matrices factorized with LAPACK are always
+            factorized in their own precision.
+        memory : str, optional
+            Memory mode of the sparse solvers. Options are ``"INCORE"``,
+            which keeps the factors in memory, and ``"OUTOFCORE"``, which
+            writes them to disk. The default lets the solver choose.
+        reorder : str, optional
+            Equation reordering scheme of the ``"DSP"`` solver. Options are
+            ``"SEQORDER"`` and ``"PARORDER"``. The default lets the solver
+            choose.
 
         Examples
         --------
@@ -1948,41 +2829,122 @@ class AnsSolver(AnsMathObj):
         >>> b = mm.ones(dim)
         >>> x = solver.solve(b)
 
+        Factorize in single precision and refine the solution.
+
+        >>> solver = mm.factorize(mm.rand(dim, dim), precision="mixed")
+        >>> x = solver.solve(b)
+        >>> solver.iterations, solver.history[-1]
+        (1, 4.3e-14)
+
+        Factorize a sparse stiffness matrix out-of-core.
+
+        >>> k = mm.stiff(fname="PRSMEMB.full")
+        >>> solver = mm.factorize(k, memory="OUTOFCORE")
+
         """
+        precision = precision.lower()
+        if precision not in ("double", "mixed"):
+            raise ValueError(f"Invalid precision '{precision}'. Options are 'double' and 'mixed'.")
+        algo = (algo or _default_algo(mat)).upper()
+        if memory:
+            memory = memory.upper()
+            if algo not in ("DSP", "DSS") or memory not in ("INCORE", "OUTOFCORE"):
+                raise ValueError(
+                    f"Invalid memory mode '{memory}' for the {algo} solver. Options are "
+                    "'INCORE' and 'OUTOFCORE' with the 'DSP' and 'DSS' solvers."
+                )
+        if reorder:
+            reorder = reorder.upper()
+            if algo != "DSP" or reorder not in ("SEQORDER", "PARORDER"):
+                raise ValueError(
+                    f"Invalid reordering '{reorder}' for the {algo} solver. Options are "
+                    "'SEQORDER' and 'PARORDER' with the 'DSP' solver."
+                )
+        if mat.type == ObjType.SMAT:
+            self.symmetric = mat.sym()
+
+        if precision == "mixed":
+            dtype = ANSYS_VALUE_TYPE[self._mapdl._data_info(mat.id).stype]
+            if mat.type == ObjType.DMAT and algo == "LAPACK" and dtype in SINGLE_PRECISION:
+                name = id_generator()
+                self._mapdl._log.info("Performing factorization in a single precision copy.")
+                self._mapdl.run(
+                    f"*DMAT,{name},{MYCTYPE[SINGLE_PRECISION[dtype]]},COPY,{mat.id}", mute=True
+                )
+                self._copy = AnsDenseMat(name, self._mapdl)
+                self._matrix = mat
+                self.precision = "mixed"
+                self._lsfactor(algo, name)
+                return
+
+            self._mapdl._log.info(
+                "Mixed precision requires a double precision dense matrix "
+                "factorized with LAPACK. Factorizing in the matrix precision."
+            )
+
         mat_id = mat.id
         if not inplace:
             self._mapdl._log.info("Performing factorization in a copy of the array.")
-            copy_mat = mat.copy()
-            mat_id = copy_mat.id
+            self._copy = mat.copy()
+            mat_id = self._copy.id
         else:
             self._mapdl._log.info(
                 "Performing factorization in place. This changes the input array."
             )
 
-        if not algo:
-            if mat.type == ObjType.DMAT:
-                algo = "LAPACK"
-            elif mat.type == ObjType.SMAT:
-                algo = "DSP"
+        self._lsfactor(algo, mat_id, memory, reorder)
+
+    def _lsfactor(self, algo, mat_id, memory=None, reorder=None):
+        """Create the solver engine of a matrix and factorize it.
+
+        The memory mode of the DSS solver is an option of its engine, while
+        the DSP solver is tuned with ``DSPOPTION``, which is reset once the
+        matrix is factorized.
+        """
+        engine = f"*LSENGINE,{algo},{self.id},{mat_id}"
+        if algo == "DSS" and memory:
+            engine += f",{memory}"
+        commands = [engine, f"*LSFACTOR,{self.id}"]
+        if algo == "DSP" and (memory or reorder):
+            commands.insert(0, f"DSPOPTION,{reorder or 'DEFAULT'},{memory or 'DEFAULT'}")
+            commands.append("DSPOPTION,DEFAULT,DEFAULT")
 
-        self._mapdl.run(f"*LSENGINE,{algo},{self.id},{mat_id}", mute=True)
         self._mapdl._log.info(f"Factorizing using the {algo} package.")
-        self._mapdl.run(f"*LSFACTOR,{self.id}", mute=True)
+        _run_batch(self._mapdl, commands)
 
-    def solve(self, b, x=None):
+    def solve(self, b, x=None, tol=1e-12, maxiter=10):
         """Solve a linear system.
 
+        Several right-hand sides can be solved at once by supplying them as the
+        columns of a dense matrix. All the columns are then solved with a single
+        back-substitution call.
+
+        With a mixed precision factorization, the solution is refined until
+        the relative residual norm :math:`\\|b - A x\\| / \\|b\\|` reaches
+        ``tol``. The refinement is considered stalled when a step does not
+        halve the residual norm, in which case the solver falls back to a
+        double precision factorization for this solve and all the next ones.
+
         Parameters
         ----------
-        b : AnsVec
-            AnsMath vector.
-        x : AnsVec, optional
-            AnsMath vector to place the solution into.
+        b : AnsVec, AnsDenseMat, or numpy.ndarray
+            AnsMath vector, AnsMath dense matrix whose columns are the
+            right-hand sides, or a one or two dimensional NumPy array, which is
+            uploaded to MAPDL once.
+        x : AnsVec or AnsDenseMat, optional
+            AnsMath vector or dense matrix to place the solution into.
+        tol : float, optional
+            Relative residual norm of the iterative refinement of a mixed
+            precision solve. The default is ``1e-12``.
+        maxiter : int, optional
+            Maximum number of refinement steps of a mixed precision solve.
+            The default is ``10``.
 
         Returns
         -------
-        AnsVec
-            Solution vector, which is identical to the ``x`` parameter if supplied.
+        AnsVec or AnsDenseMat
+            Solution vector, or dense matrix of solutions when there are several
+            right-hand sides. It is identical to the ``x`` parameter if supplied.
 
         Examples
         --------
@@ -1993,13 +2955,117 @@ class AnsSolver(AnsMathObj):
         >>> x
         AnsMath vector size 20000
 
+        Solve 200 load cases at once.
+
+        >>> loads = np.random.random((k.nrow, 200))
+        >>> x = s.solve(loads)
+        >>> x
+        AnsMath dense matrix (20000, 200)
+
         """
+        # a NumPy right-hand side is uploaded to a temporary, freed after the solve
+        temporary = isinstance(b, np.ndarray)
+        if temporary:
+            mm = AnsMath(self._mapdl)
+            b = mm.set_vec(b) if b.ndim == 1 else mm.matrix(b)
+
         if not x:
-            x = b.copy()
+            if b.type == ObjType.DMAT:
+                name = id_generator()
+                info = self._mapdl._data_info(b.id)
+                dtype = ANSYS_VALUE_TYPE[info.stype]
+                self._mapdl.run(
+                    f"*DMAT,{name},{MYCTYPE[dtype]},ALLOC,{info.size1},{info.size2}",
+                    mute=True,
+                )
+                x = AnsDenseMat(name, self._mapdl)
+            else:
+                x = b.copy()
+
+        if self.precision == "mixed" and self._fallback is None:
+            self._refine(b, x, tol, maxiter)
+            if self.converged:
+                if temporary:
+                    self._mapdl.run(f"*FREE,{b.id}", mute=True)
+                x._modified()
+                return x
+            self._mapdl._log.warning(
+                "Iterative refinement stalled at a relative residual of %g. "
+                "Falling back to a double precision factorization.",
+                self.history[-1],
+            )
+            self._fallback = AnsSolver(id_generator(), self._mapdl)
+            self._fallback.factorize(self._matrix, algo="LAPACK", inplace=False)
+
+        solver = self._fallback or self
         self._mapdl._log.info("Solving")
-        self._mapdl.run(f"*LSBAC,{self.id},{b.id},{x.id}", mute=True)
+        commands = [f"*LSBAC,{solver.id},{b.id},{x.id}"]
+        if temporary:
+            commands.append(f"*FREE,{b.id}")
+        _run_batch(self._mapdl, commands)
+        x._modified()
         return x
 
+    def _refine(self, b, x, tol, maxiter):
+        """Solve in single precision and refine the solution in double precision.
+
+        Each refinement step is sent as a single batch of commands that
+        also performs the back-substitution of the next step, so that only
+        the residual norm is retrieved from MAPDL at each step.
+        """
+        info = self._mapdl._data_info(b.id)
+        dtype = ANSYS_VALUE_TYPE[info.stype]
+        low = MYCTYPE[SINGLE_PRECISION.get(dtype, np.single)]
+        high = MYCTYPE[dtype]
+        acmd = "*DMAT" if b.type == ObjType.DMAT else "*VEC"
+        res, res_low, cor_low, cor = (id_generator() for _ in range(4))
+        norm = f"{self.id}_RN"
+        self.history = []
+        self.converged = False
+
+        # the residual of the zero initial solution is the right-hand side
+        _run_batch(
+            self._mapdl,
+            [
+                f"*NRM,{b.id},NRM2,{self.id}_BN",
+                f"*INIT,{x.id},ZERO",
+                f"{acmd},{res_low},{low},COPY,{b.id}",
+                f"{acmd},{cor_low},{low},COPY,{b.id}",
+                f"*LSBAC,{self.id},{res_low},{cor_low}",
+            ],
+        )
+        bnorm = self._mapdl.scalar_param(f"{self.id}_BN")
+
+        while len(self.history) <= maxiter:
+            _run_batch(
+                self._mapdl,
+                [
+                    f"{acmd},{cor},{high},COPY,{cor_low}",
+                    f"*AXPY,1,0,{cor},1,0,{x.id}",
+                    f"*MULT,{self._matrix.id},,{x.id},,{res}",
+                    f"*AXPY,1,0,{b.id},-1,0,{res}",
+                    f"*NRM,{res},NRM2,{norm}",
+                    f"{acmd},{res_low},{low},COPY,{res}",
+                    f"*LSBAC,{self.id},{res_low},{cor_low}",
+                ],
+            )
+            rel = self._mapdl.scalar_param(norm) / bnorm if bnorm else 0.0
+            stalled = bool(self.history) and not rel <= 0.5 * self.history[-1]
+            self.history.append(rel)
+            self.converged = rel <= tol
+            if self.converged or stalled:
+                break
+
+        self._mapdl.run(f"*FREE,{res}", mute=True)
+        self._mapdl.run(f"*FREE,{res_low}", mute=True)
+        self._mapdl.run(f"*FREE,{cor_low}", mute=True)
+        self._mapdl.run(f"*FREE,{cor}", mute=True)
+        self._mapdl._log.info(
+            "Iterative refinement %s after %d steps.",
+            "converged" if self.converged else "stalled",
+            self.iterations,
+        )
+
 
 def rand(obj):
     """Set all values of an AnsMath object to random values.
@@ -2014,18 +3080,392 @@ def rand(obj):
     >>> vec = mm.ones(10)
     >>> mm.rand(vec)
     """
+    obj._modified()
     obj._mapdl.run(f"*INIT,{obj.id},RAND", mute=True)
 
 
+def _select_rows(mm, rows, nrow, dtype=np.double):
+    """Upload a selection matrix picking some rows of a matrix or vector.
+
+    AnsMath sparse matrices are square, so the selection matrix is an
+    ``nrow`` x ``nrow`` sparse matrix whose first ``len(rows)`` rows pick
+    the given rows, and the other rows of a product by this matrix are
+    removed afterwards.
+
+    Returns
+    -------
+    AnsSparseMat
+        Selection matrix.
+    callable
+        Function returning the commands that remove the extra rows of the
+        product of a given name.
+    """
+    from scipy import sparse
+
+    nout = len(rows)
+    select = mm.matrix(
+        sparse.csr_matrix((np.ones(nout, dtype=dtype), (np.arange(nout), rows)), shape=(nrow, nrow))
+    )
+
+    def remove(name):
+        return [f"*REMOVE,{name},{nout + 1},{nrow},ROW"] if nout < nrow else []
+
+    return select, remove
+
+
+def _column_norms(mapdl, names, ncol, commands=()):
+    """Return the 2-norm of each column of real dense matrices.
+
+    The norms of all the matrices are computed in a single block of
+    commands, sent after ``commands``, and retrieved with a single transfer.
+    They are returned as an array with one row per matrix.
+    """
+    col, vec, par = (id_generator() for _ in range(3))
+    commands = list(commands)
+    commands.append(f"*DIM,{par},ARRAY,{ncol * len(names)}")
+    for i, name in enumerate(names):
+        for j in range(1, ncol + 1):
+            commands.extend(
+                [
+                    f"*VEC,{col},D,LINK,{name},{j}",
+                    f"*NRM,{col},NRM2,{par}_N",
+                    f"{par}({i * ncol + j})={par}_N",
+                ]
+            )
+    commands.extend([f"*VEC,{vec},D,IMPORT,APDL,{par}", f"*FREE,{col}", f"{par}=", f"{par}_N="])
+    _run_batch(mapdl, commands)
+    norms = mapdl._vec_data(vec)
+    mapdl.run(f"*FREE,{vec}", mute=True)
+    return norms.reshape(len(names), ncol)
+
+
+def _run_batch(mapdl, commands):
+    """Run a block of commands with a single call to MAPDL."""
+    if len(commands) == 1:
+        return mapdl.run(commands[0], mute=True)
+    return mapdl.input_strings(list(commands))
+
+
+def _default_algo(mat):
+    """Return the default factorization algorithm of a matrix."""
+    if mat.type == ObjType.DMAT:
+        return "LAPACK"
+    elif mat.type == ObjType.SMAT:
+        return "DSP"
+
+
+class SolverCache:
+    """Provides a least recently used cache of factorized AnsMath solvers.
+
+    Solvers are keyed by the handle of the factorized matrix and by the
+    factorization options. A cached solver is reused as long as the matrix
+    has not been modified through its handle, for example with
+    :func:`AnsMathObj.axpy`, ``*=``, :func:`AnsMathObj.zeros`, a solve
+    into it, or through one of its columns.
+
+    When the cache is full, the least recently used solver is deleted within
+    MAPDL.
+
+    Parameters
+    ----------
+    mapdl : ansys.mapdl.core.Mapdl
+        MAPDL instance that owns the solvers.
+    maxsize : int, optional
+        Maximum number of cached solvers. The default is ``2``.
+
+    """
+
+    def __init__(self, mapdl, maxsize=2):
+        """Initiate an empty solver cache."""
+        self._mapdl = mapdl
+        self._entries = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __repr__(self):
+        return (
+            f"AnsMath solver cache ({len(self)}/{self.maxsize} solvers, "
+            f"{self.hits} hits, {self.misses} misses)"
+        )
+
+    def factorize(
+        self, mat, algo=None, inplace=True, precision="double", memory=None, reorder=None
+    ):
+        """Return a factorized solver of a matrix, reusing a cached one if possible.
+
+        Parameters
+        ----------
+        mat : AnsMat
+            AnsMath matrix.
+        algo : str, optional
+            Factorization algorithm. Options are ``"LAPACK"``, ``"DSP"``,
+            and ``"DSS"``. The default is ``"LAPACK"`` for dense matrices and
+            ``"DSP"`` for sparse matrices.
+        inplace : bool, optional
+            Whether the factorization is performed on the input matrix
+            rather than on a copy of this matrix. The default is ``True``.
+        precision : str, optional
+            Factorization precision. Options are ``"double"`` and ``"mixed"``.
+            The default is ``"double"``.
+        memory : str, optional
+            Memory mode of the sparse solvers, ``"INCORE"`` or ``"OUTOFCORE"``.
+        reorder : str, optional
+            Equation reordering scheme of the ``"DSP"`` solver, ``"SEQORDER"``
+            or ``"PARORDER"``.
+
+        Returns
+        -------
+        AnsSolver
+            Factorized Ansys Solver object.
+
+        """
+        key = (
+            mat.id.upper(),
+            (algo or _default_algo(mat)).upper(),
+            bool(inplace),
+            precision.lower(),
+            (memory or "").upper(),
+            (reorder or "").upper(),
+        )
+        entry = self._entries.get(key)
+        if entry is not None:
+            ref, revision, solver = entry
+            if ref() is mat and revision == mat._revision:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                self._mapdl._log.info("Reusing the cached factorization of %s.", mat.id)
+                return solver
+            self._pop(key, free=True)
+
+        self.misses += 1
+        solver = AnsSolver(id_generator(), self._mapdl)
+        solver.factorize(
+            mat, algo=algo, inplace=inplace, precision=precision, memory=memory, reorder=reorder
+        )
+        if self.maxsize > 0:
+            self._entries[key] = (weakref.ref(mat), mat._revision, solver)
+            while len(self._entries) > self.maxsize:
+                self._pop(next(iter(self._entries)), free=True)
+        return solver
+
+    def _pop(self, key, free):
+        _, _, solver = self._entries.pop(key)
+        if free:
+            solver._free()
+
+    def discard(self, obj):
+        """Remove the solvers built on a matrix, or a given solver, from the cache.
+
+        Parameters
+        ----------
+        obj : AnsMat or AnsSolver
+            Factorized matrix or solver.
+
+        """
+        for key, (ref, _, solver) in list(self._entries.items()):
+            if solver is obj:
+                self._pop(key, free=False)
+            elif ref() is obj:
+                self._pop(key, free=True)
+
+    def clear(self, free=True):
+        """Remove all the solvers from the cache.
+
+        Parameters
+        ----------
+        free : bool, optional
+            Whether to delete the cached solvers within MAPDL. The default
+            is ``True``.
+
+        """
+        for key in list(self._entries):
+            self._pop(key, free=free)
+
+
+_SOLVER_CACHES = weakref.WeakKeyDictionary()
+
+
+def _get_solver_cache(mapdl):
+    """Return the solver cache of a MAPDL instance."""
+    try:
+        return _SOLVER_CACHES[mapdl]
+    except KeyError:
+        cache = _SOLVER_CACHES[mapdl] = SolverCache(mapdl)
+        return cache
+
+
+class UploadCache:
+    """Provides a cache of the local files uploaded to a remote MAPDL instance.
+
+    Files are identified by their content. The SHA-256 digest of a file is
+    computed while streaming it from the disk, and it is computed again only
+    when the size or the modification time of the file changes. A file is
+    uploaded again only when its content differs from the one uploaded last
+    under the same name.
+
+    The cache assumes that the MAPDL copy of an uploaded file is never
+    rewritten by MAPDL, so that the local file is read in Python in place of
+    this copy, without checking the MAPDL working directory. When MAPDL
+    rewrites a file of the same name, for example the ``file.full`` file of
+    a solve, call :meth:`discard` or :meth:`clear` after the solve. The file
+    of the MAPDL working directory then has priority again, and it is not
+    overwritten by a later upload.
+
+    Parameters
+    ----------
+    mapdl : ansys.mapdl.core.Mapdl
+        MAPDL instance the files are uploaded to.
+
+    """
+
+    def __init__(self, mapdl):
+        """Initiate an empty upload cache."""
+        self._mapdl = mapdl
+        self._stats = {}
+        self._remote = {}
+        self.hits = 0
+        self.uploads = 0
+
+    def __len__(self):
+        return len(self._remote)
+
+    def __repr__(self):
+        return f"AnsMath upload cache ({len(self)} files, {self.hits} hits, {self.uploads} uploads)"
+
+    def load(self, fname):
+        """Provide a local file to MAPDL, uploading it only if needed.
+
+        When a file of the same name is in the MAPDL working directory and
+        it was not uploaded through this cache, the file of the MAPDL working
+        directory has priority and the local file is not uploaded.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the local file.
+
+        Returns
+        -------
+        str
+            Name of the file in the MAPDL working directory.
+
+        """
+        path = os.path.abspath(fname)
+        base_fname = os.path.basename(path)
+        digest = self._digest(path)
+        if self._remote.get(base_fname) == digest:
+            self.hits += 1
+            return base_fname
+
+        if base_fname not in self._remote and base_fname in self._mapdl.list_files():
+            return load_file(self._mapdl, fname)
+
+        self._mapdl._log.debug("Uploading '%s' to the MAPDL working directory.", path)
+        self._mapdl.upload(path)
+        self._remote[base_fname] = digest
+        self.uploads += 1
+        return base_fname
+
+    def holds(self, fname):
+        """Return whether the content of a local file was the last one uploaded.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the local file.
+
+        Returns
+        -------
+        bool
+            ``True`` when the content of the local file was the last one
+            uploaded under its name, and the file was not discarded since.
+
+        """
+        base_fname = os.path.basename(fname)
+        if base_fname not in self._remote:
+            return False
+        return self._remote[base_fname] == self._digest(os.path.abspath(fname))
+
+    def _digest(self, path):
+        """Return the digest of a file, hashing it only if it changed."""
+        stat = os.stat(path)
+        key = (stat.st_size, stat.st_mtime_ns)
+        cached = self._stats.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        digest = _file_digest(path)
+        self._stats[path] = (key, digest)
+        return digest
+
+    def discard(self, fname):
+        """Forget a file, so that it is uploaded again by the next load.
+
+        Parameters
+        ----------
+        fname : str
+            Path to the local file or name of the file in the MAPDL
+            working directory.
+
+        """
+        self._remote.pop(os.path.basename(fname), None)
+        self._stats.pop(os.path.abspath(fname), None)
+
+    def clear(self):
+        """Forget all the uploaded files."""
+        self._remote.clear()
+        self._stats.clear()
+
+
+_UPLOAD_CACHES = weakref.WeakKeyDictionary()
+
+
+def _get_upload_cache(mapdl):
+    """Return the upload cache of a MAPDL instance."""
+    try:
+        return _UPLOAD_CACHES[mapdl]
+    except KeyError:
+        cache = _UPLOAD_CACHES[mapdl] = UploadCache(mapdl)
+        return cache
+
+
+def _file_digest(path, chunk_size=1 << 20):
+    """Return the SHA-256 digest of a file, read by chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as fid:
+        for chunk in iter(lambda: fid.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def solve(mat, b, x=None, algo=None):
-    solver = AnsSolver(id_generator(), mat._mapdl)
-    solver.factorize(mat, algo)
-    if not x:
-        x = b.copy()
-    x = solver.solve(b, x)
-
-    del solver
-    return x
+    """Solve a linear system.
+
+    The factorization of ``mat`` is cached and reused by subsequent calls
+    as long as the matrix is not modified.
+
+    Parameters
+    ----------
+    mat : AnsMat
+        AnsMath matrix of the linear system.
+    b : AnsVec, AnsDenseMat, or numpy.ndarray
+        Right-hand side vector, or right-hand sides stored as columns.
+    x : AnsVec or AnsDenseMat, optional
+        AnsMath vector or dense matrix to place the solution into.
+    algo : str, optional
+        Factorization algorithm. Options are ``"LAPACK"`` and ``"DSP"``.
+
+    Returns
+    -------
+    AnsVec or AnsDenseMat
+        Solution vector, which is identical to the ``x`` parameter if supplied.
+
+    """
+    solver = _get_solver_cache(mat._mapdl).factorize(mat, algo)
+    return solver.solve(b, x)
 
 
 def dot(vec1, vec2) -> float:
@@ -0,0 +1,388 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the automatic placement of PyAnsys Math operations.
+
+An operation runs either in the Python process with NumPy and SciPy, or
+within MAPDL, depending on the location of its operands, their size, and
+the latency and bandwidth of the connection to MAPDL.
+"""
+
+from collections import namedtuple
+import time
+
+from ansys.mapdl.core.common_grpc import ANSYS_VALUE_TYPE
+import numpy as np
+
+from ansys.math.core.math import (
+    MYCTYPE,
+    AnsDenseMat,
+    AnsMathObj,
+    AnsVec,
+    ObjType,
+    _run_batch,
+    id_generator,
+)
+
+Decision = namedtuple(
+    "Decision", ["operation", "location", "local_cost", "server_cost", "transfers"]
+)
+Decision.__doc__ = """Placement decision of an operation.
+
+The costs are estimated durations in seconds, and ``transfers`` lists the
+``(direction, nbytes)`` operand migrations done to run the operation.
+"""
+
+
+class PlacedArray:
+    """Provides an operand of the placement layer.
+
+    The operand lives in the Python process, within MAPDL, or both once it
+    has been migrated. Migrated copies are kept, so an operand is
+    transferred at most once in each direction.
+
+    Use :func:`Placement.array` to create a placed array.
+
+    """
+
+    def __init__(self, placement, local=None, remote=None):
+        """Initiate a placed array."""
+        self._placement = placement
+        self._local = local
+        self._remote = remote
+        if local is not None:
+            self.shape = local.shape
+            self.dtype = np.dtype(local.dtype)
+            self.nbytes = _nbytes(local)
+            self.sparse = _issparse(local)
+        else:
+            info = remote._mapdl._data_info(remote.id)
+            self.shape = (info.size1,) if remote.type == ObjType.VEC else (info.size1, info.size2)
+            self.dtype = np.dtype(ANSYS_VALUE_TYPE[info.stype])
+            self.sparse = remote.type == ObjType.SMAT
+            if self.sparse:
+                nnz = remote._mapdl._data_info(f"{remote.id}::VALS").size1
+                self.nbytes = nnz * (self.dtype.itemsize + 4) + (self.shape[0] + 1) * 8
+            else:
+                self.nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def __repr__(self):
+        return f"AnsMath placed array {self.shape} ({self.location})"
+
+    @property
+    def location(self) -> str:
+        """Location of the operand: ``"local"``, ``"server"`` or ``"both"``."""
+        if self._local is not None and self._remote is not None:
+            return "both"
+        return "local" if self._local is not None else "server"
+
+    def asarray(self):
+        """Return the operand as a NumPy array or a SciPy sparse matrix.
+
+        The operand is downloaded from MAPDL the first time only.
+        """
+        if self._local is None:
+            self._placement._download(self)
+        return self._local
+
+    def ansobj(self):
+        """Return the operand as an AnsMath object.
+
+        The operand is uploaded to MAPDL the first time only.
+        """
+        if self._remote is None:
+            self._placement._upload(self)
+        return self._remote
+
+    def free(self):
+        """Delete the MAPDL copy of the operand, if any, keeping the local one."""
+        if self._remote is not None and self._local is not None:
+            self._placement._mm.free(self._remote)
+            self._remote = None
+
+
+class Placement:
+    """Provides a placement layer choosing where each operation runs.
+
+    The cost of an operation is estimated for both locations as the time to
+    migrate the operands that are not already there, plus one round trip per
+    command sent to MAPDL, plus the floating point operations. The operation
+    runs where it is the cheapest, and its result stays there. Each decision
+    is recorded in :attr:`Placement.decisions`.
+
+    The latency and the bandwidth of the connection, as well as the local
+    floating point rate, are measured when the placement layer is created,
+    unless they are given.
+
+    Parameters
+    ----------
+    mm : AnsMath
+        AnsMath instance running the server operations.
+    latency : float, optional
+        Duration of a round trip to MAPDL in seconds.
+    bandwidth : float, optional
+        Transfer rate between Python and MAPDL in bytes per second.
+    local_rate : float, optional
+        Floating point operations per second in the Python process.
+    server_rate : float, optional
+        Floating point operations per second within MAPDL. The default is
+        the local rate.
+
+    Examples
+    --------
+    >>> from ansys.math.core.placement import Placement
+    >>> placement = Placement(mm)
+    >>> a = placement.array(np.random.random((10, 10)))
+    >>> k = placement.array(mm.stiff(fname="file.full"))
+    >>> placement.dot(a, a).location
+    'local'
+    >>> placement.decisions[-1]
+    Decision(operation='dot', location='local', local_cost=2.1e-06, ...)
+
+    """
+
+    def __init__(self, mm, latency=None, bandwidth=None, local_rate=None, server_rate=None):
+        """Initiate a placement layer and measure the connection."""
+        self._mm = mm
+        if latency is None or bandwidth is None:
+            measured_latency, measured_bandwidth = self._measure_link()
+            latency = measured_latency if latency is None else latency
+            bandwidth = measured_bandwidth if bandwidth is None else bandwidth
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.local_rate = local_rate or _measure_rate()
+        self.server_rate = server_rate or self.local_rate
+        self.decisions = []
+
+    def __repr__(self):
+        return (
+            f"AnsMath placement (latency {self.latency * 1e3:.3g} ms, "
+            f"bandwidth {self.bandwidth / 1e6:.3g} MB/s)"
+        )
+
+    def array(self, data):
+        """Place an operand.
+
+        Parameters
+        ----------
+        data : numpy.ndarray, scipy.sparse matrix, AnsVec or AnsMat
+            Local array or AnsMath object of the MAPDL instance.
+
+        Returns
+        -------
+        PlacedArray
+            Placed operand, located where ``data`` lives.
+
+        """
+        if isinstance(data, PlacedArray):
+            return data
+        if isinstance(data, AnsMathObj):
+            return PlacedArray(self, remote=data)
+        if not _issparse(data):
+            data = np.asarray(data)
+        return PlacedArray(self, local=data)
+
+    def dot(self, a, b):
+        """Multiply two operands.
+
+        Parameters
+        ----------
+        a : PlacedArray or array-like
+            Matrix or vector.
+        b : PlacedArray or array-like
+            Matrix or vector.
+
+        Returns
+        -------
+        PlacedArray or float
+            Product, or scalar product of two vectors.
+
+        """
+        a, b = self.array(a), self.array(b)
+        rows = a.shape[0] if len(a.shape) > 1 else 1
+        cols = b.shape[1] if len(b.shape) > 1 else 1
+        flops = 2 * rows * a.shape[-1] * cols
+        scalar = len(a.shape) == len(b.shape) == 1
+
+        # the scalar product of two vectors needs a second round trip
+        location = self._decide("dot", (a, b), flops, commands=2 if scalar else 1)
+        if location == "local":
+            result = a.asarray() @ b.asarray()
+            return result.item() if scalar else self.array(result)
+
+        if scalar:
+            return a.ansobj().dot(b.ansobj())
+        name = id_generator()
+        if len(a.shape) == 1:
+            # product of a row vector, computed as the transposed product
+            command = f"*MULT,{b.ansobj().id},TRANS,{a.ansobj().id},,{name}"
+        else:
+            command = f"*MULT,{a.ansobj().id},,{b.ansobj().id},,{name}"
+        self._mm._mapdl.run(command, mute=True)
+        if len(a.shape) == 1 or len(b.shape) == 1:
+            result = AnsVec(name, self._mm._mapdl)
+        else:
+            result = AnsDenseMat(name, self._mm._mapdl)
+        return self.array(result)
+
+    def add(self, a, b):
+        """Add two operands of the same shape.
+
+        Parameters
+        ----------
+        a : PlacedArray or array-like
+            Vector or matrix.
+        b : PlacedArray or array-like
+            Vector or matrix.
+
+        Returns
+        -------
+        PlacedArray
+            Sum of the operands.
+
+        """
+        a, b = self.array(a), self.array(b)
+        if a.shape != b.shape:
+            raise ValueError(f"The shapes {a.shape} and {b.shape} do not match.")
+        location = self._decide("add", (a, b), max(a.nbytes, b.nbytes) // a.dtype.itemsize)
+        if location == "local":
+            return self.array(a.asarray() + b.asarray())
+
+        left, right = a.ansobj(), b.ansobj()
+        kind = {ObjType.VEC: "VEC", ObjType.DMAT: "DMAT", ObjType.SMAT: "SMAT"}[left.type]
+        dtype = np.result_type(a.dtype, b.dtype).type
+        name = id_generator()
+        _run_batch(
+            self._mm._mapdl,
+            [f"*{kind},{name},{MYCTYPE[dtype]},COPY,{left.id}", f"*AXPY,1,0,{right.id},1,0,{name}"],
+        )
+        return self.array(type(left)(name, self._mm._mapdl))
+
+    def norm(self, a):
+        """Return the 2-norm of an operand.
+
+        Parameters
+        ----------
+        a : PlacedArray or array-like
+            Vector or matrix.
+
+        Returns
+        -------
+        float
+            Norm of the operand.
+
+        """
+        a = self.array(a)
+        location = self._decide("norm", (a,), 2 * a.nbytes // a.dtype.itemsize, commands=2)
+        if location == "local":
+            data = a.asarray()
+            data = data.data if a.sparse else data
+            return float(np.linalg.norm(np.ravel(data)))
+        return a.ansobj().norm()
+
+    def _decide(self, operation, operands, flops, commands=1):
+        """Choose the location of an operation, migrate its operands and record it."""
+        to_server = [op for op in operands if op._remote is None]
+        to_local = [op for op in operands if op._local is None]
+        local_cost = self._transfer_cost(to_local) + flops / self.local_rate
+        server_cost = (
+            self._transfer_cost(to_server) + commands * self.latency + flops / self.server_rate
+        )
+        location = "local" if local_cost <= server_cost else "server"
+
+        moved = to_local if location == "local" else to_server
+        direction = "download" if location == "local" else "upload"
+        transfers = []
+        for op in {id(op): op for op in moved}.values():
+            transfers.append((direction, op.nbytes))
+            if location == "local":
+                self._download(op)
+            else:
+                self._upload(op)
+
+        decision = Decision(operation, location, local_cost, server_cost, transfers)
+        self._mm._mapdl._log.debug("Placement decision: %s", decision)
+        self.decisions.append(decision)
+        return location
+
+    def _transfer_cost(self, operands):
+        """Estimated duration of the migration of operands."""
+        # a sparse matrix is sent as three vectors and one command
+        calls = sum(4 if op.sparse else 1 for op in operands)
+        return calls * self.latency + sum(op.nbytes for op in operands) / self.bandwidth
+
+    def _upload(self, op):
+        """Copy a local operand to MAPDL."""
+        op._remote = self._mm.matrix(op._local) if op.sparse else self._set(op._local)
+
+    def _download(self, op):
+        """Copy a MAPDL operand to the Python process."""
+        op._local = op._remote.asarray()
+
+    def _set(self, array):
+        """Upload a dense array as an AnsMath vector or dense matrix."""
+        if array.ndim == 1:
+            return self._mm.set_vec(array)
+        return self._mm.matrix(array)
+
+    def _measure_link(self):
+        """Measure the latency and the bandwidth of the connection to MAPDL."""
+        mapdl = self._mm._mapdl
+        durations = []
+        for _ in range(3):
+            start = time.perf_counter()
+            mapdl.run("/COM", mute=True)
+            durations.append(time.perf_counter() - start)
+        latency = min(durations)
+
+        probe = np.zeros(2**17)
+        start = time.perf_counter()
+        vec = self._mm.set_vec(probe)
+        mapdl._vec_data(vec.id)
+        elapsed = time.perf_counter() - start
+        self._mm.free(vec)
+        bandwidth = 2 * probe.nbytes / max(elapsed - 2 * latency, 1e-9)
+        return latency, bandwidth
+
+
+def _measure_rate():
+    """Measure the floating point rate of the Python process."""
+    dim = 200
+    mat = np.ones((dim, dim))
+    start = time.perf_counter()
+    mat @ mat
+    return 2 * dim**3 / max(time.perf_counter() - start, 1e-9)
+
+
+def _issparse(data):
+    """Return whether an object is a SciPy sparse matrix."""
+    from scipy import sparse
+
+    return sparse.issparse(data)
+
+
+def _nbytes(data):
+    """Return the size in bytes of a NumPy array or a SciPy sparse matrix."""
+    if _issparse(data):
+        data = data.tocsr()
+        return data.data.nbytes + data.indices.nbytes + data.indptr.nbytes
+    return data.nbytes
@@ -0,0 +1,373 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the pool of MAPDL instances of PyAnsys Math.
+
+Independent work units, such as load cases, frequency points or parameter
+variants, are dispatched to several MAPDL instances through a thread pool,
+and AnsMath objects are transferred directly from one instance to another.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from ansys.api.mapdl.v0 import ansys_kernel_pb2 as anskernel
+from ansys.api.mapdl.v0 import mapdl_pb2 as pb_types
+from ansys.mapdl.core import launch_mapdl
+from ansys.mapdl.core.common_grpc import ANSYS_VALUE_TYPE
+from ansys.mapdl.core.errors import protect_grpc
+import numpy as np
+
+from ansys.math.core.math import (
+    MYCTYPE,
+    NP_VALUE_TYPE,
+    AnsDenseMat,
+    AnsMath,
+    AnsMathObj,
+    AnsSparseMat,
+    AnsVec,
+    ObjType,
+    id_generator,
+)
+
+
+class AnsMathPool:
+    """Provides a pool of AnsMath instances running independent jobs.
+
+    Each instance runs one job at a time, in the order of submission. A job
+    whose arguments contain AnsMath objects runs on the instance that owns
+    these objects. Other jobs run on the least busy instance.
+
+    The pool is a sequence of AnsMath instances, so it can be given to the
+    functions accepting a pool, such as
+    :func:`ansys.math.core.slicing.sliced_modal`.
+
+    Parameters
+    ----------
+    n_instances : int, optional
+        Number of MAPDL instances to launch with
+        ``ansys.mapdl.core.launch_mapdl``.
+    mapdl : sequence of Mapdl or AnsMath, optional
+        Running MAPDL or AnsMath instances to use instead of launching new
+        ones. These instances are not exited when the pool is closed.
+    **kwargs : dict, optional
+        Keyword arguments given to ``ansys.mapdl.core.launch_mapdl``.
+
+    Examples
+    --------
+    >>> from ansys.math.core.pool import AnsMathPool
+    >>> def static(mm, scale):
+    ...     k = mm.stiff(fname="file.full")
+    ...     b = mm.rhs(fname="file.full")
+    ...     return mm.solve(k, b * scale)
+    >>> with AnsMathPool(4) as pool:
+    ...     results = pool.map(static, [1.0, 2.0, 3.0, 4.0])
+    ...     print(pool.utilization)
+    [0.95 0.94 0.96 0.93]
+
+    """
+
+    def __init__(self, n_instances=None, mapdl=None, **kwargs):
+        """Initiate a pool of AnsMath instances."""
+        self._owned = mapdl is None
+        if mapdl is None:
+            if not n_instances:
+                raise ValueError("Either ``n_instances`` or ``mapdl`` must be provided.")
+            mapdl = [launch_mapdl(**kwargs) for _ in range(n_instances)]
+        self._instances = [mm if isinstance(mm, AnsMath) else AnsMath(mm) for mm in mapdl]
+        if not self._instances:
+            raise ValueError("The pool must contain at least one AnsMath instance.")
+
+        # one worker per instance, as an instance runs one command at a time
+        self._executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"AnsMathPool-{index}")
+            for index in range(len(self._instances))
+        ]
+        self._lock = threading.Lock()
+        self._pending = [0] * len(self)
+        self.reset_stats()
+
+    def __repr__(self):
+        return f"AnsMath pool of {len(self)} instances"
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __iter__(self):
+        return iter(self._instances)
+
+    def __getitem__(self, index):
+        return self._instances[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def jobs(self):
+        """Number of jobs completed by each instance."""
+        return np.array(self._jobs)
+
+    @property
+    def busy_time(self):
+        """Time spent running jobs by each instance, in seconds."""
+        return np.array(self._busy)
+
+    @property
+    def utilization(self):
+        """Fraction of the time each instance spent running jobs.
+
+        The time is measured since the creation of the pool or the last
+        call to :func:`AnsMathPool.reset_stats`.
+        """
+        elapsed = time.perf_counter() - self._start
+        return self.busy_time / elapsed if elapsed > 0 else np.zeros(len(self))
+
+    def reset_stats(self):
+        """Reset the job counts and the utilization of the instances."""
+        with self._lock:
+            self._start = time.perf_counter()
+            self._jobs = [0] * len(self)
+            self._busy = [0.0] * len(self)
+
+    def instance_of(self, obj):
+        """Return the index of the instance owning an AnsMath object.
+
+        Parameters
+        ----------
+        obj : AnsMathObj
+            AnsMath object.
+
+        Returns
+        -------
+        int
+            Index of the instance in the pool.
+
+        """
+        for index, mm in enumerate(self._instances):
+            if mm._mapdl is obj._mapdl:
+                return index
+        raise ValueError(f"The AnsMath object '{obj.id}' does not belong to this pool.")
+
+    def submit(self, func, *args, **kwargs):
+        """Submit a job to the pool.
+
+        Parameters
+        ----------
+        func : callable
+            Function called as ``func(mm, *args, **kwargs)``, where ``mm``
+            is the AnsMath instance running the job.
+        *args : tuple
+            Positional arguments of the function.
+        **kwargs : dict
+            Keyword arguments of the function.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future of the return value of the function.
+
+        """
+        return self._submit(func, args, kwargs)
+
+    def map(self, func, *iterables):
+        """Run a function over the items of iterables with the pool.
+
+        Parameters
+        ----------
+        func : callable
+            Function called as ``func(mm, *items)``, where ``mm`` is the
+            AnsMath instance running the job.
+        *iterables : iterable
+            Iterables providing the arguments of each job.
+
+        Returns
+        -------
+        list
+            Return values of the jobs, in the order of the items. The
+            AnsMath objects returned by the jobs are retrieved as NumPy
+            arrays, and deleted within MAPDL.
+
+        """
+        futures = [self._submit(func, args, {}, asarray=True) for args in zip(*iterables)]
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Wait for the submitted jobs and exit the launched MAPDL instances."""
+        for executor in self._executors:
+            executor.shutdown(wait=True)
+        if self._owned:
+            for mm in self._instances:
+                mm._mapdl.exit()
+
+    def _submit(self, func, args, kwargs, asarray=False):
+        """Place a job on an instance and submit it."""
+        owners = {
+            self.instance_of(arg)
+            for arg in (*args, *kwargs.values())
+            if isinstance(arg, AnsMathObj)
+        }
+        if len(owners) > 1:
+            raise ValueError("The AnsMath objects of a job must belong to the same instance.")
+        with self._lock:
+            if owners:
+                index = owners.pop()
+            else:
+                index = min(range(len(self)), key=lambda i: (self._pending[i], self._jobs[i]))
+            self._pending[index] += 1
+        return self._executors[index].submit(self._run, index, func, args, kwargs, asarray)
+
+    def _run(self, index, func, args, kwargs, asarray):
+        """Run a job on an instance and record its duration."""
+        mm = self._instances[index]
+        start = time.perf_counter()
+        try:
+            result = func(mm, *args, **kwargs)
+            if asarray:
+                result = _to_numpy(mm, result)
+            return result
+        finally:
+            with self._lock:
+                self._busy[index] += time.perf_counter() - start
+                self._jobs[index] += 1
+                self._pending[index] -= 1
+
+
+def _to_numpy(mm, result):
+    """Retrieve the AnsMath objects of a job result as NumPy arrays."""
+    if isinstance(result, tuple):
+        return tuple(_to_numpy(mm, item) for item in result)
+    if isinstance(result, AnsMathObj):
+        array = result.asarray()
+        mm.free(result)
+        return array
+    return result
+
+
+@protect_grpc
+def transfer(obj, target, name=None):
+    """Transfer an AnsMath object to another MAPDL instance.
+
+    The data is streamed from the source instance to the target instance
+    chunk by chunk as it is received, so the client never holds more than
+    one chunk of the object. The CSR components of a sparse matrix are
+    streamed one after the other.
+
+    Parameters
+    ----------
+    obj : AnsVec or AnsMat
+        AnsMath vector, dense matrix or sparse matrix to transfer.
+    target : AnsMath
+        AnsMath instance receiving the object.
+    name : str, optional
+        AnsMath parameter name of the copy. The default is a random name.
+
+    Returns
+    -------
+    AnsVec or AnsMat
+        Copy of the object within the target instance.
+
+    Examples
+    --------
+    >>> from ansys.math.core.pool import transfer
+    >>> k = mm.stiff(fname="file.full")
+    >>> k_remote = transfer(k, AnsMath(launch_mapdl(port=50053)))
+    >>> k_remote.shape
+    (4206, 4206)
+
+    """
+    source = obj._mapdl
+    mapdl = target._mapdl
+    if name is None:
+        name = id_generator()
+
+    if obj.type == ObjType.VEC:
+        _transfer_vec(source, obj.id, mapdl, name)
+        return AnsVec(name, mapdl)
+
+    info = source._data_info(obj.id)
+    if obj.type == ObjType.DMAT:
+        chunks = source._stub.GetMatData(pb_types.ParameterRequest(name=obj.id))
+        requests = _relay(
+            chunks,
+            lambda chunk: pb_types.SetMatDataRequest(
+                mname=name, stype=info.stype, nrow=info.size1, ncol=info.size2, chunk=chunk
+            ),
+        )
+        mapdl._stub.SetMatData(requests)
+        return AnsDenseMat(name, mapdl)
+
+    if obj.type == ObjType.SMAT:
+        # same parameter names as ``AnsMath.matrix``, with one-based indices
+        _transfer_vec(source, f"{obj.id}::VALS", mapdl, f"{name}_DATA")
+        _transfer_vec(source, f"{obj.id}::ROWS", mapdl, f"{name}_IND", np.int64, 1)
+        _transfer_vec(source, f"{obj.id}::COLS", mapdl, f"{name}_PTR", np.int64, 1)
+        dtype = ANSYS_VALUE_TYPE[info.stype]
+        flagsym = "TRUE" if obj.sym() else "FALSE"
+        mapdl.run(
+            f"*SMAT,{name},{MYCTYPE[dtype]},ALLOC,CSR,{name}_IND,{name}_PTR,{name}_DATA,{flagsym}",
+            mute=True,
+        )
+        return AnsSparseMat(name, mapdl)
+
+    raise TypeError(f"The AnsMath object '{obj.id}' cannot be transferred.")
+
+
+def _transfer_vec(source, pname, mapdl, vname, dtype=None, offset=0):
+    """Stream a vector parameter from one instance to another."""
+    info = source._data_info(pname)
+    src_dtype = ANSYS_VALUE_TYPE[info.stype]
+    dtype = dtype or src_dtype
+    stype = NP_VALUE_TYPE[dtype]
+
+    convert = None
+    if offset or dtype != src_dtype:
+
+        def convert(payload):
+            return (np.frombuffer(payload, src_dtype).astype(dtype) + offset).tobytes()
+
+    chunks = source._stub.GetVecData(pb_types.ParameterRequest(name=pname))
+    requests = _relay(
+        chunks,
+        lambda chunk: pb_types.SetVecDataRequest(
+            vname=vname, stype=stype, size=info.size1, chunk=chunk
+        ),
+        np.dtype(src_dtype).itemsize,
+        convert,
+    )
+    mapdl._stub.SetVecData(requests)
+
+
+def _relay(chunks, request, itemsize=1, convert=None):
+    """Forward the chunks of a download as the requests of an upload."""
+    rest = b""
+    for chunk in chunks:
+        payload = rest + chunk.payload
+        if convert is not None:
+            # convert whole values only, and keep the remaining bytes
+            cut = len(payload) - len(payload) % itemsize
+            payload, rest = convert(payload[:cut]), payload[cut:]
+        if payload:
+            yield request(anskernel.Chunk(payload=payload, size=len(payload)))
@@ -0,0 +1,471 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the reduced-order modeling tools of PyAnsys Math.
+
+The matrices are projected within MAPDL, and only the small reduced
+matrices are transferred to Python.
+"""
+
+import numpy as np
+
+from ansys.math.core.math import (
+    AnsDenseMat,
+    AnsMath,
+    AnsMathObj,
+    ObjType,
+    _run_batch,
+    _select_rows,
+    id_generator,
+)
+
+
+def project(basis, *objs):
+    """Project matrices and vectors on a basis.
+
+    A matrix :math:`A` is projected as :math:`V^T A V` and a vector or a
+    dense matrix of load vectors :math:`F` as :math:`V^T F`, where
+    :math:`V` is the basis. The transposed products are computed without
+    transposed copies of the basis, all the projections are computed in
+    a single block of commands, and only the projected arrays are
+    transferred to Python.
+
+    Parameters
+    ----------
+    basis : AnsDenseMat
+        Basis stored as columns, such as the modes of a modal analysis.
+    *objs : AnsMat or AnsVec
+        Square matrices, vectors, or dense matrices of load vectors.
+        A dense matrix is projected as a square matrix when its number of
+        rows and columns are both equal to the number of rows of the basis.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        Projection of each object.
+
+    Examples
+    --------
+    >>> from ansys.math.core.rom import project
+    >>> freqs, phi = mm.modal(k, m, nev=20)
+    >>> kr, mr, fr = project(phi, k, m, f)
+    >>> kr.shape, fr.shape
+    ((20, 20), (20,))
+
+    """
+    mapdl = basis._mapdl
+    nrow = basis.nrow
+    commands = []
+    results = []
+    temporaries = []
+    for obj in objs:
+        name = id_generator()
+        if obj.type == ObjType.VEC or obj.type == ObjType.DMAT and obj.shape != (nrow, nrow):
+            commands.append(f"*MULT,{basis.id},TRANS,{obj.id},,{name}")
+        else:
+            tmp = id_generator()
+            commands.extend(
+                [
+                    f"*MULT,{obj.id},,{basis.id},,{tmp}",
+                    f"*MULT,{basis.id},TRANS,{tmp},,{name}",
+                ]
+            )
+            temporaries.append(tmp)
+        results.append((name, obj.type == ObjType.VEC))
+    commands.extend(f"*FREE,{tmp}" for tmp in temporaries)
+    _run_batch(mapdl, commands)
+
+    arrays = []
+    for name, is_vec in results:
+        arrays.append(mapdl._vec_data(name) if is_vec else mapdl._mat_data(name))
+        mapdl.run(f"*FREE,{name}", mute=True)
+    return tuple(arrays)
+
+
+class ReducedModel:
+    """Provides a reduced-order model.
+
+    Attributes
+    ----------
+    basis : AnsDenseMat
+        Reduction basis stored as columns within MAPDL.
+    k : numpy.ndarray
+        Reduced stiffness matrix.
+    m : numpy.ndarray
+        Reduced mass matrix.
+    c : numpy.ndarray or None
+        Reduced damping matrix.
+    f : numpy.ndarray or None
+        Reduced load vector, or reduced load vectors stored as columns.
+
+    """
+
+    def __init__(self, basis, k, m, c=None, f=None):
+        """Initiate a reduced-order model."""
+        self.basis = basis
+        self.k = k
+        self.m = m
+        self.c = c
+        self.f = f
+
+    def __repr__(self):
+        return f"AnsMath reduced-order model of size {self.k.shape[0]}"
+
+    @property
+    def size(self):
+        """Number of reduced degrees of freedom."""
+        return self.k.shape[0]
+
+
+def reduce(basis, k, m, c=None, f=None):
+    """Build a reduced-order model by projecting matrices on a basis.
+
+    Parameters
+    ----------
+    basis : AnsDenseMat
+        Reduction basis, such as the modes returned by :func:`AnsMath.modal`
+        or a basis returned by :func:`krylov_basis`.
+    k : AnsMat
+        Stiffness matrix.
+    m : AnsMat
+        Mass matrix.
+    c : AnsMat, optional
+        Damping matrix.
+    f : AnsVec or AnsDenseMat, optional
+        Load vector, or load vectors stored as columns.
+
+    Returns
+    -------
+    ReducedModel
+        Reduced-order model.
+
+    Examples
+    --------
+    >>> from ansys.math.core.rom import reduce
+    >>> freqs, phi = mm.modal(k, m, nev=20)
+    >>> rom = reduce(phi, k, m, f=mm.rhs(fname="file.full"))
+    >>> rom
+    AnsMath reduced-order model of size 20
+
+    """
+    objs = [obj for obj in (k, m, c, f) if obj is not None]
+    arrays = iter(project(basis, *objs))
+    kr, mr = next(arrays), next(arrays)
+    cr = None if c is None else next(arrays)
+    fr = None if f is None else next(arrays)
+    return ReducedModel(basis, kr, mr, cr, fr)
+
+
+def krylov_basis(k, m, f, size, shift=0.0, tol=1e-12):
+    """Generate an orthonormal Krylov basis for moment-matching reduction.
+
+    The basis spans the Krylov subspace of :math:`A^{-1} M` started from
+    :math:`A^{-1} f`, where :math:`A = K - (2 \\pi f_0)^2 M` and :math:`f_0`
+    is the expansion frequency. A reduced-order model built on this basis
+    matches the first moments of the transfer function around :math:`f_0`.
+    The basis is built within MAPDL with the Arnoldi process, and each new
+    vector is orthogonalized twice with block products.
+
+    Parameters
+    ----------
+    k : AnsMat
+        Stiffness matrix.
+    m : AnsMat
+        Mass matrix.
+    f : AnsVec
+        Load vector.
+    size : int
+        Maximum number of basis vectors.
+    shift : float, optional
+        Expansion frequency :math:`f_0` in Hz. The default is ``0.0``,
+        in which case the stiffness matrix must not be singular.
+    tol : float, optional
+        Relative norm below which a new vector is considered linearly
+        dependent on the previous ones, which stops the process. The
+        default is ``1e-12``.
+
+    Returns
+    -------
+    AnsDenseMat
+        Orthonormal basis stored as columns. It can have fewer than
+        ``size`` columns when the Krylov subspace is exhausted.
+
+    Examples
+    --------
+    >>> from ansys.math.core.rom import krylov_basis, reduce
+    >>> f = mm.rhs(fname="file.full")
+    >>> basis = krylov_basis(k, m, f, 20, shift=100)
+    >>> rom = reduce(basis, k, m, f=f)
+
+    """
+    mm = AnsMath(k._mapdl)
+    mapdl = k._mapdl
+    nrow = k.nrow
+    omega2 = (2 * np.pi * shift) ** 2
+
+    shifted = id_generator()
+    mapdl.run(f"*{k.type.name},{shifted},D,COPY,{k.id}", mute=True)
+    shifted = type(k)(shifted, mapdl)
+    if omega2:
+        mapdl.run(f"*AXPY,{-omega2},0,{m.id},1,0,{shifted.id}", mute=True)
+    solver = mm.factorize(shifted, cache=False)
+
+    basis, vec, tmp, proj, col = (id_generator() for _ in range(5))
+    norm, init = f"{basis}_NRM", f"{basis}_INI"
+    _run_batch(
+        mapdl,
+        [
+            f"*DMAT,{basis},D,ALLOC,{nrow},{size}",
+            f"*VEC,{vec},D,COPY,{f.id}",
+            f"*LSBAC,{solver.id},{f.id},{vec}",
+        ],
+    )
+
+    ncol = 0
+    while ncol < size:
+        commands = [f"*NRM,{vec},NRM2,{init}"]
+        if ncol:
+            # two passes of classical Gram-Schmidt against the basis
+            for _ in range(2):
+                commands.extend(
+                    [
+                        f"*MULT,{basis},TRANS,{vec},,{proj}",
+                        f"*MULT,{basis},,{proj},,{tmp}",
+                        f"*AXPY,-1,0,{tmp},1,0,{vec}",
+                    ]
+                )
+        commands.append(f"*NRM,{vec},NRM2,{norm},YES")
+        _run_batch(mapdl, commands)
+        if not mapdl.scalar_param(norm) > tol * mapdl.scalar_param(init):
+            break
+
+        ncol += 1
+        commands = [
+            f"*VEC,{col},D,LINK,{basis},{ncol}",
+            f"*AXPY,1,0,{vec},0,0,{col}",
+        ]
+        if ncol < size:
+            commands.extend([f"*MULT,{m.id},,{col},,{tmp}", f"*LSBAC,{solver.id},{tmp},{vec}"])
+        _run_batch(mapdl, commands)
+
+    temporaries = [vec]
+    if ncol:
+        temporaries.append(col)
+    if min(ncol, size - 1):
+        temporaries.extend([tmp, proj])
+    commands = [f"*FREE,{name}" for name in temporaries] + [f"{norm}=", f"{init}="]
+    if not ncol:
+        commands.append(f"*FREE,{basis}")
+    elif ncol < size:
+        commands.append(f"*REMOVE,{basis},{ncol + 1},{size}")
+    _run_batch(mapdl, commands)
+    solver._free()
+    mm.free(shifted)
+    if not ncol:
+        raise ValueError("The load vector must not be zero.")
+    return AnsDenseMat(basis, mapdl)
+
+
+class ModalSuperposition:
+    """Provides a modal superposition engine for harmonic and transient responses.
+
+    The modal loads and the rows of the mode shapes needed to recover the
+    requested degrees of freedom are transferred once from MAPDL. The
+    responses are then evaluated in Python, vectorized over the modes and
+    over chunks of frequencies or time steps to bound the memory usage.
+
+    Parameters
+    ----------
+    freqs : numpy.ndarray or AnsVec
+        Natural frequencies in Hz, such as those returned by
+        :func:`AnsMath.modal` or :func:`AnsMath.eigs`.
+    phi : AnsDenseMat or numpy.ndarray
+        Mode shapes normalized to the mass matrix, stored as columns.
+    f : AnsVec or numpy.ndarray
+        Load vector, such as the one returned by :func:`AnsMath.get_vec`.
+    dofs : sequence of int, optional
+        Zero-based indices of the equations whose response is recovered.
+        Only these rows of the mode shapes are transferred from MAPDL. The
+        default is ``None``, in which case all the equations are recovered.
+    damping : float or sequence of float, optional
+        Modal damping ratio, either for all the modes or for each mode.
+        The default is ``0.0``.
+
+    Examples
+    --------
+    >>> from ansys.math.core.rom import ModalSuperposition
+    >>> freqs, phi = mm.modal(k, m, nev=50)
+    >>> f = mm.get_vec(fname="file.full", mat_id="RHS")
+    >>> msup = ModalSuperposition(freqs, phi, f, dofs=[10, 11, 12], damping=0.02)
+    >>> frf = msup.frf(np.linspace(1, 1000, 5000))
+    >>> frf.shape
+    (5000, 3)
+
+    """
+
+    def __init__(self, freqs, phi, f, dofs=None, damping=0.0):
+        """Initiate a modal superposition engine."""
+        if not isinstance(freqs, np.ndarray):
+            freqs = freqs.asarray()
+        nmode = phi.shape[1]
+        self.omega = 2 * np.pi * np.asarray(freqs, dtype=np.float64)[:nmode]
+        self.damping = np.broadcast_to(np.asarray(damping, dtype=np.float64), (nmode,))
+        self.dofs = None if dofs is None else np.asarray(dofs, dtype=np.int64)
+
+        if isinstance(phi, np.ndarray):
+            self.load = phi.T @ np.asarray(f)
+            self.shapes = phi if self.dofs is None else phi[self.dofs]
+        else:
+            self.load, self.shapes = _modal_arrays(phi, f, self.dofs)
+
+    def __repr__(self):
+        return f"AnsMath modal superposition of {self.omega.size} modes"
+
+    def frf(self, freqs, chunk=1000):
+        """Compute the harmonic response over a range of frequencies.
+
+        Parameters
+        ----------
+        freqs : sequence of float
+            Excitation frequencies in Hz.
+        chunk : int, optional
+            Number of frequencies evaluated at once. The default is ``1000``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Complex response for each frequency (rows) and each recovered
+            degree of freedom (columns).
+
+        """
+        freqs = np.atleast_1d(np.asarray(freqs, dtype=np.float64))
+        response = np.empty((freqs.size, self.shapes.shape[0]), dtype=np.complex128)
+        omega, damping = self.omega, self.damping
+        for start in range(0, freqs.size, chunk):
+            w = 2 * np.pi * freqs[start : start + chunk, np.newaxis]
+            modal = self.load / (omega * omega - w * w + 2j * damping * omega * w)
+            response[start : start + chunk] = modal @ self.shapes.T
+        return response
+
+    def transient(self, times, amplitude, chunk=1000):
+        """Compute the transient response to a scaled load vector.
+
+        The structure is at rest at the first time step, and the load
+        amplitude varies linearly between time steps, which makes the
+        integration exact for any time step size.
+
+        Parameters
+        ----------
+        times : sequence of float
+            Uniformly spaced time steps in seconds.
+        amplitude : sequence of float
+            Scale factor applied to the load vector at each time step.
+        chunk : int, optional
+            Number of time steps recovered at once. The default is ``1000``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Response for each time step (rows) and each recovered degree of
+            freedom (columns).
+
+        """
+        from scipy import linalg, signal
+
+        times = np.asarray(times, dtype=np.float64)
+        amplitude = np.asarray(amplitude, dtype=np.float64)
+        if amplitude.shape != times.shape:
+            raise ValueError("The load amplitude must be defined at each time step.")
+        steps = np.diff(times)
+        if steps.size and not np.allclose(steps, steps[0]):
+            raise ValueError("The time steps must be uniformly spaced.")
+
+        nmode = self.omega.size
+        modal = np.zeros((nmode, times.size))
+        if times.size > 1:
+            # exact discretization of the modal equations for a load varying
+            # linearly between time steps (first-order hold)
+            dt = steps[0]
+            aug = np.zeros((nmode, 4, 4))
+            aug[:, 0, 1] = 1
+            aug[:, 1, 0] = -self.omega**2
+            aug[:, 1, 1] = -2 * self.damping * self.omega
+            aug[:, 1, 2] = 1
+            aug[:, 2, 3] = 1 / dt
+            exp = linalg.expm(aug * dt)
+            trans, g1 = exp[:, :2, :2], exp[:, :2, 3]
+            g0 = exp[:, :2, 2] - g1
+
+            # difference equation of the displacement of each mode
+            den = np.stack(
+                [np.ones(nmode), -np.trace(trans, axis1=1, axis2=2), np.linalg.det(trans)], axis=1
+            )
+            num = np.stack(
+                [
+                    g1[:, 0],
+                    g0[:, 0] - trans[:, 1, 1] * g1[:, 0] + trans[:, 0, 1] * g1[:, 1],
+                    trans[:, 0, 1] * g0[:, 1] - trans[:, 1, 1] * g0[:, 0],
+                ],
+                axis=1,
+            )
+            # free response removing the load ramp assumed before the first step
+            free = np.stack(
+                [g1[:, 0], trans[:, 0, 0] * g1[:, 0] + trans[:, 0, 1] * g1[:, 1]], axis=1
+            )
+            free[:, 1] += den[:, 1] * free[:, 0]
+            impulse = np.zeros(times.size)
+            impulse[0] = amplitude[0]
+            for j in range(nmode):
+                modal[j] = self.load[j] * (
+                    signal.lfilter(num[j], den[j], amplitude)
+                    - signal.lfilter(free[j], den[j], impulse)
+                )
+
+        response = np.empty((times.size, self.shapes.shape[0]))
+        for start in range(0, times.size, chunk):
+            response[start : start + chunk] = modal[:, start : start + chunk].T @ self.shapes.T
+        return response
+
+
+def _modal_arrays(phi, f, dofs):
+    """Transfer the modal loads and the requested rows of the mode shapes."""
+    mapdl = phi._mapdl
+    mm = AnsMath(mapdl)
+    temporaries = []
+    if not isinstance(f, AnsMathObj) or f._mapdl is not mapdl:
+        f = mm.set_vec(np.asarray(f))
+        temporaries.append(f)
+    (load,) = project(phi, f)
+
+    if dofs is None:
+        shapes = phi.asarray()
+    else:
+        select, remove = _select_rows(mm, dofs, phi.nrow)
+        temporaries.append(select)
+        rows = id_generator()
+        _run_batch(mapdl, [f"*MULT,{select.id},,{phi.id},,{rows}", *remove(rows)])
+        shapes = mapdl._mat_data(rows)
+        mapdl.run(f"*FREE,{rows}", mute=True)
+
+    for obj in temporaries:
+        mm.free(obj)
+    return load, shapes
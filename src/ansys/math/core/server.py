@@ -0,0 +1,310 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains a stand-in gRPC server for PyAnsys Math.
+
+The :class:`StandInServer` class runs an in-process gRPC server implementing
+the MAPDL services used by AnsMath, with the APDL Math commands interpreted
+by the local backend. The latency and the bandwidth of the connection can
+be injected, so that AnsMath can be benchmarked and profiled
+deterministically without MAPDL.
+"""
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+
+from ansys.api.mapdl.v0 import ansys_kernel_pb2 as anskernel
+from ansys.api.mapdl.v0 import mapdl_pb2 as pb_types
+from ansys.api.mapdl.v0 import mapdl_pb2_grpc as mapdl_grpc
+from ansys.mapdl.core.common_grpc import ANSYS_VALUE_TYPE, parse_chunks
+from ansys.mapdl.core.errors import MapdlRuntimeError
+import grpc
+import numpy as np
+
+from ansys.math.core.local import LocalMapdl
+
+# same limits as the MAPDL server
+MAX_MESSAGE_LENGTH = 256 * 1024**2
+GRPC_OPTIONS = [
+    ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+    ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+]
+
+
+class StandInServer:
+    """Provides an in-process gRPC server standing in for MAPDL.
+
+    The server implements the ``SendCommand``, ``GetParameter``,
+    ``GetDataInfo``, ``GetVecData``, ``GetMatData``, ``SetVecData`` and
+    ``SetMatData`` services, and keeps the AnsMath objects in memory. Each
+    call is delayed by the injected latency, and each transfer by its size
+    divided by the injected bandwidth.
+
+    Parameters
+    ----------
+    latency : float, optional
+        Delay added to each call, in seconds. The default is ``0.0``.
+    bandwidth : float, optional
+        Transfer rate of the vector and matrix data, in bytes per second.
+        The default is ``None``, in which case the transfers are not
+        delayed.
+    port : int, optional
+        Port of the server. The default is ``0``, in which case a free port
+        is used.
+    seed : int, optional
+        Seed of the random generator used by ``*INIT,,RAND``.
+
+    Attributes
+    ----------
+    calls : collections.Counter
+        Number of calls of each service.
+    nbytes : collections.Counter
+        Number of bytes received (``"received"``) and sent (``"sent"``).
+
+    Examples
+    --------
+    >>> import ansys.math.core.math as pymath
+    >>> from ansys.math.core.server import StandInServer
+    >>> with StandInServer(latency=1e-3) as server:
+    ...     mm = pymath.AnsMath(server.connect())
+    ...     mm.ones(10).dot(mm.ones(10))
+    10.0
+
+    """
+
+    def __init__(self, latency=0.0, bandwidth=None, port=0, seed=None):
+        """Start a stand-in server."""
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.calls = Counter()
+        self.nbytes = Counter()
+        self._interpreter = LocalMapdl(seed=seed)
+        # the interpreter runs one call at a time, as MAPDL does
+        self._lock = threading.Lock()
+
+        self._server = grpc.server(ThreadPoolExecutor(max_workers=4), options=GRPC_OPTIONS)
+        mapdl_grpc.add_MapdlServiceServicer_to_server(_Servicer(self), self._server)
+        self.port = self._server.add_insecure_port(f"127.0.0.1:{port}")
+        self._server.start()
+
+    def __repr__(self):
+        return f"AnsMath stand-in server on port {self.port} (latency {self.latency:g} s)"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def connect(self):
+        """Return a client connected to the server.
+
+        Returns
+        -------
+        StandInMapdl
+            Client to give to :class:`AnsMath <ansys.math.core.math.AnsMath>`.
+
+        """
+        return StandInMapdl(f"127.0.0.1:{self.port}")
+
+    def reset_stats(self):
+        """Reset the call and byte counters."""
+        self.calls.clear()
+        self.nbytes.clear()
+
+    def stop(self):
+        """Stop the server and delete its objects."""
+        self._server.stop(grace=None)
+        self._interpreter.exit()
+
+    def _delay(self, nbytes=0):
+        """Wait for the injected latency and transfer time."""
+        delay = self.latency
+        if self.bandwidth and nbytes:
+            delay += nbytes / self.bandwidth
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _Servicer(mapdl_grpc.MapdlServiceServicer):
+    """Implement the MAPDL services used by AnsMath."""
+
+    def __init__(self, server):
+        self._server = server
+        self._interpreter = server._interpreter
+
+    def _call(self, name, context, func, *args):
+        """Run a call on the interpreter, reporting its errors to the client."""
+        self._server.calls[name] += 1
+        self._server._delay()
+        with self._server._lock:
+            try:
+                return func(*args)
+            except (MapdlRuntimeError, KeyError, ValueError) as err:
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(err))
+
+    def SendCommand(self, request, context):
+        # several commands separated by new lines are run as a block
+        output = self._call("SendCommand", context, self._run, request.command)
+        return pb_types.CmdResponse(response=output)
+
+    def GetParameter(self, request, context):
+        value = self._call("GetParameter", context, self._interpreter.scalar_param, request.name)
+        return pb_types.ParameterResponse(val=[] if value is None else [value])
+
+    def GetDataInfo(self, request, context):
+        return self._call("GetDataInfo", context, self._interpreter._data_info, request.name)
+
+    def GetVecData(self, request, context):
+        chunks = self._call("GetVecData", context, self._get, "GetVecData", request)
+        yield from self._send(chunks)
+
+    def GetMatData(self, request, context):
+        chunks = self._call("GetMatData", context, self._get, "GetMatData", request)
+        yield from self._send(chunks)
+
+    def SetVecData(self, request_iterator, context):
+        requests = self._receive(request_iterator)
+        self._call("SetVecData", context, self._interpreter._stub.SetVecData, requests)
+        return anskernel.EmptyResponse()
+
+    def SetMatData(self, request_iterator, context):
+        requests = self._receive(request_iterator)
+        self._call("SetMatData", context, self._interpreter._stub.SetMatData, requests)
+        return anskernel.EmptyResponse()
+
+    def _run(self, command):
+        """Run one command, or several commands separated by new lines."""
+        if "\n" in command:
+            return self._interpreter.input_strings(command)
+        return self._interpreter.run(command)
+
+    def _get(self, method, request):
+        """Return the chunks of an object, read while holding the lock."""
+        return list(getattr(self._interpreter._stub, method)(request))
+
+    def _send(self, chunks):
+        """Stream chunks to the client, delaying each one by its transfer time."""
+        for chunk in chunks:
+            self._server.nbytes["sent"] += len(chunk.payload)
+            if self._server.bandwidth:
+                time.sleep(len(chunk.payload) / self._server.bandwidth)
+            yield chunk
+
+    def _receive(self, requests):
+        """Gather streamed requests, delaying each one by its transfer time."""
+        received = []
+        for request in requests:
+            self._server.nbytes["received"] += len(request.chunk.payload)
+            if self._server.bandwidth:
+                time.sleep(len(request.chunk.payload) / self._server.bandwidth)
+            received.append(request)
+        return received
+
+
+class StandInMapdl:
+    """Provides a client of a stand-in server.
+
+    The client implements the subset of the PyMAPDL ``Mapdl`` interface
+    used by AnsMath, with one gRPC call for each command, each block of
+    commands, and each data transfer.
+
+    Parameters
+    ----------
+    target : str
+        Address of the server, such as ``"127.0.0.1:50052"``.
+
+    """
+
+    version = LocalMapdl.version
+    _server_version = LocalMapdl._server_version
+    _local = False
+
+    def __init__(self, target):
+        """Connect to a stand-in server."""
+        self._channel = grpc.insecure_channel(target, options=GRPC_OPTIONS)
+        self._stub = mapdl_grpc.MapdlServiceStub(self._channel)
+        self._log = logging.getLogger(__name__)
+
+    def __repr__(self):
+        return "AnsMath stand-in server client"
+
+    def run(self, command, mute=None, **kwargs):
+        """Run one command and return its output."""
+        response = self._send(command)
+        return "" if mute else response
+
+    def input_strings(self, commands):
+        """Run several commands with a single call."""
+        if not isinstance(commands, str):
+            commands = "\n".join(commands)
+        return self._send(commands)
+
+    def clear(self):
+        """Delete all the objects and parameters of the server."""
+        self.run("/CLEAR", mute=True)
+
+    def exit(self):
+        """Close the connection."""
+        self._channel.close()
+
+    def scalar_param(self, pname):
+        """Return a scalar parameter as a float, or ``None`` if undefined."""
+        response = self._stub.GetParameter(pb_types.ParameterRequest(name=pname))
+        if response.val:
+            return float(response.val[0])
+
+    def _send(self, command):
+        """Send commands and convert the server errors."""
+        try:
+            return self._stub.SendCommand(pb_types.CmdRequest(command=command)).response
+        except grpc.RpcError as err:
+            raise MapdlRuntimeError(err.details()) from None
+
+    def _data_info(self, pname):
+        return self._stub.GetDataInfo(pb_types.ParameterRequest(name=pname))
+
+    def _vec_data(self, pname):
+        dtype = ANSYS_VALUE_TYPE[self._data_info(pname).stype]
+        chunks = self._stub.GetVecData(pb_types.ParameterRequest(name=pname))
+        return parse_chunks(chunks, dtype)
+
+    def _mat_data(self, pname, raw=False):
+        from scipy import sparse
+
+        info = self._data_info(pname)
+        dtype = ANSYS_VALUE_TYPE[info.stype]
+        shape = (info.size1, info.size2)
+        if info.objtype == pb_types.DataType.DMAT:
+            chunks = self._stub.GetMatData(pb_types.ParameterRequest(name=pname))
+            return np.transpose(np.reshape(parse_chunks(chunks, dtype), shape[::-1]))
+        elif info.objtype == pb_types.DataType.SMAT:
+            indptr = self._vec_data(pname + "::ROWS")
+            indices = self._vec_data(pname + "::COLS")
+            vals = self._vec_data(pname + "::VALS")
+            if raw:
+                return vals, indices, indptr, shape
+            return sparse.csr_matrix((vals, indices, indptr), dtype=dtype, shape=shape)
+        raise ValueError(f'Invalid matrix type "{info.objtype}"')
@@ -0,0 +1,192 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the frequency slicing eigensolver of PyAnsys Math.
+
+The frequency range of interest is split into slices that are solved
+concurrently by several MAPDL instances.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from warnings import warn
+
+import numpy as np
+
+from ansys.math.core.pool import transfer
+
+
+class SlicedModes:
+    """Provides the merged eigenpairs of a frequency slicing eigensolve.
+
+    The modes of each slice stay within the MAPDL instance that computed
+    them.
+
+    Attributes
+    ----------
+    freqs : numpy.ndarray
+        Sorted frequencies of all the slices in Hz, without duplicates.
+    slices : list
+        One ``(mm, phi, columns)`` tuple per slice, where ``phi`` is the
+        dense matrix of the modes of the slice within the ``mm`` AnsMath
+        instance and ``columns`` are the indices of the columns of ``phi``
+        that are kept in :attr:`SlicedModes.freqs`.
+
+    """
+
+    def __init__(self, freqs, slices):
+        """Initiate the merged eigenpairs."""
+        self.freqs = freqs
+        self.slices = slices
+
+    def __len__(self):
+        return self.freqs.size
+
+    def __repr__(self):
+        return f"AnsMath sliced modes ({len(self)} modes in {len(self.slices)} slices)"
+
+    def asarray(self):
+        """Return the modes as a NumPy array.
+
+        Returns
+        -------
+        numpy.ndarray
+            Modes stored as columns, in the order of :attr:`SlicedModes.freqs`.
+
+        """
+        blocks = [phi.asarray()[:, columns] for _, phi, columns in self.slices if columns.size]
+        return np.hstack(blocks)
+
+    def free(self):
+        """Delete the modes of all the slices within MAPDL."""
+        for mm, phi, _ in self.slices:
+            mm.free(phi)
+        self.slices = []
+
+
+def sliced_modal(k, m, fmin, fmax, pool, nslices=None, nev=100, algo=None, tol=1e-8):
+    """Solve an eigenproblem by splitting a frequency range in slices.
+
+    Each slice is solved with :func:`AnsMath.modal` on one of the AnsMath
+    instances of the pool, and the instances solve their slices
+    concurrently. The stiffness and mass matrices are sent to each instance
+    only once, whatever the number of slices it solves. Eigenpairs found
+    twice at the boundary of two slices are kept once.
+
+    Parameters
+    ----------
+    k : AnsMat
+        Stiffness matrix.
+    m : AnsMat
+        Mass matrix.
+    fmin : float
+        Lower end of the frequency range in Hz.
+    fmax : float
+        Upper end of the frequency range in Hz.
+    pool : sequence of AnsMath or AnsMathPool
+        AnsMath instances solving the slices. The instance that owns ``k``
+        and ``m`` can be part of the pool.
+    nslices : int, optional
+        Number of slices of equal width. The default is the number of
+        instances in the pool.
+    nev : int, optional
+        Maximum number of modes of each slice. The default is ``100``.
+    algo : str, optional
+        Eigensolver. See :func:`AnsMath.modal`.
+    tol : float, optional
+        Relative tolerance below which two frequencies of adjacent slices
+        are considered as a single eigenpair. The default is ``1e-8``.
+
+    Returns
+    -------
+    SlicedModes
+        Merged eigenpairs of all the slices.
+
+    Examples
+    --------
+    Compute the modes between 0 Hz and 5000 Hz with three MAPDL instances.
+
+    >>> from ansys.mapdl.core import launch_mapdl
+    >>> from ansys.math.core.slicing import sliced_modal
+    >>> pool = [mm] + [AnsMath(launch_mapdl(port=50053 + i)) for i in range(2)]
+    >>> modes = sliced_modal(k, m, 0, 5000, pool, nslices=6)
+    >>> modes.freqs
+    array([  48.1,  103.9, ... ])
+
+    """
+    pool = list(pool)
+    if not pool:
+        raise ValueError("The pool must contain at least one AnsMath instance.")
+    nslices = nslices or len(pool)
+    bounds = np.linspace(fmin, fmax, nslices + 1)
+
+    # matrices are streamed to the instances that need them before solving
+    copies = {
+        index: (transfer(k, mm), transfer(m, mm))
+        for index, mm in enumerate(pool[:nslices])
+        if mm._mapdl is not k._mapdl
+    }
+
+    def solve(index):
+        mm = pool[index]
+        copied = index in copies
+        kk, mk = copies[index] if copied else (k, m)
+
+        results = []
+        for islice in range(index, nslices, len(pool)):
+            lo, hi = bounds[islice], bounds[islice + 1]
+            mm._mapdl._log.info("Solving the slice [%g, %g] Hz.", lo, hi)
+            freqs, phi = mm.modal(kk, mk, nev=nev, fmin=lo, fmax=hi, algo=algo)
+            if freqs.size >= nev:
+                warn(
+                    f"The slice [{lo:g}, {hi:g}] Hz contains at least {nev} modes. "
+                    "Increase ``nev`` or ``nslices`` to compute all of them."
+                )
+            results.append((islice, mm, freqs, phi))
+
+        if copied:
+            mm.free(kk)
+            mm.free(mk)
+        return results
+
+    workers = min(len(pool), nslices)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = [each for batch in executor.map(solve, range(workers)) for each in batch]
+    results.sort(key=lambda each: each[0])
+
+    freqs = []
+    slices = []
+    last_freq, last_slice = None, None
+    for islice, mm, slice_freqs, phi in results:
+        columns = []
+        for column, freq in enumerate(slice_freqs):
+            if (
+                last_slice is not None
+                and last_slice != islice
+                and abs(freq - last_freq) <= tol * max(abs(freq), 1.0)
+            ):
+                continue
+            columns.append(column)
+            freqs.append(freq)
+            last_freq, last_slice = freq, islice
+        slices.append((mm, phi, np.array(columns, dtype=int)))
+
+    return SlicedModes(np.array(freqs), slices)
@@ -0,0 +1,355 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Contains the parametric sweep drivers of PyAnsys Math."""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+import numpy as np
+
+from ansys.math.core.math import AnsMath, AnsMathObj, _run_batch, _select_rows, id_generator
+from ansys.math.core.pool import transfer
+
+
+class ModalSweep:
+    """Provides a modal analysis driver for parametric sweeps.
+
+    Each sweep point is started from the modes of the previous point, see
+    :func:`AnsMath.modal`. When the projection of the eigenproblem on these
+    modes has converged, the full eigensolve is skipped, and the time saved
+    is estimated from the duration of the last full eigensolve. With a
+    frequency window, the projected eigenpairs must also be as many as the
+    modes found in the window by the last full eigensolve.
+
+    Parameters
+    ----------
+    mm : AnsMath
+        AnsMath instance.
+    nev : int, optional
+        Number of modes of each sweep point. The default is ``10``.
+    fmin : float, optional
+        Lower end of the frequency window in Hz.
+    fmax : float, optional
+        Upper end of the frequency window in Hz.
+    algo : str, optional
+        Eigensolver of the full eigensolves. See :func:`AnsMath.modal`.
+    tol : float, optional
+        Relative residual norm below which the projected eigenpairs are
+        accepted. The default is ``1e-6``.
+    keep : bool, optional
+        Whether to keep the modes of all the sweep points within MAPDL. The
+        default is ``False``, in which case the modes of a sweep point are
+        deleted when the next sweep point is solved.
+
+    Attributes
+    ----------
+    history : list of dict
+        One dictionary per sweep point with the ``"warm"`` key telling if
+        the full eigensolve was skipped, the ``"time"`` key with the solve
+        time in seconds, and the ``"saved"`` key with the estimated time
+        saved in seconds.
+
+    Examples
+    --------
+    >>> from ansys.math.core.sweep import ModalSweep
+    >>> sweep = ModalSweep(mm, nev=20)
+    >>> for fname in ["design_0.full", "design_1.full", "design_2.full"]:
+    ...     k = mm.stiff(fname=fname)
+    ...     m = mm.mass(fname=fname)
+    ...     freqs, phi = sweep.solve(k, m)
+    >>> sweep.time_saved
+    12.3
+
+    """
+
+    def __init__(self, mm, nev=10, fmin=None, fmax=None, algo=None, tol=1e-6, keep=False):
+        """Initiate a modal sweep."""
+        self._mm = mm
+        self.nev = nev
+        self.fmin = fmin
+        self.fmax = fmax
+        self.algo = algo
+        self.tol = tol
+        self.keep = keep
+        self.history = []
+        self._phi = None
+        self._full_time = None
+        self._count = None
+
+    def __repr__(self):
+        warm = sum(point["warm"] for point in self.history)
+        return (
+            f"AnsMath modal sweep ({len(self.history)} points, {warm} warm, "
+            f"{self.time_saved:.3f} s saved)"
+        )
+
+    @property
+    def time_saved(self):
+        """Estimated time saved over all the sweep points in seconds."""
+        return sum(point["saved"] for point in self.history)
+
+    def solve(self, k, m):
+        """Solve the eigenproblem of a sweep point.
+
+        Parameters
+        ----------
+        k : AnsMat
+            Stiffness matrix.
+        m : AnsMat
+            Mass matrix.
+
+        Returns
+        -------
+        numpy.ndarray
+            Frequencies in Hz.
+        AnsDenseMat
+            Modes stored as columns.
+
+        """
+        mm = self._mm
+        tstart = time.perf_counter()
+        result = None
+        if self._phi is not None:
+            result = mm._warm_modal(
+                k, m, self._phi, self.nev, self.fmin, self.fmax, self.tol, self._count
+            )
+        warm = result is not None
+        if warm:
+            freqs, phi = result
+        else:
+            freqs, phi = mm.modal(
+                k, m, nev=self.nev, fmin=self.fmin, fmax=self.fmax, algo=self.algo
+            )
+        elapsed = time.perf_counter() - tstart
+
+        saved = 0.0
+        if warm:
+            if self._full_time is not None:
+                saved = self._full_time - elapsed
+        else:
+            self._full_time = elapsed
+            self._count = freqs.size
+        self.history.append({"warm": warm, "time": elapsed, "saved": saved})
+        mm._mapdl._log.info(
+            "Sweep point %d solved in %.3f s (%s, %.3f s saved).",
+            len(self.history),
+            elapsed,
+            "warm" if warm else "full",
+            saved,
+        )
+
+        if self._phi is not None and not self.keep:
+            mm.free(self._phi)
+        self._phi = phi
+        return freqs, phi
+
+
+class HarmonicSweep:
+    """Provides a harmonic analysis driver for frequency sweeps.
+
+    At each frequency :math:`f`, the linear system
+    :math:`(K - \\omega^2 M + i \\omega C) x = F`, where
+    :math:`\\omega = 2 \\pi f`, is solved within MAPDL.
+
+    The dynamic stiffness matrix is assembled in place into a single complex
+    sparse matrix, which is allocated once, and the same solver engine
+    factorizes it at every frequency. The commands of a block of
+    frequencies are sent to MAPDL at once, and the responses of the block
+    are retrieved in a single transfer. The frequencies can be distributed
+    across several MAPDL instances.
+
+    Parameters
+    ----------
+    k : AnsMat
+        Stiffness matrix.
+    m : AnsMat
+        Mass matrix.
+    rhs : AnsVec or numpy.ndarray
+        Load vector.
+    c : AnsMat, optional
+        Damping matrix. The default is ``None``, in which case the system
+        is undamped.
+    dofs : sequence of int, optional
+        Zero-based indices of the equations whose response is retrieved.
+        They are extracted within MAPDL with a sparse selection matrix.
+        The default is ``None``, in which case the response of all the
+        equations is retrieved.
+    algo : str, optional
+        Sparse solver. The default is ``"DSP"``.
+    pool : sequence of AnsMath or AnsMathPool, optional
+        AnsMath instances sharing the frequencies. The matrices are
+        streamed to each instance that does not own them. The default is
+        ``None``, in which case the instance that owns ``k`` solves all
+        the frequencies.
+    block : int, optional
+        Number of frequencies sent to MAPDL at once. The default is ``50``.
+
+    Notes
+    -----
+    The sparsity pattern of ``m`` and ``c`` must be included in the
+    sparsity pattern of ``k``, which is the case for matrices assembled
+    from the same finite element model.
+
+    Examples
+    --------
+    >>> from ansys.math.core.sweep import HarmonicSweep
+    >>> k = mm.stiff(fname="file.full")
+    >>> m = mm.mass(fname="file.full")
+    >>> c = mm.damp(fname="file.full")
+    >>> f = mm.rhs(fname="file.full")
+    >>> sweep = HarmonicSweep(k, m, f, c=c, dofs=[10, 11, 12])
+    >>> response = sweep.solve(np.linspace(1, 500, 500))
+    >>> response.shape
+    (500, 3)
+
+    """
+
+    def __init__(self, k, m, rhs, c=None, dofs=None, algo=None, pool=None, block=50):
+        """Initiate a harmonic sweep."""
+        self.k = k
+        self.m = m
+        self.c = c
+        self.rhs = rhs
+        self.dofs = None
+        if dofs is not None:
+            self.dofs = np.asarray(dofs, dtype=np.int64).ravel()
+            if self.dofs.size and (self.dofs.min() < 0 or self.dofs.max() >= k.nrow):
+                raise ValueError(
+                    f"The equation indices in ``dofs`` must be between 0 and {k.nrow - 1}."
+                )
+        self.algo = algo or "DSP"
+        self.pool = list(pool) if pool else [AnsMath(k._mapdl)]
+        self.block = block
+
+    def __repr__(self):
+        return f"AnsMath harmonic sweep ({len(self.pool)} instances)"
+
+    def solve(self, freqs):
+        """Solve the harmonic response at several frequencies.
+
+        Parameters
+        ----------
+        freqs : sequence of float
+            Frequencies in Hz.
+
+        Returns
+        -------
+        numpy.ndarray
+            Complex response with one row per frequency and one column per
+            retrieved equation.
+
+        """
+        freqs = np.asarray(freqs, dtype=np.double)
+        nrow = self.k.nrow
+        nout = nrow if self.dofs is None else self.dofs.size
+        response = np.empty((freqs.size, nout), dtype=np.complex128)
+
+        pool = self.pool[: max(freqs.size, 1)]
+        chunks = np.array_split(np.arange(freqs.size), len(pool))
+        jobs = [(mm, rows) for mm, rows in zip(pool, chunks) if rows.size]
+        # matrices are streamed to the instances that need them before solving
+        matrices = [
+            (
+                (self.k, self.m, self.c)
+                if mm._mapdl is self.k._mapdl
+                else tuple(
+                    None if obj is None else transfer(obj, mm) for obj in (self.k, self.m, self.c)
+                )
+            )
+            for mm, _ in jobs
+        ]
+
+        with ThreadPoolExecutor(max_workers=max(len(jobs), 1)) as executor:
+            futures = [
+                executor.submit(self._solve_chunk, mm, mats, nrow, freqs, rows, response)
+                for (mm, rows), mats in zip(jobs, matrices)
+            ]
+            for future in futures:
+                future.result()
+        return response
+
+    def _solve_chunk(self, mm, matrices, nrow, freqs, rows, response):
+        """Solve the frequencies of one AnsMath instance."""
+        mapdl = mm._mapdl
+        k, m, c = matrices
+        temporaries = []
+        if mapdl is not self.k._mapdl:
+            temporaries.extend(obj for obj in matrices if obj is not None)
+
+        rhs = self.rhs
+        if not isinstance(rhs, AnsMathObj):
+            rhs = mm.set_vec(np.asarray(rhs))
+            temporaries.append(rhs)
+        elif rhs._mapdl is not mapdl:
+            rhs = transfer(rhs, mm)
+            temporaries.append(rhs)
+
+        select = None
+        if self.dofs is not None:
+            nout = self.dofs.size
+            select, remove = _select_rows(mm, self.dofs, nrow, np.complex128)
+            temporaries.append(select)
+        else:
+            nout = nrow
+
+        dynamic, engine, load, sol, sub, res, col = (id_generator() for _ in range(7))
+        _run_batch(
+            mapdl,
+            [
+                f"*SMAT,{dynamic},Z,COPY,{k.id}",
+                f"*LSENGINE,{self.algo},{engine},{dynamic}",
+                f"*VEC,{load},Z,COPY,{rhs.id}",
+                f"*VEC,{sol},Z,ALLOC,{nrow}",
+            ],
+        )
+
+        for start in range(0, rows.size, self.block):
+            block = rows[start : start + self.block]
+            commands = [f"*DMAT,{res},Z,ALLOC,{nout},{block.size}"]
+            for j, freq in enumerate(freqs[block], start=1):
+                omega = 2 * np.pi * freq
+                commands.extend(
+                    [
+                        f"*AXPY,1,0,{k.id},0,0,{dynamic}",
+                        f"*AXPY,{-omega * omega},0,{m.id},1,0,{dynamic}",
+                    ]
+                )
+                if c is not None:
+                    commands.append(f"*AXPY,0,{omega},{c.id},1,0,{dynamic}")
+                commands.extend([f"*LSFACTOR,{engine}", f"*LSBAC,{engine},{load},{sol}"])
+
+                out = sol
+                if select is not None:
+                    out = sub
+                    commands.extend([f"*MULT,{select.id},,{sol},,{sub}", *remove(sub)])
+                commands.extend([f"*VEC,{col},Z,LINK,{res},{j}", f"*AXPY,1,0,{out},0,0,{col}"])
+            _run_batch(mapdl, commands)
+            response[block] = mapdl._mat_data(res).T
+            mapdl._log.info("Solved %d frequencies.", block.size)
+
+        for name in (col, res, sol, load, engine, dynamic):
+            mapdl.run(f"*FREE,{name}", mute=True)
+        if select is not None:
+            mapdl.run(f"*FREE,{sub}", mute=True)
+        for obj in temporaries:
+            mm.free(obj)
@@ -0,0 +1,209 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Fixtures of the AnsMath benchmark suite.
+
+The benchmarks are skipped unless the ``PYANSYS_MATH_BENCHMARK``
+environment variable selects the server they run against:
+
+- ``standin``: an in-process :class:`StandInServer
+  <ansys.math.core.server.StandInServer>`, which needs no MAPDL.
+- ``mapdl``: the MAPDL instance of the ``mapdl`` fixture.
+
+Each benchmark is compared to the baseline stored in
+``baselines/<server>.json``. It fails when it makes more round trips to
+MAPDL, or transfers more bytes, than its baseline. These counts do not
+depend on the machine running the benchmarks.
+
+Timings are only compared when ``PYANSYS_MATH_BENCHMARK_TIMING=1``. They
+are divided by the time of a calibration workload measured at the start
+of the session, and a benchmark fails when this relative time exceeds the
+baseline by more than ``PYANSYS_MATH_BENCHMARK_THRESHOLD`` (``0.5`` by
+default). Set ``PYANSYS_MATH_BENCHMARK_UPDATE=1`` to store the measured
+values as the new baselines instead.
+"""
+
+import json
+import os
+from pathlib import Path
+import statistics
+import time
+
+import numpy as np
+import pytest
+
+import ansys.math.core.math as pymath
+
+SERVER = os.environ.get("PYANSYS_MATH_BENCHMARK", "").lower()
+UPDATE = os.environ.get("PYANSYS_MATH_BENCHMARK_UPDATE", "0").lower() in ("1", "true", "yes")
+TIMING = os.environ.get("PYANSYS_MATH_BENCHMARK_TIMING", "0").lower() in ("1", "true", "yes")
+THRESHOLD = float(os.environ.get("PYANSYS_MATH_BENCHMARK_THRESHOLD", "0.5"))
+BASELINES = Path(__file__).parent / "baselines"
+COUNTS = ("round_trips", "bytes_up", "bytes_down")
+
+
+def pytest_collection_modifyitems(config, items):
+    if SERVER in ("standin", "mapdl"):
+        return
+    skip = pytest.mark.skip(reason="Set PYANSYS_MATH_BENCHMARK to 'standin' or 'mapdl'.")
+    for item in items:
+        if "benchmarks" in Path(str(item.fspath)).parts:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def server():
+    if SERVER != "standin":
+        yield None
+        return
+
+    from ansys.math.core.server import StandInServer
+
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def mm(request, server):
+    if server is None:
+        mm = pymath.AnsMath(request.getfixturevalue("mapdl"))
+        yield mm
+        mm.free()
+        return
+
+    mm = pymath.AnsMath(server.connect())
+    yield mm
+    mm._mapdl.exit()
+
+
+@pytest.fixture(scope="session")
+def calibration():
+    """Return the best time of a fixed NumPy workload, the unit of the relative timings."""
+    if not TIMING:
+        return None
+    array = np.random.default_rng(0).random(1_000_000)
+    times = []
+    for _ in range(5):
+        tstart = time.perf_counter()
+        for _ in range(10):
+            np.sort(array).sum()
+        times.append(time.perf_counter() - tstart)
+    return min(times)
+
+
+@pytest.fixture(scope="session")
+def baselines():
+    path = BASELINES / f"{SERVER}.json"
+    stored = json.loads(path.read_text()) if path.is_file() else {}
+    measured = {}
+    yield stored, measured
+
+    if UPDATE and measured:
+        for name, value in measured.items():
+            stored[name] = {**stored.get(name, {}), **value}
+        BASELINES.mkdir(exist_ok=True)
+        path.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n")
+
+
+class Benchmark:
+    """Count the round trips of a function, time it, and compare it to its baseline.
+
+    Parameters
+    ----------
+    name : str
+        Name of the baseline.
+    mm : AnsMath
+        AnsMath instance whose calls are counted.
+    calibration : float or None
+        Time of the calibration workload, or ``None`` when the timings are
+        not compared.
+    baselines : tuple(dict, dict)
+        Stored baselines, and measured values.
+    """
+
+    def __init__(self, name, mm, calibration, baselines):
+        self.name = name
+        self._mm = mm
+        self._calibration = calibration
+        self._stored, self._measured = baselines
+
+    def __call__(self, func, *args, repeat=5, teardown=None, **kwargs):
+        """Run ``func(*args, **kwargs)`` once after a warm-up run, and time it when enabled.
+
+        The calls of the first run after the warm-up are counted. When the
+        timings are compared, ``func`` is run ``repeat`` times, without
+        counting the calls. ``teardown`` is called with the result of each
+        run, outside of the timing, to delete the objects it creates. The
+        result of the last run is returned.
+        """
+        result = func(*args, **kwargs)
+        if teardown is not None:
+            teardown(result)
+
+        with self._mm.track() as stats:
+            result = func(*args, **kwargs)
+        value = {"round_trips": stats.round_trips}
+        value.update(bytes_up=stats.bytes_up, bytes_down=stats.bytes_down)
+
+        if self._calibration is not None:
+            times = []
+            for _ in range(repeat):
+                if teardown is not None:
+                    teardown(result)
+                tstart = time.perf_counter()
+                result = func(*args, **kwargs)
+                times.append(time.perf_counter() - tstart)
+            value["relative"] = _round(min(times) / self._calibration)
+            value["relative_median"] = _round(statistics.median(times) / self._calibration)
+
+        self._measured[self.name] = value
+        if not UPDATE:
+            self._compare(value)
+        return result
+
+    def _compare(self, value):
+        baseline = self._stored.get(self.name)
+        if baseline is None:
+            return
+
+        for key in COUNTS:
+            if key in baseline and value[key] > baseline[key]:
+                pytest.fail(
+                    f"{self.name} has {value[key]} {key.replace('_', ' ')}, "
+                    f"more than its baseline of {baseline[key]}."
+                )
+        if "relative" in value and "relative" in baseline:
+            limit = baseline["relative"] * (1 + THRESHOLD)
+            if value["relative"] > limit:
+                pytest.fail(
+                    f"{self.name} takes {value['relative']:.3g} calibration units, more than "
+                    f"{1 + THRESHOLD:g} times its baseline of {baseline['relative']:.3g}."
+                )
+
+
+def _round(value):
+    return float(f"{value:.4g}")
+
+
+@pytest.fixture()
+def benchmark(request, mm, calibration, baselines):
+    return Benchmark(request.node.name, mm, calibration, baselines)
@@ -0,0 +1,113 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Benchmark the AnsMath hot paths.
+
+See ``conftest.py`` in this directory to run the benchmarks and to update
+their baselines.
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+SIZES = [1_000, 100_000, 1_000_000]
+CHUNK_SIZES = [64 * 1024, 256 * 1024, 1024 * 1024, 4 * 1024 * 1024]
+NNZ = [10_000, 100_000, 1_000_000]
+
+
+@pytest.fixture()
+def free(mm):
+    return mm.free
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_set_vec(benchmark, mm, free, size):
+    array = np.random.default_rng(0).random(size)
+    benchmark(mm.set_vec, array, teardown=free)
+
+
+@pytest.mark.parametrize("chunk_size", CHUNK_SIZES)
+def test_set_vec_chunk_size(benchmark, mm, chunk_size):
+    array = np.random.default_rng(0).random(1_000_000)
+    benchmark(mm._set_vec, "BENCH_VEC", array, chunk_size=chunk_size)
+    mm._mapdl.run("*FREE,BENCH_VEC", mute=True)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_asarray(benchmark, mm, size):
+    vec = mm.set_vec(np.random.default_rng(0).random(size))
+    array = benchmark(vec.asarray)
+    assert array.size == size
+    mm.free(vec)
+
+
+@pytest.mark.parametrize("nnz", NNZ)
+def test_send_sparse(benchmark, mm, nnz):
+    rng = np.random.default_rng(0)
+    dim = nnz // 10
+    rows = np.repeat(np.arange(dim), 10)
+    array = sparse.csr_matrix((rng.random(nnz), (rows, rng.integers(0, dim, nnz))), (dim, dim))
+    benchmark(mm._send_sparse, "BENCH_SMAT", array, False, None, 1024 * 1024)
+    mm._mapdl.run("*FREE,BENCH_SMAT", mute=True)
+
+
+@pytest.mark.parametrize("operation", ["axpy", "dot", "norm", "copy"])
+def test_vec_latency(benchmark, mm, free, operation):
+    v1 = mm.ones(1000)
+    v2 = mm.rand(1000)
+    if operation == "axpy":
+        benchmark(v1.axpy, v2, 1.0, 1.0)
+    elif operation == "dot":
+        benchmark(v1.dot, v2)
+    elif operation == "norm":
+        benchmark(v1.norm)
+    else:
+        benchmark(v1.copy, teardown=free)
+    mm.free(v1)
+    mm.free(v2)
+
+
+def test_factorize_solve(benchmark, mm, free, spring_chain):
+    k, _ = spring_chain(10_000)
+    kmat = mm.matrix(k, triu=False)
+    b = mm.ones(k.shape[0])
+
+    def factorize_solve():
+        solver = mm.factorize(kmat, cache=False)
+        x = solver.solve(b)
+        mm.free(solver)
+        return x
+
+    x = benchmark(factorize_solve, teardown=free)
+    assert np.allclose(k @ x.asarray(), 1)
+    mm.free()
+
+
+def test_eigs(benchmark, mm, free, spring_chain):
+    k, m = spring_chain(2_000)
+    kmat = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mmat = mm.matrix(m, triu=True)
+    phi = mm.mat(k.shape[0], 10)
+    ev = benchmark(mm.eigs, 10, kmat, mmat, phi=phi, teardown=free)
+    assert ev.asarray().size == 10
+    mm.free()
@@ -24,6 +24,7 @@ import os
 from pathlib import Path
 
 import pytest
+from scipy import sparse
 
 # import time
 
@@ -174,3 +175,15 @@ def cube_solve(cleared, mapdl):
 
     # solve first 10 non-trivial modes
     out = mapdl.modal_analysis(nmode=10, freqb=1)
+
+
+@pytest.fixture(scope="session")
+def spring_chain():
+    """Return a function building the stiffness and mass matrices of a chain of springs."""
+
+    def build(dim):
+        k = (sparse.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(dim, dim)) * 1e6).tocsr()
+        m = (sparse.eye(dim) * 1e-2).tocsr()
+        return k, m
+
+    return build
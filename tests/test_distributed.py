@@ -0,0 +1,92 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the distributed dense matrices."""
+
+import numpy as np
+import pytest
+
+from ansys.math.core import distributed
+from ansys.math.core.pool import AnsMathPool
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def pool(mapdl):
+    pool = AnsMathPool(mapdl=[mapdl])
+    yield pool
+    pool.close()
+
+
+@pytest.fixture()
+def mat(pool):
+    array = np.random.random((200, 23))
+    mat = distributed.distribute(array, pool)
+    yield mat, array
+    mat.free()
+
+
+def test_distribute(mat):
+    mat, array = mat
+    assert mat.shape == array.shape
+    assert np.allclose(mat.asarray(), array)
+
+
+def test_dot(mat):
+    mat, array = mat
+    vec = np.random.random(array.shape[1])
+    assert np.allclose(mat.dot(vec), array @ vec)
+    vec = np.random.random(array.shape[0])
+    assert np.allclose(mat.tdot(vec), array.T @ vec)
+
+    with pytest.raises(ValueError, match="must have"):
+        mat.dot(np.ones(3))
+
+
+def test_norms_gram(mat):
+    mat, array = mat
+    assert np.allclose(mat.norms(), np.linalg.norm(array, axis=0))
+    assert np.allclose(mat.gram(), array.T @ array)
+
+
+def test_orthonormalize(mat):
+    mat, array = mat
+    mat.orthonormalize()
+    ortho = mat.asarray()
+    assert np.allclose(ortho.T @ ortho, np.eye(array.shape[1]))
+    # same column space, in the same order
+    basis, _ = np.linalg.qr(array)
+    assert np.allclose(np.abs(basis), np.abs(ortho))
+
+
+def test_rand(pool):
+    mat = distributed.rand(50, 7, pool)
+    assert mat.shape == (50, 7)
+    mat.free()
+
+
+def test_invalid_blocks(pool):
+    mm = pool[0]
+    with pytest.raises(ValueError, match="different MAPDL instances"):
+        distributed.AnsDistributedMat([mm.rand(5, 2), mm.rand(5, 2)])
@@ -0,0 +1,280 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the reader of FULL files, which runs without MAPDL."""
+
+import os
+import shutil
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from ansys.math.core.full import HEADER_ITEMS, FullData, FullFile
+import ansys.math.core.math as pymath
+
+INT_FLAGS = 0x80 << 24
+
+
+def record(values, integer=True, order="<"):
+    """Return the bytes of a record."""
+    data = np.asarray(values).astype(f"{order}i4" if integer else f"{order}f8").tobytes()
+    size = len(data) // 4
+    flags = INT_FLAGS if integer else 0
+    header = np.array([size, flags], dtype=f"{order}u4").tobytes()
+    return header + data + np.array([size], dtype=f"{order}u4").tobytes()
+
+
+def set_long(header, name, value):
+    header[HEADER_ITEMS[name + "l"]] = value & 0xFFFFFFFF
+    header[HEADER_ITEMS[name + "h"]] = value >> 32
+
+
+def write_full(path, k, m, rhs, nodes, labels, keyuns=0, order="<"):
+    """Write a FULL file with the layout of the sparse assembly.
+
+    ``k`` and ``m`` are the upper triangles of the matrices, with all the
+    equations, and ``labels`` are negative for the constrained equations.
+    """
+    neqn = k.shape[0]
+    ndof = neqn // len(nodes)
+    header = np.zeros(100, dtype=np.int64)
+    header[HEADER_ITEMS["neqn"]] = neqn
+    header[HEADER_ITEMS["nmrow"]] = np.count_nonzero(np.asarray(labels) > 0)
+    header[HEADER_ITEMS["numdof"]] = ndof
+    header[HEADER_ITEMS["nNodes"]] = len(nodes)
+    header[HEADER_ITEMS["keyuns"]] = keyuns
+
+    words = [
+        record([100] * 100, order=order),
+        None,
+        record(np.arange(1, ndof + 1), order=order),
+        record(nodes, order=order),
+    ]
+    ptr = 206 + sum(len(each) // 4 for each in words[2:])
+    for name, mat in (("STF", k), ("MAS", m)):
+        mat = sparse.csr_matrix(mat)
+        set_long(header, "ptr" + name, ptr)
+        set_long(header, {"STF": "ntermK", "MAS": "ntermM"}[name], mat.nnz)
+        for i in range(neqn):
+            row = slice(mat.indptr[i], mat.indptr[i + 1])
+            # the columns are not sorted in the FULL files
+            words.append(record(mat.indices[row][::-1] + 1, order=order))
+            words.append(record(mat.data[row][::-1], integer=False, order=order))
+            ptr += (len(words[-2]) + len(words[-1])) // 4
+    set_long(header, "ptrRHS", ptr)
+    words.append(record(rhs, integer=False, order=order))
+    ptr += len(words[-1]) // 4
+    set_long(header, "ptrDOF", ptr)
+    words.append(record([ndof] * len(nodes), order=order))
+    words.append(record(labels, order=order))
+
+    words[1] = record(header.astype(np.uint32).view(np.int32), order=order)
+    with open(path, "wb") as fid:
+        fid.write(b"".join(words))
+
+
+@pytest.fixture()
+def model():
+    # 4 nodes with 2 degrees of freedom, the first node being constrained
+    rng = np.random.default_rng(0)
+    a = sparse.random(8, 8, density=0.4, random_state=0) + 10 * sparse.eye(8)
+    k = sparse.triu(a + a.T).tocsr()
+    m = sparse.triu(sparse.diags(rng.random(8) + 1) + 0.1 * sparse.eye(8, k=1)).tocsr()
+    rhs = rng.random(8)
+    nodes = [7, 3, 5, 1]
+    labels = [-1, -2, 1, 2, 1, 2, 1, 2]
+    return k, m, rhs, nodes, labels
+
+
+@pytest.fixture()
+def full_file(tmpdir, model):
+    fname = str(tmpdir.join("model.full"))
+    write_full(fname, *model)
+    return fname
+
+
+def test_read(full_file, model):
+    k, m, rhs, nodes, labels = model
+    free = np.array(labels) > 0
+    with FullFile(full_file) as full:
+        assert full.neqn == 8
+        assert full.nrow == 6
+        kf = full.stiff()
+        mf = full.mass()
+        assert sparse.isspmatrix_csr(kf)
+        assert kf.has_sorted_indices
+        assert np.allclose(kf.toarray(), k.toarray()[free][:, free])
+        assert np.allclose(mf.toarray(), m.toarray()[free][:, free])
+        assert np.allclose(full.rhs(), rhs[free])
+        assert full.dof_ref.tolist() == [[3, 1], [3, 2], [5, 1], [5, 2], [1, 1], [1, 2]]
+        assert full.constrained.tolist() == [[7, 1], [7, 2]]
+        assert np.allclose(full.matrix("STIFF").toarray(), kf.toarray())
+        with pytest.raises(ValueError, match="no damping matrix"):
+            full.damp()
+        with pytest.raises(NotImplementedError):
+            full.matrix("GMAT")
+
+
+def test_big_endian(tmpdir, full_file, model):
+    fname = str(tmpdir.join("big.full"))
+    write_full(fname, *model, order=">")
+    with FullFile(fname) as full, FullFile(full_file) as ref:
+        assert np.allclose(full.stiff().toarray(), ref.stiff().toarray())
+        assert np.allclose(full.rhs(), ref.rhs())
+        assert full.stiff().dtype == np.float64
+
+
+def test_unsupported(tmpdir, model):
+    fname = str(tmpdir.join("unsym.full"))
+    write_full(fname, *model, keyuns=1)
+    with pytest.raises(NotImplementedError, match="unsymmetric"):
+        FullFile(fname)
+
+    with pytest.raises(ValueError, match="not a MAPDL binary file"):
+        FullFile(__file__)
+
+
+def test_load_local(full_file, model):
+    k, m, rhs, nodes, labels = model
+    free = np.array(labels) > 0
+    mm = pymath.AnsMath(backend="local")
+    shutil.copy(full_file, mm._mapdl.directory)
+
+    # asarray loads are read in Python, without any call to the backend
+    with mm.expect_round_trips(max=0):
+        ka = mm.stiff(fname="model.full", asarray=True)
+        rhs_a = mm.rhs(fname="model.full", asarray=True)
+    assert np.allclose(ka.toarray(), k.toarray()[free][:, free])
+    assert np.allclose(rhs_a, rhs[free])
+
+    # the local backend imports FULL files with the same reader
+    kmat = mm.stiff(fname="model.full")
+    assert kmat.shape == (6, 6)
+    assert np.allclose(kmat.asarray().toarray(), ka.toarray())
+    assert np.allclose(mm.rhs(fname="model.full").asarray(), rhs[free])
+    mm._mapdl.exit()
+
+
+def test_reader_file():
+    reader = pytest.importorskip("ansys.mapdl.reader")
+    from ansys.mapdl.reader import examples
+
+    ref = reader.read_binary(examples.fullfile)
+    _, k_ref, m_ref = ref.load_km(sort=False)
+    with FullFile(examples.fullfile) as full:
+        free = np.array([label > 0 for label in full._labels])
+        assert np.allclose(full.stiff().toarray(), k_ref.toarray()[free][:, free])
+        assert np.allclose(full.mass().toarray(), m_ref.toarray()[free][:, free])
+
+
+def test_upload_cache(full_file, model, monkeypatch):
+    mm = pymath.AnsMath(backend="local")
+    # files are uploaded to the working directory of a remote instance
+    monkeypatch.setattr(mm._mapdl, "_local", False)
+    cache = mm.upload_cache
+    assert cache is pymath.AnsMath(mm._mapdl).upload_cache
+
+    kmat = mm.stiff(fname=full_file)
+    mmat = mm.mass(fname=full_file)
+    assert mm.rhs(fname=full_file).size == 6
+    assert cache.uploads == 1
+    assert cache.hits == 2
+    assert cache.holds(full_file)
+    assert kmat.shape == mmat.shape == (6, 6)
+
+    # the uploaded copy is current, so the local file is read in Python
+    with mm.expect_round_trips(max=0):
+        assert mm.mass(fname=full_file, asarray=True).shape == (6, 6)
+    assert cache.uploads == 1
+
+    # touching the file does not change its content
+    os.utime(full_file, ns=(0, 0))
+    mm.stiff(fname=full_file)
+    assert cache.uploads == 1
+
+    # a modified file is uploaded again
+    k, m, rhs, nodes, labels = model
+    write_full(full_file, 2 * k, m, rhs, nodes, labels)
+    assert not cache.holds(full_file)
+    assert np.allclose(mm.stiff(fname=full_file).asarray().toarray(), 2 * kmat.asarray().toarray())
+    assert cache.uploads == 2
+
+    # a copy rewritten by MAPDL has priority over the local file once discarded
+    write_full(
+        os.path.join(mm._mapdl.directory, os.path.basename(full_file)), 3 * k, m, rhs, nodes, labels
+    )
+    cache.discard(full_file)
+    assert np.allclose(
+        mm.stiff(fname=full_file, asarray=True).toarray(), 3 * kmat.asarray().toarray()
+    )
+    assert np.allclose(mm.stiff(fname=full_file).asarray().toarray(), 3 * kmat.asarray().toarray())
+    assert cache.uploads == 2
+    assert not cache.holds(full_file)
+    assert len(cache) == 0
+    mm._mapdl.exit()
+
+
+def test_load_full(full_file, model, monkeypatch):
+    k, m, rhs, nodes, labels = model
+    free = np.array(labels) > 0
+    mm = pymath.AnsMath(backend="local")
+    # the file is only in the working directory of a remote instance
+    monkeypatch.setattr(mm._mapdl, "_local", False)
+    shutil.copy(full_file, mm._mapdl.directory)
+
+    # including the listings of the MAPDL working directory
+    with mm.expect_round_trips(max=4):
+        full = mm.load_full("model.full", items=("stiff", "RHS"))
+    assert isinstance(full, FullData)
+    assert full.mass is None
+    assert np.allclose(full.stiff.asarray().toarray(), k.toarray()[free][:, free])
+    assert np.allclose(full.rhs.asarray(), rhs[free])
+
+    arrays = mm.load_full("model.full", items=("STIFF", "MASS", "RHS"), asarray=True)
+    assert np.allclose(arrays.stiff.toarray(), full.stiff.asarray().toarray())
+    assert np.allclose(arrays.rhs, rhs[free])
+    assert mm._mapdl._objects.keys() == {full.stiff.id, full.rhs.id}
+
+    # the imported objects are deleted when a download fails
+    def fail(self):
+        raise RuntimeError("Download failed")
+
+    monkeypatch.setattr(pymath.AnsVec, "asarray", fail)
+    with pytest.raises(RuntimeError, match="Download failed"):
+        mm.load_full("model.full", items=("STIFF", "RHS"), asarray=True)
+    assert mm._mapdl._objects.keys() == {full.stiff.id, full.rhs.id}
+    monkeypatch.undo()
+    monkeypatch.setattr(mm._mapdl, "_local", False)
+
+    # a file accessible from Python is read without MAPDL, once MAPDL has
+    # been checked for a file of the same name
+    fname = shutil.copy(full_file, os.path.join(os.path.dirname(full_file), "local.full"))
+    with mm.expect_round_trips(max=1):
+        arrays = mm.load_full(fname, items=("STIFF", "MASS", "RHS"), asarray=True)
+    assert np.allclose(arrays.mass.toarray(), m.toarray()[free][:, free])
+
+    with pytest.raises(ValueError, match="Invalid FULL file items"):
+        mm.load_full(full_file, items=("STIFF", "DUMMY"))
+    with pytest.raises(ValueError, match="unique"):
+        mm.load_full(full_file, items=("STIFF", "stiff"))
+    mm._mapdl.exit()
@@ -0,0 +1,252 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the instrumentation of the calls made by AnsMath."""
+
+import json
+import logging
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from ansys.math.core.instrument import BUCKETS, JsonExporter, LogExporter, RoundTripError
+import ansys.math.core.math as pymath
+from ansys.math.core.pool import transfer
+from ansys.math.core.server import StandInServer
+
+
+@pytest.fixture(scope="module")
+def mm():
+    mm = pymath.AnsMath(backend="local")
+    yield mm
+    mm._mapdl.exit()
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StandInServer() as server:
+        yield server
+
+
+def test_track(mm):
+    with mm.track() as stats:
+        v1 = mm.ones(10)
+        v1.dot(v1)
+    assert stats.calls["run"].count >= 2
+    assert stats.calls["scalar_param"].count == 1
+    assert stats.round_trips == sum(each.count for each in stats.calls.values())
+    assert stats.elapsed > 0
+    assert "round trips" in stats.summary()
+
+
+def test_disabled(mm):
+    with mm.track():
+        pass
+    assert "run" not in vars(mm._mapdl)
+    assert "_vec_data" not in vars(mm._mapdl)
+    assert "upload" not in vars(mm._mapdl)
+    assert type(mm._mapdl._stub).__name__ == "_LocalStub"
+
+
+def test_nested(mm):
+    with mm.track() as outer:
+        mm.ones(10)
+        with mm.track() as inner:
+            mm.ones(10)
+    assert outer.round_trips == 2 * inner.round_trips
+    assert "run" not in vars(mm._mapdl)
+
+
+def test_bytes_local(mm):
+    with mm.track() as stats:
+        vec = mm.set_vec(np.ones(100))
+        vec.asarray()
+    assert stats.bytes_up == stats.calls["SetVecData"].bytes_up == 800
+    assert stats.bytes_down == 800
+
+
+def test_bytes_files(mm, tmpdir, monkeypatch):
+    path = str(tmpdir.join("model.full"))
+    with open(path, "wb") as fid:
+        fid.write(bytes(5000))
+    # the local backend has no download, emulated from its working directory
+    monkeypatch.setattr(
+        mm._mapdl,
+        "download",
+        lambda files: [os.path.join(mm._mapdl.directory, files)],
+        raising=False,
+    )
+
+    with mm.track() as stats:
+        mm._mapdl.upload(path)
+        assert "model.full" in mm._mapdl.list_files()
+        mm._mapdl.download("model.full")
+    assert stats.calls["upload"].bytes_up == stats.bytes_up == 5000
+    assert stats.calls["download"].bytes_down == stats.bytes_down == 5000
+    assert stats.round_trips == 3
+    assert stats.transfers == 2
+
+
+def test_round_trips_server(server):
+    mm = pymath.AnsMath(server.connect())
+    server.reset_stats()
+    with mm.track() as stats:
+        vec = mm.set_vec(np.arange(1000.0))
+        vec.asarray()
+        vec.norm()
+    assert stats.round_trips == sum(server.calls.values())
+    assert stats.bytes_up == server.nbytes["received"]
+    assert stats.bytes_down == server.nbytes["sent"]
+    # the data info and the stream are counted within _vec_data
+    assert stats.calls["_vec_data"].count == 1
+    assert stats.calls["GetVecData"].count == 1
+    mm._mapdl.exit()
+
+
+def test_track_transfer(server):
+    # the streams of a transfer are consumed by a gRPC thread
+    with StandInServer() as other:
+        source = pymath.AnsMath(server.connect())
+        target = pymath.AnsMath(other.connect())
+        vec = source.ones(100)
+        with source.track() as stats, source.profile() as profile:
+            copy = transfer(vec, target)
+        assert np.allclose(copy.asarray(), 1)
+        assert stats.calls["GetVecData"].count == 1
+        assert stats.bytes_down == 800
+        (event,) = [event for event in profile.events() if event.command == "GetVecData"]
+        assert event.site.startswith(__file__)
+        assert event.thread == threading.current_thread().name
+        source._mapdl.exit()
+        target._mapdl.exit()
+
+
+def test_histogram(mm):
+    with mm.track() as stats:
+        for _ in range(10):
+            mm._mapdl.run("/COM")
+    run = stats.calls["run"]
+    assert sum(run.histogram) == run.count == 10
+    assert len(run.histogram) == len(BUCKETS) + 1
+    assert run.percentile(50) <= run.percentile(100)
+    assert run.percentile(100) >= run.mean
+
+
+def test_exporters(mm, tmpdir, caplog):
+    path = str(tmpdir.join("stats.jsonl"))
+    with caplog.at_level(logging.INFO):
+        with mm.track(JsonExporter(path, job="test"), LogExporter()) as stats:
+            mm.ones(10)
+    assert "AnsMath call statistics" in caplog.text
+
+    record = json.loads(open(path).read())
+    assert record["job"] == "test"
+    assert record["round_trips"] == stats.round_trips
+    assert record["calls"]["run"]["count"] == stats.calls["run"].count
+
+    exported = []
+    with mm.track(exported.append) as stats:
+        pass
+    assert exported == [stats]
+
+
+def test_export_on_error(mm):
+    exported = []
+    with pytest.raises(ValueError):
+        with mm.track(exported.append):
+            mm.ones(10)
+            raise ValueError
+    assert exported[0].round_trips > 0
+    assert exported[0].elapsed > 0
+    assert "run" not in vars(mm._mapdl)
+
+
+def test_profile(mm):
+    vec = mm.ones(10)
+    with mm.profile() as profile:
+        for i in range(5):
+            vec[i]
+        vec.asarray()
+    events = profile.events()
+    assert len(events) == len(profile) == profile.count
+    assert all(event.site.startswith(__file__) for event in events)
+    assert {event.method for event in events} == {"AnsVec.__getitem__", "AnsVec.asarray"}
+    assert [event.command for event in events].count("*SET") == 5
+    assert events[-1].nbytes == 80
+    assert [event.start for event in events] == sorted(event.start for event in events)
+
+    report = profile.report(by=("method",))
+    assert report.splitlines()[1].endswith("AnsVec.__getitem__")
+    assert "run" not in vars(mm._mapdl)
+
+
+def test_profile_ring_buffer(mm):
+    with mm.profile(size=8) as profile:
+        for _ in range(20):
+            mm._mapdl.run("/COM")
+    assert profile.count == 20
+    assert len(profile) == 8
+    assert profile.dropped == 12
+    assert len(profile.events()) == 8
+
+
+def test_profile_export(mm, tmpdir):
+    with mm.profile() as profile:
+        mm.ones(10)
+    chrome = str(tmpdir.join("trace.json"))
+    profile.to_chrome_trace(chrome)
+    trace = json.load(open(chrome))["traceEvents"]
+    durations = [event for event in trace if event["ph"] == "X"]
+    assert len(durations) == len(profile)
+    assert durations[0]["cat"] == "AnsMath.ones"
+
+    speedscope = str(tmpdir.join("profile.speedscope.json"))
+    profile.to_speedscope(speedscope)
+    data = json.load(open(speedscope))
+    events = data["profiles"][0]["events"]
+    assert len(events) == 6 * len(profile)
+    names = [frame["name"] for frame in data["shared"]["frames"]]
+    assert "AnsMath.ones" in names
+    assert "*VEC" in names
+
+
+def test_expect_round_trips(mm):
+    vec = mm.ones(10)
+    with mm.expect_round_trips(max=2, transfers=1) as stats:
+        vec.asarray()
+    assert stats.transfers == 1
+
+    with pytest.raises(RoundTripError, match="at most 1 round trips"):
+        with mm.expect_round_trips(max=1):
+            for i in range(3):
+                vec[i]
+
+    with pytest.raises(RoundTripError, match="at most 0 transfers"):
+        with mm.expect_round_trips(transfers=0):
+            vec.asarray()
+
+    # errors raised within the block are not hidden
+    with pytest.raises(ZeroDivisionError):
+        with mm.expect_round_trips(max=0):
+            vec[0] / 0
@@ -0,0 +1,112 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the AnsMath iterative solvers."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import ansys.math.core.math as pymath
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def mm(mapdl):
+    mm = pymath.AnsMath(mapdl)
+    return mm
+
+
+def laplacian(dim, shift=0.0):
+    mat = sparse.diags([-1.0, 4.0, -1.0], [-1, 0, 1], shape=(dim, dim))
+    return (mat + sparse.diags(np.linspace(0, 10, dim) - shift)).tocsr()
+
+
+@pytest.mark.parametrize("method", ["CG", "MINRES", "GMRES"])
+@pytest.mark.parametrize("precond", ["jacobi", None])
+def test_iterative_solve(mm, method, precond):
+    dim = 200
+    mat = laplacian(dim)
+    rhs = np.random.random(dim)
+
+    solver = mm.iterative_solver(mm.matrix(mat), method=method, precond=precond, tol=1e-10)
+    x = solver.solve(mm.set_vec(rhs))
+
+    assert solver.converged
+    assert solver.iterations == len(solver.history)
+    assert solver.history[-1] <= 1e-10
+    assert np.allclose(mat @ x.asarray(), rhs)
+    solver.free()
+
+
+def test_minres_indefinite(mm):
+    dim = 200
+    mat = laplacian(dim, shift=3.0)
+    rhs = np.random.random(dim)
+
+    solver = mm.iterative_solver(mm.matrix(mat), method="MINRES", tol=1e-10)
+    x = solver.solve(mm.set_vec(rhs))
+    assert solver.converged
+    assert np.allclose(mat @ x.asarray(), rhs)
+    solver.free()
+
+
+def test_gmres_unsymmetric_initial_guess(mm):
+    dim = 200
+    mat = (laplacian(dim) + sparse.diags([0.5], [2], shape=(dim, dim))).tocsr()
+    rhs = np.random.random(dim)
+
+    solver = mm.iterative_solver(mm.matrix(mat), method="GMRES", restart=10, tol=1e-10)
+    x0 = mm.ones(dim)
+    x = solver.solve(mm.set_vec(rhs), x0)
+    assert x is x0
+    assert solver.converged
+    assert np.allclose(mat @ x.asarray(), rhs)
+    solver.free()
+
+
+def test_jacobi_dense(mm):
+    dim = 50
+    mat = laplacian(dim).toarray()
+    rhs = np.random.random(dim)
+
+    # only the diagonal of a dense matrix is retrieved
+    amat = mm.matrix(mat)
+    with mm.track() as stats:
+        solver = mm.iterative_solver(amat, tol=1e-10)
+    assert stats.bytes_down <= 8 * dim
+    dinv = solver._dinv
+    assert np.allclose(dinv.asarray(), 1 / np.diag(mat))
+
+    x = solver.solve(mm.set_vec(rhs))
+    assert solver.converged
+    assert np.allclose(mat @ x.asarray(), rhs)
+    solver.free()
+    assert dinv.id.upper() not in mm._parm
+
+    # a supplied preconditioner is not deleted
+    precond = mm.set_vec(1 / np.diag(mat))
+    solver = mm.iterative_solver(amat, precond=precond)
+    solver.free()
+    assert precond.id.upper() in mm._parm
@@ -0,0 +1,153 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the local backend, which runs without MAPDL."""
+
+from ansys.mapdl.core.errors import MapdlRuntimeError
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.linalg import eigh
+
+import ansys.math.core.math as pymath
+
+
+@pytest.fixture(scope="module")
+def mm():
+    mm = pymath.AnsMath(backend="local", seed=0)
+    yield mm
+    mm._mapdl.exit()
+
+
+@pytest.fixture()
+def system(mm, spring_chain):
+    k, m = spring_chain(50)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(m, triu=True)
+    return k, m, kk, mk
+
+
+def test_vec(mm):
+    v1 = mm.ones(10)
+    v2 = mm.rand(10)
+    assert v1.dot(v1) == 10
+    assert np.allclose((v1 + v2).asarray(), 1 + v2.asarray())
+    assert np.isclose(mm.norm(v2), np.linalg.norm(v2.asarray()))
+
+
+def test_handle_semantics(mm):
+    vec = mm.set_vec(np.arange(5.0))
+    same = pymath.AnsVec(vec.id, mm._mapdl)
+    vec *= 2
+    assert np.allclose(same.asarray(), 2 * np.arange(5.0))
+
+    copy = vec.copy()
+    copy.zeros()
+    assert np.allclose(vec.asarray(), 2 * np.arange(5.0))
+
+
+def test_dense_mat(mm):
+    array = np.random.random((6, 4))
+    mat = mm.matrix(array)
+    vec = np.random.random(4)
+    assert mat.shape == (6, 4)
+    assert np.allclose(mat.dot(mm.set_vec(vec)).asarray(), array @ vec)
+    assert np.allclose(mat.T.asarray(), array.T)
+
+
+def test_sparse_mat(mm, system):
+    k, m, kk, mk = system
+    assert kk.sym()
+    assert np.allclose(kk.asarray().toarray(), sparse.triu(k).toarray())
+
+
+def test_solve(mm, system):
+    k, m, kk, mk = system
+    b = np.random.random(k.shape[0])
+    x = mm.solve(kk, mm.set_vec(b))
+    assert np.allclose(k @ x.asarray(), b)
+
+    solver = mm.factorize(kk, inplace=False)
+    assert mm.factorize(kk, inplace=False) is solver
+    x = solver.solve(mm.set_vec(b))
+    assert np.allclose(k @ x.asarray(), b)
+
+    # a NumPy right-hand side is uploaded to a temporary freed by the solve
+    names = set(mm._parm)
+    x = solver.solve(b)
+    assert np.allclose(k @ x.asarray(), b)
+    assert set(mm._parm) - names == {x.id.upper()}
+
+
+def test_modal(mm, system):
+    k, m, kk, mk = system
+    freqs, phi = mm.modal(kk, mk, nev=5)
+    ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+    assert np.allclose(freqs, ref[:5])
+    assert phi.shape == (k.shape[0], 5)
+    assert np.allclose(mm.eig_residuals(kk, mk, freqs, phi), 0, atol=1e-8)
+
+
+def test_modal_sparse(mm, spring_chain, monkeypatch):
+    from scipy.sparse import linalg as splinalg
+
+    k, m = spring_chain(300)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(m, triu=True)
+    ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+
+    # sparse matrices are solved with shift-invert iterations
+    calls = []
+    eigsh = splinalg.eigsh
+    monkeypatch.setattr(
+        splinalg, "eigsh", lambda *args, **kwargs: calls.append(kwargs) or eigsh(*args, **kwargs)
+    )
+    freqs, phi = mm.modal(kk, mk, nev=5)
+    assert np.allclose(freqs, ref[:5])
+    assert calls[0]["sigma"] < 0
+
+    fmin, fmax = ref[20] - 1, ref[40] + 1
+    freqs, phi = mm.modal(kk, mk, nev=8, fmin=fmin, fmax=fmax)
+    assert np.allclose(freqs, ref[20:28])
+    assert calls[-1]["sigma"] == pytest.approx((2 * np.pi * fmin) ** 2)
+    assert np.allclose(mm.eig_residuals(kk, mk, freqs, phi), 0, atol=1e-8)
+
+    # the window holds fewer modes than requested
+    freqs, phi = mm.modal(kk, mk, nev=30, fmin=fmin, fmax=fmax)
+    assert np.allclose(freqs, ref[20:41])
+
+
+def test_free(mm):
+    vec = mm.ones(3)
+    assert vec.id in mm._status
+    mm.free(vec)
+    assert vec.id not in mm._status
+
+
+def test_unsupported_command(mm):
+    with pytest.raises(MapdlRuntimeError, match="not supported by the local backend"):
+        mm._mapdl.run("BLOCK,0,1,0,1,0,1")
+
+
+def test_invalid_backend():
+    with pytest.raises(ValueError, match="Invalid backend"):
+        pymath.AnsMath(backend="cloud")
@@ -353,6 +353,21 @@ def test_load_stiff_mass_as_array(mm, cube_solve):
     assert all([each > 0 for each in m.shape])
 
 
+def test_load_full(mm, cube_solve):
+    full = mm.load_full(items=("STIFF", "MASS", "RHS", "BACK"))
+    assert full.damp is None
+    assert full.stiff.shape == full.mass.shape == mm.stiff().shape
+    assert full.rhs.size == full.back.size == full.stiff.shape[0]
+    assert np.allclose(full.back.asarray(), mm.get_vec(mat_id="BACK", asarray=True))
+
+    arrays = mm.load_full(items=("STIFF", "BACK"), asarray=True)
+    assert sparse.issparse(arrays.stiff)
+    assert arrays.back.dtype == np.int32
+
+    with pytest.raises(ValueError, match="Invalid FULL file items"):
+        mm.load_full(items=("STIFF", "DUMMY"))
+
+
 def test_stiff_mass_name(mm, cube_solve):
     kname = pymath.id_generator()
     mname = pymath.id_generator()
@@ -533,6 +548,94 @@ def test_solve_py(mapdl, mm, cube_solve):
     assert np.allclose(w_n, eigval, atol=0.1)
 
 
+def test_modal(mapdl, mm, cube_solve):
+    mapdl.post1()
+    resp = mapdl.set("LIST")
+    w_n = np.array(re.findall(r"\s\d*\.\d*\s", resp), np.float32)
+
+    k = mm.stiff()
+    m = mm.mass()
+    freqs, phi = mm.modal(k, m, nev=w_n.size, fmin=1)
+    assert isinstance(freqs, np.ndarray)
+    assert np.allclose(w_n, freqs, atol=0.1)
+    assert phi.shape == (k.nrow, w_n.size)
+
+
+def test_modal_window(mm, spring_chain):
+    from scipy.linalg import eigh
+
+    dim = 50
+    k, m = spring_chain(dim)
+    freqs_ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mm_ = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    freqs, phi = mm.modal(kk, mm_, nev=5)
+    assert np.allclose(freqs, freqs_ref[:5])
+    assert phi.shape == (dim, 5)
+
+    fmin, fmax = freqs_ref[10] - 1, freqs_ref[13] + 1
+    freqs, phi = mm.modal(kk, mm_, nev=20, fmin=fmin, fmax=fmax)
+    assert np.allclose(freqs, freqs_ref[10:14])
+    assert phi.shape[1] == freqs.size
+
+
+def test_modal_guess(mm, spring_chain):
+    dim = 50
+    k, m = spring_chain(dim)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+    freqs, phi = mm.modal(kk, mk, nev=5)
+
+    # scaling the stiffness matrix does not change the modes
+    k2 = mm.matrix(sparse.triu(2 * k).tocsr(), triu=True)
+    freqs2, phi2 = mm.modal(k2, mk, nev=5, guess=phi, tol=1e-8)
+    assert np.allclose(freqs2, np.sqrt(2) * freqs)
+    assert phi2.shape == (dim, 5)
+
+    with pytest.raises(ValueError, match="Damped"):
+        mm.modal(k2, mk, nev=5, c=mk, guess=phi)
+
+
+def test_modal_guess_window(mm, spring_chain):
+    from scipy.linalg import eigh
+
+    dim = 50
+    k, m = spring_chain(dim)
+    freqs_ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+    fmin, fmax = freqs_ref[10] - 1, freqs_ref[13] + 1
+    freqs, phi = mm.modal(kk, mk, nev=20, fmin=fmin, fmax=fmax)
+
+    # a guess spanning part of the window does not skip the full solve
+    guess = mm.matrix(np.asfortranarray(phi.asarray()[:, :2]))
+    freqs2, phi2 = mm.modal(kk, mk, nev=20, fmin=fmin, fmax=fmax, guess=guess)
+    assert np.allclose(freqs2, freqs_ref[10:14])
+    assert phi2.shape == (dim, 4)
+
+
+def test_eig_residuals(mm, spring_chain):
+    k, m = spring_chain(50)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+    freqs, phi = mm.modal(kk, mk, nev=10)
+
+    residuals = mm.eig_residuals(kk, mk, freqs, phi)
+    assert isinstance(residuals, np.ndarray)
+    assert residuals.shape == (10,)
+    assert residuals.max() < 1e-8
+
+    # wrong frequencies give large residuals
+    residuals = mm.eig_residuals(kk, mk, freqs * 1.1, phi)
+    phi_py = phi.asarray()
+    lam = (2 * np.pi * freqs * 1.1) ** 2
+    expected = np.linalg.norm(k @ phi_py - (m @ phi_py) * lam, axis=0) / np.linalg.norm(
+        k @ phi_py, axis=0
+    )
+    assert np.allclose(residuals, expected)
+
+
 def test_copy2(mm):
     dim = 1000
     m2 = mm.rand(dim, dim)
@@ -819,6 +922,171 @@ def test_factorize_inplace_arg(mm):
     assert np.allclose(m2.asarray(), m3.asarray())
 
 
+def test_factorize_cache(mm):
+    dim = 100
+    m2 = mm.rand(dim, dim)
+    solver = mm.factorize(m2, inplace=False)
+    assert mm.factorize(m2, inplace=False) is solver
+
+    # modifying the matrix invalidates the cached factorization
+    m2 *= 2
+    assert mm.factorize(m2, inplace=False) is not solver
+    assert mm.factorize(m2, cache=False) is not mm.factorize(m2)
+
+
+def test_factorize_cache_mutations(mm):
+    dim = 20
+    a = mm.matrix(np.random.random((dim, dim)) + dim * np.eye(dim))
+    b = mm.ones(dim)
+    solver = mm.factorize(a, inplace=False)
+
+    # a solver overwriting the matrix is not shared with an out of place one
+    assert mm.factorize(a, inplace=True) is not solver
+    a = mm.matrix(np.random.random((dim, dim)) + dim * np.eye(dim))
+    solver = mm.factorize(a, inplace=False)
+
+    pymath.rand(a)
+    a_py = a.asarray()
+    assert mm.factorize(a, inplace=False) is not solver
+    solver = mm.factorize(a, inplace=False)
+    assert np.allclose(solver.solve(b).asarray(), np.linalg.solve(a_py, np.ones(dim)))
+
+    # modifying a column modifies the matrix
+    col = a[0]
+    col += b
+    assert mm.factorize(a, inplace=False) is not solver
+
+    # a solve into the matrix modifies it
+    solver = mm.factorize(a, inplace=False)
+    other = mm.factorize(mm.matrix(np.eye(dim)), inplace=False)
+    other.solve(mm.matrix(np.random.random((dim, dim))), a)
+    assert mm.factorize(a, inplace=False) is not solver
+
+    x = mm.zeros(dim)
+    revision = x._revision
+    mm.iterative_solver(a, method="gmres").solve(b, x)
+    assert x._revision > revision
+
+
+def test_factorize_cache_eviction(mm):
+    mm.solver_cache.clear()
+    mats = [mm.rand(10, 10) for _ in range(mm.solver_cache.maxsize + 1)]
+    solvers = [mm.factorize(mat, inplace=False) for mat in mats]
+
+    assert len(mm.solver_cache) == mm.solver_cache.maxsize
+    assert solvers[0].id.upper() not in mm._parm
+    assert solvers[-1].id.upper() in mm._parm
+
+    mm.free(mats[-1])
+    assert solvers[-1].id.upper() not in mm._parm
+
+
+def test_solve_cached(mm):
+    dim = 100
+    m2 = mm.rand(dim, dim)
+    m3 = m2.copy()
+    b = mm.ones(dim)
+
+    x1 = pymath.solve(m2, b)
+    x2 = mm.solve(m2, b)
+    assert np.allclose(x1, x2)
+    assert np.allclose(x2, np.linalg.solve(m3.asarray(), b.asarray()))
+
+
+def test_solve_multiple_rhs(mm):
+    dim, nrhs = 100, 5
+    a = np.random.random((dim, dim)) + dim * np.eye(dim)
+    rhs = np.random.random((dim, nrhs))
+    solver = mm.factorize(mm.matrix(a))
+
+    x = solver.solve(mm.matrix(rhs))
+    assert isinstance(x, pymath.AnsDenseMat)
+    assert np.allclose(x.asarray(), np.linalg.solve(a, rhs))
+
+    names = set(mm._parm)
+    x = solver.solve(rhs)
+    assert x.shape == (dim, nrhs)
+    assert np.allclose(x.asarray(), np.linalg.solve(a, rhs))
+    # the uploaded right-hand sides are freed
+    assert set(mm._parm) - names == {x.id.upper()}
+
+    x = solver.solve(rhs[:, 0])
+    assert isinstance(x, pymath.AnsVec)
+    assert np.allclose(x.asarray(), np.linalg.solve(a, rhs[:, 0]))
+
+
+def test_factorize_mixed_precision(mm):
+    dim = 100
+    a = np.random.random((dim, dim)) + dim * np.eye(dim)
+    b = np.random.random(dim)
+    mat = mm.matrix(a)
+
+    solver = mm.factorize(mat, precision="mixed", cache=False)
+    assert solver.precision == "mixed"
+    x = solver.solve(b)
+    assert solver.converged
+    assert not solver.fallback
+    assert solver.iterations == len(solver.history) - 1
+    assert solver.history[-1] <= 1e-12
+    assert np.allclose(x.asarray(), np.linalg.solve(a, b))
+    # the input matrix is not factorized in place
+    assert np.allclose(mat.asarray(), a)
+
+    with pytest.raises(ValueError, match="Invalid precision"):
+        mm.factorize(mat, precision="half", cache=False)
+
+
+def test_factorize_mixed_precision_fallback(mm):
+    from scipy.linalg import hilbert
+
+    a = hilbert(10)
+    b = np.ones(10)
+    solver = mm.factorize(mm.matrix(a), precision="mixed", cache=False)
+    x = solver.solve(b)
+    assert not solver.converged
+    assert solver.fallback
+    assert np.allclose(a @ x.asarray(), b)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"memory": "incore"},
+        {"memory": "outofcore", "reorder": "seqorder"},
+        {"reorder": "parorder"},
+        {"algo": "DSS", "memory": "incore"},
+    ],
+)
+def test_factorize_options(mm, options):
+    dim = 100
+    a = sparse.random(dim, dim, density=0.05, random_state=0) + dim * sparse.eye(dim)
+    a = (a + a.T).tocsr()
+    b = np.random.random(dim)
+
+    solver = mm.factorize(mm.matrix(sparse.triu(a).tocsr(), triu=True), cache=False, **options)
+    assert solver.symmetric
+    x = solver.solve(b)
+    assert np.allclose(x.asarray(), sparse.linalg.spsolve(a.tocsc(), b))
+
+
+def test_factorize_invalid_options(mm):
+    mat = mm.rand(10, 10)
+    with pytest.raises(ValueError, match="Invalid memory mode"):
+        mm.factorize(mat, memory="outofcore", cache=False)
+    with pytest.raises(ValueError, match="Invalid reordering"):
+        mm.factorize(mm.matrix(sparse.eye(10).tocsr()), reorder="metis", cache=False)
+
+
+def test_sym_cached(mm):
+    mat = mm.matrix(sparse.eye(10).tocsr(), triu=True)
+    assert mat.sym()
+    assert mat._sym == (mat._revision, True)
+
+    mat *= 2
+    assert mat._sym[0] != mat._revision
+    assert mat.sym()
+
+
 def test_mult(mapdl, mm):
     rand_ = np.random.rand(100, 100)
 
@@ -0,0 +1,98 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the automatic placement of the operations."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import ansys.math.core.math as pymath
+from ansys.math.core.placement import Placement
+
+
+@pytest.fixture(scope="module")
+def mm():
+    mm = pymath.AnsMath(backend="local")
+    yield mm
+    mm._mapdl.exit()
+
+
+@pytest.fixture()
+def placement(mm):
+    return Placement(mm, latency=1e-3, bandwidth=1e8, local_rate=1e9)
+
+
+def test_measure(mm):
+    placement = Placement(mm)
+    assert placement.latency > 0
+    assert placement.bandwidth > 0
+    assert placement.local_rate > 0
+    assert placement.server_rate == placement.local_rate
+
+
+def test_small_operands_stay_local(placement):
+    mat = np.random.random((10, 10))
+    vec = np.random.random(10)
+    result = placement.dot(mat, vec)
+    assert result.location == "local"
+    assert np.allclose(result.asarray(), mat @ vec)
+    assert placement.decisions[-1].location == "local"
+    assert placement.decisions[-1].transfers == []
+
+
+def test_large_server_operand(mm, placement):
+    mat = placement.array(mm.rand(500, 500))
+    vec = placement.array(np.random.random(500))
+    result = placement.dot(mat, vec)
+
+    decision = placement.decisions[-1]
+    assert decision.location == "server"
+    assert decision.server_cost < decision.local_cost
+    assert decision.transfers == [("upload", vec.nbytes)]
+    assert result.location == "server"
+    assert vec.location == "both"
+    assert np.allclose(result.asarray(), mat.asarray() @ vec.asarray())
+
+    # migrated operands are not transferred again
+    placement.dot(mat, vec)
+    assert placement.decisions[-1].transfers == []
+
+
+def test_row_vector_product(mm, placement):
+    mat = placement.array(mm.rand(300, 200))
+    vec = np.random.random(300)
+    result = placement.dot(vec, mat)
+    assert result.shape == (200,)
+    assert np.allclose(result.asarray(), vec @ mat.asarray())
+
+
+def test_add_norm(mm, placement):
+    a = sparse.random(30, 30, density=0.1, format="csr")
+    remote = placement.array(mm.matrix(a))
+    assert remote.sparse
+    total = placement.add(remote, a)
+    assert np.allclose(total.asarray().toarray(), 2 * a.toarray())
+    assert np.isclose(placement.norm(total), 2 * sparse.linalg.norm(a))
+
+    with pytest.raises(ValueError, match="do not match"):
+        placement.add(np.ones(3), np.ones(4))
@@ -0,0 +1,103 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the pool of AnsMath instances."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from ansys.math.core.pool import AnsMathPool, transfer
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def pool(mapdl):
+    pool = AnsMathPool(mapdl=[mapdl])
+    yield pool
+    pool.close()
+
+
+def test_pool_map(pool):
+    def job(mm, dim, scale):
+        vec = mm.ones(dim)
+        vec *= scale
+        return vec
+
+    results = pool.map(job, [3, 4, 5], [1.0, 2.0, 3.0])
+    for dim, scale, result in zip([3, 4, 5], [1.0, 2.0, 3.0], results):
+        assert isinstance(result, np.ndarray)
+        assert np.allclose(result, np.full(dim, scale))
+
+    assert pool.jobs.sum() >= 3
+    assert 0 < pool.utilization[0] <= 1
+
+
+def test_pool_placement(pool):
+    vec = pool[0].ones(10)
+    future = pool.submit(lambda mm, v: mm is pool[0] and mm.norm(v), vec)
+    assert np.isclose(future.result(), np.sqrt(10))
+    assert pool.instance_of(vec) == 0
+
+
+def test_pool_reset_stats(pool):
+    pool.reset_stats()
+    assert pool.jobs.tolist() == [0]
+    assert pool.busy_time.tolist() == [0.0]
+
+
+def test_pool_invalid():
+    with pytest.raises(ValueError, match="must be provided"):
+        AnsMathPool()
+
+
+@pytest.mark.parametrize("kind", ["vec", "int", "dense", "sparse", "sym"])
+def test_transfer(pool, kind):
+    mm = pool[0]
+    a = sparse.random(50, 50, density=0.1, format="csr") + sparse.eye(50)
+    if kind == "vec":
+        obj = mm.set_vec(np.random.random(30) + 1j)
+    elif kind == "int":
+        obj = mm.set_vec(np.arange(30, dtype=np.int32))
+    elif kind == "dense":
+        obj = mm.rand(20, 7)
+    elif kind == "sparse":
+        obj = mm.matrix(a.tocsr())
+    else:
+        obj = mm.matrix(sparse.triu(a + a.T).tocsr(), triu=True)
+
+    # a copy within the same instance streams the data in the same way
+    copy = transfer(obj, mm, name="TRANSFERRED")
+    assert copy.id == "TRANSFERRED"
+    assert type(copy) is type(obj)
+    expected, actual = obj.asarray(), copy.asarray()
+    if sparse.issparse(expected):
+        assert copy.sym() == (kind == "sym")
+        # both index vectors are sent as 64-bit integers, as AnsMath.matrix does
+        for suffix in ("_IND", "_PTR"):
+            assert mm._mapdl._vec_data(copy.id + suffix).dtype == np.int64
+        expected, actual = expected.toarray(), actual.toarray()
+    assert actual.dtype == expected.dtype
+    assert np.array_equal(actual, expected)
+    mm.free(copy)
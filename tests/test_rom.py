@@ -0,0 +1,127 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the reduced-order modeling tools."""
+
+import numpy as np
+import pytest
+from scipy import linalg, signal, sparse
+
+import ansys.math.core.math as pymath
+from ansys.math.core.rom import ModalSuperposition, krylov_basis, project, reduce
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def mm(mapdl):
+    mm = pymath.AnsMath(mapdl)
+    return mm
+
+
+@pytest.fixture()
+def system(mm, spring_chain):
+    dim = 60
+    k, m = spring_chain(dim)
+    k = k.tolil()
+    k[0, 0] = 3e6
+    k = k.tocsr()
+    f = np.random.random(dim)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+    return k, m, f, kk, mk, mm.set_vec(f)
+
+
+def test_project(mm, system):
+    k, m, f, kk, mk, fk = system
+    basis = mm.rand(k.shape[0], 5)
+    v = basis.asarray()
+
+    kr, mr, fr = project(basis, kk, mk, fk)
+    assert np.allclose(kr, v.T @ k @ v)
+    assert np.allclose(mr, v.T @ m @ v)
+    assert np.allclose(fr, v.T @ f)
+
+
+@pytest.mark.parametrize("shift", [0.0, 300.0])
+def test_krylov_basis(mm, system, shift):
+    k, m, f, kk, mk, fk = system
+    basis = krylov_basis(kk, mk, fk, 8, shift=shift)
+    v = basis.asarray()
+    assert v.shape == (k.shape[0], 8)
+    assert np.allclose(v.T @ v, np.eye(8))
+
+    rom = reduce(basis, kk, mk, f=fk)
+    assert rom.size == 8
+    w2 = (2 * np.pi * (shift + 5)) ** 2
+    ref = linalg.solve((k - w2 * m).toarray(), f)
+    assert np.allclose(v @ np.linalg.solve(rom.k - w2 * rom.m, rom.f), ref)
+
+
+def test_krylov_basis_zero_load(mm, system):
+    k, m, f, kk, mk, fk = system
+    with pytest.raises(ValueError, match="must not be zero"):
+        krylov_basis(kk, mk, mm.zeros(k.shape[0]), 4)
+
+
+@pytest.mark.parametrize("remote", [True, False])
+def test_modal_superposition(mm, system, remote):
+    k, m, f, kk, mk, fk = system
+    k, m = k.toarray(), m.toarray()
+    dim = k.shape[0]
+    lam, v = linalg.eigh(k, m)
+    freqs = np.sqrt(lam) / (2 * np.pi)
+    damping = 0.03
+    dofs = [0, 5, dim - 1]
+
+    if remote:
+        msup = ModalSuperposition(freqs, mm.matrix(v), fk, dofs=dofs, damping=damping)
+    else:
+        msup = ModalSuperposition(freqs, v, f, dofs=dofs, damping=damping)
+
+    # equivalent physical damping matrix
+    c = m @ v @ np.diag(4 * np.pi * damping * freqs) @ v.T @ m
+    excitation = np.linspace(1, 3000, 40)
+    ref = [
+        linalg.solve(k - (2 * np.pi * fr) ** 2 * m + 2j * np.pi * fr * c, f)[dofs]
+        for fr in excitation
+    ]
+    assert np.allclose(msup.frf(excitation, chunk=7), ref)
+
+    times = np.linspace(0, 0.05, 401)
+    amplitude = 1 + np.sin(300 * times)
+    a = np.block([[np.zeros((dim, dim)), np.eye(dim)], [-linalg.solve(m, k), -linalg.solve(m, c)]])
+    b = np.concatenate([np.zeros(dim), linalg.solve(m, f)])[:, np.newaxis]
+    sel = np.eye(2 * dim)[dofs]
+    _, ref, _ = signal.lsim((a, b, sel, np.zeros((len(dofs), 1))), amplitude, times)
+    response = msup.transient(times, amplitude, chunk=100)
+    assert np.allclose(response, ref, atol=1e-10 * np.abs(ref).max())
+
+
+def test_modal_superposition_invalid_times(mm, system):
+    k, m, f, kk, mk, fk = system
+    msup = ModalSuperposition(np.ones(2), np.eye(k.shape[0])[:, :2], f)
+    with pytest.raises(ValueError, match="uniformly spaced"):
+        msup.transient([0, 1, 3], np.ones(3))
+    with pytest.raises(ValueError, match="each time step"):
+        msup.transient([0, 1, 2], np.ones(2))
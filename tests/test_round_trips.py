@@ -0,0 +1,85 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Check the number of calls made to MAPDL by the AnsMath operations.
+
+The operations run against the stand-in server, so that the changes adding
+calls to MAPDL, such as one call per item, fail without MAPDL.
+"""
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+import ansys.math.core.math as pymath
+from ansys.math.core.server import StandInServer
+
+DIM = 50
+
+
+@pytest.fixture(scope="module")
+def mm():
+    with StandInServer(seed=0) as server:
+        mm = pymath.AnsMath(server.connect())
+        yield mm
+        mm._mapdl.exit()
+
+
+@pytest.fixture(scope="module")
+def objects(mm, spring_chain):
+    k, _ = spring_chain(DIM)
+    return {
+        "k": k,
+        "triu": mm.matrix(sparse.triu(k).tocsr(), triu=True),
+        "sparse": mm.matrix(k),
+        "dense": mm.matrix(np.ones((DIM, 5))),
+        "v": mm.ones(DIM),
+        "w": mm.rand(DIM),
+    }
+
+
+# operation, maximum number of round trips, maximum number of transfers
+BUDGETS = {
+    "ones": (lambda mm, o: mm.ones(DIM), 3, 0),
+    "set_vec": (lambda mm, o: mm.set_vec(np.ones(DIM)), 1, 1),
+    "vec_asarray": (lambda mm, o: o["v"].asarray(), 2, 1),
+    "vec_getitem": (lambda mm, o: o["v"][0], 3, 0),
+    "vec_dot": (lambda mm, o: o["v"].dot(o["w"]), 2, 0),
+    "vec_norm": (lambda mm, o: o["v"].norm(), 2, 0),
+    "vec_add": (lambda mm, o: o["v"] + o["w"], 3, 0),
+    "vec_copy": (lambda mm, o: o["v"].copy(), 2, 0),
+    "axpy": (lambda mm, o: o["w"].axpy(o["v"], 1.0, 1.0), 1, 0),
+    "mat_shape": (lambda mm, o: o["triu"].shape, 2, 0),
+    "sparse_asarray": (lambda mm, o: o["triu"].asarray(), 7, 3),
+    "dense_asarray": (lambda mm, o: o["dense"].asarray(), 2, 1),
+    "set_sparse": (lambda mm, o: mm.matrix(o["k"]), 5, 3),
+    "set_dense": (lambda mm, o: mm.matrix(np.ones((DIM, 5))), 1, 1),
+    "mat_vec": (lambda mm, o: o["sparse"].dot(o["v"]), 3, 0),
+    "factorize_solve": (lambda mm, o: mm.factorize(o["sparse"], cache=False).solve(o["v"]), 5, 0),
+}
+
+
+@pytest.mark.parametrize("name", BUDGETS)
+def test_round_trips(mm, objects, name):
+    func, max_round_trips, max_transfers = BUDGETS[name]
+    with mm.expect_round_trips(max=max_round_trips, transfers=max_transfers):
+        func(mm, objects)
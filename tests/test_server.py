@@ -0,0 +1,100 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the stand-in server, which runs without MAPDL."""
+
+import time
+
+from ansys.mapdl.core.errors import MapdlRuntimeError
+import numpy as np
+import pytest
+from scipy import sparse
+
+import ansys.math.core.math as pymath
+from ansys.math.core.server import StandInServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with StandInServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture(scope="module")
+def mm(server):
+    mm = pymath.AnsMath(server.connect())
+    yield mm
+    mm._mapdl.exit()
+
+
+def test_vec(mm):
+    v1 = mm.ones(10)
+    v2 = mm.rand(10)
+    assert v1.dot(v1) == 10
+    assert np.allclose((v1 + v2).asarray(), 1 + v2.asarray())
+    assert np.isclose(v2.norm(), np.linalg.norm(v2.asarray()))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.complex128, np.int32])
+def test_set_vec(mm, dtype):
+    array = np.arange(1000).astype(dtype)
+    vec = mm.set_vec(array)
+    assert np.allclose(vec.asarray(), array)
+
+
+def test_dense_solve(mm):
+    array = np.random.default_rng(0).random((50, 50)) + 50 * np.eye(50)
+    mat = mm.matrix(array)
+    assert np.allclose(mat.asarray(), array)
+    x = mm.factorize(mat).solve(mm.ones(50))
+    assert np.allclose(array @ x.asarray(), 1)
+
+
+def test_sparse(mm):
+    array = (sparse.random(40, 40, 0.1, random_state=0) + sparse.eye(40)).tocsr()
+    mat = mm.matrix(array)
+    assert np.allclose(mat.asarray().toarray(), array.toarray())
+    assert np.allclose(mat.dot(mm.ones(40)).asarray(), array @ np.ones(40))
+
+
+def test_error(mm):
+    with pytest.raises(MapdlRuntimeError, match="not supported"):
+        mm._mapdl.run("*NOTACOMMAND")
+
+
+def test_counters(server, mm):
+    server.reset_stats()
+    mm.set_vec(np.ones(100)).asarray()
+    assert server.calls["SetVecData"] == 1
+    assert server.calls["GetVecData"] == 1
+    assert server.nbytes["received"] == server.nbytes["sent"] == 800
+
+
+def test_latency():
+    with StandInServer(latency=0.02) as server:
+        mm = pymath.AnsMath(server.connect())
+        server.reset_stats()
+        tstart = time.perf_counter()
+        mm.ones(10)
+        elapsed = time.perf_counter() - tstart
+        assert elapsed >= 0.02 * sum(server.calls.values())
+        mm._mapdl.exit()
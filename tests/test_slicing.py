@@ -0,0 +1,85 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the frequency slicing eigensolver."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.linalg import eigh
+
+import ansys.math.core.math as pymath
+from ansys.math.core.slicing import sliced_modal
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def mm(mapdl):
+    mm = pymath.AnsMath(mapdl)
+    return mm
+
+
+@pytest.fixture(scope="module")
+def km(spring_chain):
+    k, m = spring_chain(60)
+    freqs = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+    return k, m, freqs
+
+
+def test_sliced_modal(mm, km):
+    k, m, freqs_ref = km
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    modes = sliced_modal(kk, mk, 0, freqs_ref[30], [mm], nslices=4)
+    assert len(modes.slices) == 4
+    assert np.allclose(modes.freqs, freqs_ref[:31])
+
+    phi = modes.asarray()
+    assert phi.shape == (k.shape[0], 31)
+    omega2 = (2 * np.pi * modes.freqs) ** 2
+    assert np.allclose(k @ phi, (m @ phi) * omega2, atol=1e-6 * np.abs(k @ phi).max())
+
+    modes.free()
+    assert not modes.slices
+
+
+def test_sliced_modal_boundary(mm, km):
+    k, m, freqs_ref = km
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    # the boundary of the two slices is an eigenfrequency
+    modes = sliced_modal(kk, mk, 0, 2 * freqs_ref[10], [mm], nslices=2)
+    assert np.all(np.diff(modes.freqs) > 0)
+    assert np.allclose(modes.freqs, freqs_ref[freqs_ref <= 2 * freqs_ref[10] * (1 + 1e-12)])
+
+
+def test_sliced_modal_truncated(mm, km):
+    k, m, freqs_ref = km
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    with pytest.warns(UserWarning, match="Increase"):
+        sliced_modal(kk, mk, 0, freqs_ref[30], [mm], nslices=2, nev=5)
@@ -0,0 +1,108 @@
+# Copyright (C) 2023 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Test the parametric sweep drivers."""
+
+import numpy as np
+import pytest
+from scipy import sparse
+from scipy.linalg import eigh
+
+import ansys.math.core.math as pymath
+from ansys.math.core.sweep import HarmonicSweep, ModalSweep
+
+# skip entire module unless HAS_GRPC
+pytestmark = pytest.mark.skip_grpc
+
+
+@pytest.fixture(scope="module")
+def mm(mapdl):
+    mm = pymath.AnsMath(mapdl)
+    return mm
+
+
+def test_modal_sweep(mm, spring_chain):
+    dim = 100
+    base, m = spring_chain(dim)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    sweep = ModalSweep(mm, nev=5, tol=1e-4)
+    for scale in [1.0, 1.0 + 1e-8, 1.5]:
+        # the last sweep point changes the modes
+        k = base * scale + sparse.diags(np.linspace(0, 1e6, dim) * (scale - 1))
+        kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+        freqs, phi = sweep.solve(kk, mk)
+
+        freqs_ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+        assert np.allclose(freqs, freqs_ref[:5])
+        assert phi.shape == (dim, 5)
+
+    assert [point["warm"] for point in sweep.history] == [False, True, False]
+    assert sweep.time_saved == sweep.history[1]["saved"]
+
+
+def test_modal_sweep_window(mm, spring_chain):
+    dim = 50
+    k, m = spring_chain(dim)
+    freqs_ref = np.sqrt(eigh(k.toarray(), m.toarray(), eigvals_only=True)) / (2 * np.pi)
+    kk = mm.matrix(sparse.triu(k).tocsr(), triu=True)
+    mk = mm.matrix(sparse.triu(m).tocsr(), triu=True)
+
+    sweep = ModalSweep(mm, nev=20, fmin=freqs_ref[10] - 1, fmax=freqs_ref[13] + 1, tol=1e-4)
+    for _ in range(2):
+        freqs, phi = sweep.solve(kk, mk)
+        assert np.allclose(freqs, freqs_ref[10:14])
+
+    # the modes of the window found by the full solve are all recovered
+    assert [point["warm"] for point in sweep.history] == [False, True]
+
+
+@pytest.mark.parametrize("dofs", [None, [0, 10, 42]])
+def test_harmonic_sweep(mm, spring_chain, dofs):
+    from scipy.sparse.linalg import spsolve
+
+    dim = 50
+    k, m = spring_chain(dim)
+    c = (1e-5 * k + 10 * m).tocsr()
+    rhs = np.random.random(dim)
+    freqs = np.linspace(1, 2000, 12)
+
+    sweep = HarmonicSweep(
+        mm.matrix(sparse.triu(k).tocsr(), triu=True),
+        mm.matrix(sparse.triu(m).tocsr(), triu=True),
+        mm.set_vec(rhs),
+        c=mm.matrix(sparse.triu(c).tocsr(), triu=True),
+        dofs=dofs,
+        block=5,
+    )
+    response = sweep.solve(freqs)
+
+    expected = np.array(
+        [spsolve((k - (2 * np.pi * f) ** 2 * m + 2j * np.pi * f * c).tocsc(), rhs) for f in freqs]
+    )
+    if dofs is not None:
+        expected = expected[:, dofs]
+    assert response.shape == expected.shape
+    assert np.allclose(response, expected)
+
+    with pytest.raises(ValueError, match="between 0 and 49"):
+        HarmonicSweep(sweep.k, sweep.m, rhs, dofs=[0, dim])